@@ -281,7 +281,8 @@ a = Analysis(
     hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig=hooksconfig,
-    runtime_hooks=[],
+    # Sets the matplotlib environment before main.py runs
+    runtime_hooks=[os.path.join(project_root, 't8_daq_system', '_frozen_preload.py')],
     excludes=[
         'IPython',
         'jupyter',
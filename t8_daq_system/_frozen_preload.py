@@ -0,0 +1,19 @@
+"""
+_frozen_preload.py
+PURPOSE: PyInstaller runtime hook - environment setup for the frozen EXE
+FLOW: Runs before main.py in the bundled interpreter; only sets environment
+      variables, so nothing heavy is imported before the GUI is up
+"""
+
+import os
+import sys
+
+# Matplotlib reads MPLBACKEND when it is first imported, so the plotting
+# modules get TkAgg without an explicit matplotlib.use() at startup
+os.environ['MPLBACKEND'] = 'TkAgg'
+
+# Keep matplotlib's config dir (and its font cache) inside the bundle
+if hasattr(sys, '_MEIPASS'):
+    mpl_data_dir = os.path.join(sys._MEIPASS, 'mpl-data')
+    os.makedirs(mpl_data_dir, exist_ok=True)
+    os.environ['MPLCONFIGDIR'] = mpl_data_dir
@@ -34,6 +34,7 @@ class ProgramExecutor:
         self._running = False
         self._thread = None
         self._lock = threading.Lock()
+        self._stop_event = threading.Event()  # wakes the tick sleep on stop()
 
         self._pid = PIDController()
         self._pid_logger = PIDRunLogger()
@@ -71,6 +72,7 @@ class ProgramExecutor:
             if self._running:
                 return False
             self._running = True
+            self._stop_event.clear()
             self.current_block_index = 0
             self._pid.reset()
             self._last_tick_time = time.time()
@@ -120,6 +122,7 @@ class ProgramExecutor:
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
         self._confirmation_event.set()  # Release any waiting confirmation
         if self._thread:
             self._thread.join(timeout=2.0)
@@ -464,8 +467,10 @@ class ProgramExecutor:
                     'pid_d': pid_terms['d_term'],
                 })
 
-            # Sleep to match TICK_INTERVAL (approx 0.5s or 1.0s)
-            time.sleep(0.5)
+            # Sleep to match TICK_INTERVAL (approx 0.5s or 1.0s); stop()
+            # wakes the wait so the thread exits without finishing the tick
+            if self._stop_event.wait(0.5):
+                break
 
         return False
 
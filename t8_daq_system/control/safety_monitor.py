@@ -98,10 +98,13 @@ class SafetyMonitor:
         self._restart_locked = False
         self._max_tc_reading = 0.0  # Track max TC reading for restart logic
 
+    # The GUI polls the single-attribute getters below every tick. Each is
+    # one reference load (atomic under the GIL), so they read without the
+    # lock rather than queueing behind check_limits() on the acquisition
+    # thread; compound state still goes through _lock.
     @property
     def status(self) -> SafetyStatus:
-        with self._lock:
-            return self._status
+        return self._status
 
     @property
     def is_safe(self) -> bool:
@@ -109,8 +112,7 @@ class SafetyMonitor:
 
     @property
     def enabled(self) -> bool:
-        with self._lock:
-            return self._enabled
+        return self._enabled
 
     @enabled.setter
     def enabled(self, value: bool) -> None:
@@ -119,13 +121,11 @@ class SafetyMonitor:
 
     @property
     def is_rampdown_active(self) -> bool:
-        with self._lock:
-            return self._rampdown_active
+        return self._rampdown_active
 
     @property
     def is_restart_locked(self) -> bool:
-        with self._lock:
-            return self._restart_locked
+        return self._restart_locked
 
     def set_power_supply(self, power_supply_controller) -> None:
         self.power_supply = power_supply_controller
@@ -379,7 +379,8 @@ class SafetyMonitor:
             except Exception as e:
                 print(f"SAFETY: Error during ramp-down: {e}")
 
-            time.sleep(interval)
+            # Wake immediately if the ramp-down is cancelled
+            self._rampdown_stop_event.wait(interval)
 
         # Final: set voltage to 0 and turn off output
         try:
@@ -497,8 +498,7 @@ class SafetyMonitor:
                 self._restart_locked = False
 
     def get_last_event(self) -> Optional[SafetyEvent]:
-        with self._lock:
-            return self._last_event
+        return self._last_event
 
     def get_event_history(self) -> List[SafetyEvent]:
         with self._lock:
@@ -9,6 +9,8 @@ import time
 import math
 import random
 
+from t8_daq_system.hardware.combined_reader import CombinedReader
+
 # ── Power Programmer Debug Configuration ──────────────────────────────────────
 # Set to False to disable verbose terminal output during Power Programmer runs.
 DEBUG_POWER_PROGRAMMER = True
@@ -94,10 +96,14 @@ class DataAcquisition:
         self.safety_monitor = safety_monitor
         self.program_executor = program_executor
         self.practice_mode = practice_mode
+        # T8-backed readers fused into one LJM transaction per cycle
+        self._combined_reader = CombinedReader(tc_reader, frg702_reader, ps_controller)
 
         self._acquisition_running = False
         self._acquisition_thread = None
         self._acquisition_callback = None
+        # Set by stop_fast_acquisition() to cut the inter-sample wait short
+        self._stop_event = threading.Event()
 
         # Pressure interlock
         self._interlock_callback = None
@@ -106,9 +112,10 @@ class DataAcquisition:
         # Latest all_readings cache (for get_last_readings())
         self._last_all_readings = {}
 
-        # Latest TC readings cache (thread-safe, for ProgramExecutor access)
+        # Latest TC readings cache (for ProgramExecutor access).  The loop
+        # replaces the whole dict with one attribute store and never mutates
+        # a published dict, so readers grab the reference without a lock.
         self._latest_tc_readings = {}
-        self._tc_readings_lock = threading.Lock()
 
         # Timing diagnostics
         self._timing_samples = []
@@ -166,8 +173,8 @@ class DataAcquisition:
                 # Simulate raw TC voltage: typical range ±0.1V (100mV)
                 # Approximate back-calculation from temperature for Type K
                 # Just a plausible simulated value for practice mode
-                raw_voltages[f"{_name}_rawV"] = round(
-                    (val - 20.0) * 4.1e-5 + random.uniform(-2e-6, 2e-6), 8
+                raw_voltages[f"{_name}_rawV"] = (
+                    (val - 20.0) * 4.1e-5 + random.uniform(-2e-6, 2e-6)
                 )
                 _enabled_idx += 1
 
@@ -198,21 +205,17 @@ class DataAcquisition:
                     'PS_Current': 2.0 + 0.5 * math.cos(t / 12.0) + random.uniform(-0.05, 0.05)
                 }
         else:
-            # Read real hardware
-            if self.tc_reader:
-                tc_readings = self.tc_reader.read_all()
-                # Also read raw input voltages for signal-chain verification
-                try:
-                    raw_voltages = self.tc_reader.read_raw_voltages()
-                except Exception as e:
-                    print(f"Raw voltage read skipped: {e}")
-                    raw_voltages = {}
+            # Read real hardware. Thermocouples (EF temperatures and raw
+            # AIN voltages), analog gauges and the PS monitors all come from
+            # one LJM transaction; CombinedReader reads any other reader (the
+            # XGS-600 gauges) on its own and falls back to per-reader reads.
+            tc_readings, raw_voltages, frg702_detail_readings, ps_readings = \
+                self._combined_reader.read_all()
 
             if self.frg702_reader:
-                # Single serial read — derive the flat pressure dict from the
-                # detail dict so the plot buffer and status panel always share
-                # the exact same measurement (no second round-trip to hardware).
-                frg702_detail_readings = self.frg702_reader.read_all_with_status()
+                # Derive the flat pressure dict from the detail dict so the
+                # plot buffer and status panel always share the exact same
+                # measurement (no second round-trip to hardware).
                 frg702_readings = {
                     name: info['pressure']
                     for name, info in frg702_detail_readings.items()
@@ -231,9 +234,6 @@ class DataAcquisition:
                                 f"(conversion factor: {UNIT_CONVERSIONS.get(display_unit, 1.0)})"
                             )
 
-            if self.ps_controller:
-                ps_readings = self.ps_controller.get_readings()
-
         # Merge readings but exclude status flags (PS_Output_On is not a sensor value)
         ps_sensor_readings = {k: v for k, v in ps_readings.items() if k != 'PS_Output_On'}
         all_readings = {**tc_readings, **frg702_readings, **ps_sensor_readings}
@@ -258,6 +258,7 @@ class DataAcquisition:
         self._acquisition_running = True
         self._acquisition_callback = callback
         self._timing_samples = []
+        self._stop_event.clear()
 
         def acquisition_loop():
             while self._acquisition_running:
@@ -267,9 +268,8 @@ class DataAcquisition:
                     timestamp, all_readings, tc_readings, frg702_details, raw_voltages = \
                         self.read_all_sensors()
 
-                    # Cache latest TC readings for thread-safe access by background threads
-                    with self._tc_readings_lock:
-                        self._latest_tc_readings = dict(tc_readings)
+                    # Publish latest TC readings for background threads
+                    self._latest_tc_readings = dict(tc_readings)
 
                     # Cache all_readings for get_last_readings()
                     self._last_all_readings = dict(all_readings)
@@ -331,7 +331,8 @@ class DataAcquisition:
                 # Sleep for remaining time to hit target rate
                 elapsed = time.time() - loop_start
                 sleep_time = max(0, (self.config['logging']['interval_ms'] / 1000.0) - elapsed)
-                time.sleep(sleep_time)
+                if self._stop_event.wait(sleep_time):
+                    break
 
         self._acquisition_thread = threading.Thread(target=acquisition_loop, daemon=True)
         self._acquisition_thread.start()
@@ -339,6 +340,7 @@ class DataAcquisition:
     def stop_fast_acquisition(self):
         """Stop the acquisition thread."""
         self._acquisition_running = False
+        self._stop_event.set()
         if self._acquisition_thread is not None:
             self._acquisition_thread.join(timeout=2.0)
             self._acquisition_thread = None
@@ -369,6 +371,8 @@ class DataAcquisition:
             self.ps_controller = ps_controller
         if config is not None:
             self.config = config
+        self._combined_reader = CombinedReader(
+            self.tc_reader, self.frg702_reader, self.ps_controller)
 
     def get_latest_tc_celsius(self, name=None):
         """
@@ -383,8 +387,8 @@ class DataAcquisition:
         Returns:
             float in °C, or None if no reading is available.
         """
-        with self._tc_readings_lock:
-            readings = dict(self._latest_tc_readings)
+        # Snapshot the reference once; the dict itself is never mutated
+        readings = self._latest_tc_readings
 
         if not readings:
             return None
@@ -33,6 +33,12 @@ class DataBuffer:
         # Lock for thread-safe access from acquisition and GUI threads
         self._lock = threading.Lock()
 
+        # Bumped on every write; get_all_current() reuses its last snapshot
+        # until this moves on, so idle GUI ticks don't rebuild the dict.
+        self._version = 0
+        self._snapshot = {}
+        self._snapshot_version = 0
+
     def add_reading(self, sensor_readings):
         """
         Add a new set of readings to the buffer. Thread-safe.
@@ -68,6 +74,8 @@ class DataBuffer:
                     new_deque.append(value)
                     self.data[name] = new_deque
 
+            self._version += 1
+
     def get_sensor_data(self, sensor_name):
         """
         Get timestamps and values for one sensor. Thread-safe.
@@ -87,14 +95,21 @@ class DataBuffer:
         """
         Get the most recent reading for each sensor. Thread-safe.
 
+        The same dict is returned until new data arrives, so callers should
+        treat it as read-only.
+
         Returns:
             dict like {'TC1': 25.3, 'P1': 45.2}
         """
         with self._lock:
+            if self._snapshot_version == self._version:
+                return self._snapshot
             current = {}
             for name, values in self.data.items():
                 if values:
                     current[name] = values[-1]
+            self._snapshot = current
+            self._snapshot_version = self._version
             return current
 
     def get_all_data(self):
@@ -116,6 +131,7 @@ class DataBuffer:
         with self._lock:
             self.timestamps.clear()
             self.data.clear()
+            self._version += 1
 
     def get_sensor_names(self):
         """Get list of all sensor names in the buffer. Thread-safe."""
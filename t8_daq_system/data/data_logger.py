@@ -14,6 +14,19 @@ class DataLogger:
     # Metadata prefix for comment lines in CSV
     METADATA_PREFIX = "#META:"
 
+    # Fixed CSV precision for power supply columns; FRG-702 gauge columns
+    # use FRG702_FORMAT, and any other float (thermocouples, raw voltages)
+    # uses DEFAULT_FORMAT. Readers hand over full-precision floats, so this
+    # is the one place sample precision is decided.
+    COLUMN_FORMATS = {
+        'PS_Voltage': '.4f',
+        'PS_Voltage_Setpoint': '.4f',
+        'PS_Current': '.3f',
+        'PS_CC_Limit': '.3f',
+    }
+    FRG702_FORMAT = '.2e'
+    DEFAULT_FORMAT = '.7g'
+
     def __init__(self, log_folder="logs", file_prefix="data_log"):
         """
         Initialize the data logger.
@@ -27,6 +40,7 @@ class DataLogger:
         self.file = None
         self.writer = None
         self.sensor_names = []
+        self._columns = []  # (name, format spec or None), built per file
         self.current_filepath = None
         self.metadata = {}
 
@@ -64,6 +78,7 @@ class DataLogger:
         self.file = open(filepath, 'w', newline='')
         self.writer = csv.writer(self.file)
         self.sensor_names = list(sensor_names)
+        self._columns = [(name, self._column_format(name)) for name in self.sensor_names]
         self.current_filepath = filepath
         self.metadata = metadata or {}
 
@@ -100,6 +115,14 @@ class DataLogger:
         self.file.write(f"{self.METADATA_PREFIX}{metadata_json}\n")
         self.file.flush()
 
+    @classmethod
+    def _column_format(cls, name):
+        """Format spec applied to float values in a sensor column."""
+        # Use scientific notation for FRG-702 gauge values (very small floats)
+        if name.startswith('FRG702_'):
+            return cls.FRG702_FORMAT
+        return cls.COLUMN_FORMATS.get(name, cls.DEFAULT_FORMAT)
+
     def log_reading(self, sensor_readings):
         """
         Write one row of data.
@@ -112,17 +135,11 @@ class DataLogger:
 
         timestamp = datetime.now().isoformat()
         row = [timestamp]
-        for name in self.sensor_names:
+        for name, spec in self._columns:
             value = sensor_readings.get(name, '')
-            # Use scientific notation for FRG-702 gauge values (very small floats)
-            if name.startswith('FRG702_') and isinstance(value, float):
-                row.append(f"{value:.2e}")
-            elif name in ('PS_Voltage', 'PS_Voltage_Setpoint') and isinstance(value, float):
-                row.append(f"{value:.4f}")
-            elif name in ('PS_Current', 'PS_CC_Limit') and isinstance(value, float):
-                row.append(f"{value:.3f}")
-            else:
-                row.append(value)
+            if isinstance(value, float):
+                value = format(value, spec)
+            row.append(value)
         self.writer.writerow(row)
         self.file.flush()  # Ensure data is written immediately
 
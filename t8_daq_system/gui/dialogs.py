@@ -14,25 +14,29 @@ from t8_daq_system.data.data_logger import DataLogger
 class LoggingDialog(tk.Toplevel):
     """Dialog for configuring data logging with custom filename and notes."""
 
+    _WIDTH = 400
+    _HEIGHT = 300
+
     def __init__(self, parent, default_prefix="data_log"):
         super().__init__(parent)
+        self.withdraw()
         self.title("Start Logging")
         self.transient(parent)
-        self.grab_set()
 
         self.result = None  # Will contain (custom_name, notes) or None if cancelled
 
         # Configure dialog size
-        self.geometry("400x300")
+        self.geometry(f"{self._WIDTH}x{self._HEIGHT}")
         self.resizable(False, False)
 
         self._build_ui(default_prefix)
 
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        # Center on parent using the fixed size; no layout pass needed
+        x = parent.winfo_x() + (parent.winfo_width() - self._WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self._HEIGHT) // 2
         self.geometry(f"+{x}+{y}")
+        self.deiconify()
+        self.grab_set()
 
         # Focus on name entry
         self.name_entry.focus_set()
@@ -109,26 +113,30 @@ class LoggingDialog(tk.Toplevel):
 class LoadCSVDialog(tk.Toplevel):
     """Dialog for loading and viewing historical CSV data."""
 
+    _WIDTH = 600
+    _HEIGHT = 550
+
     def __init__(self, parent, log_folder):
         super().__init__(parent)
+        self.withdraw()
         self.title("Load Historical Data")
         self.transient(parent)
-        self.grab_set()
 
         self.log_folder = log_folder
         self.result = None  # Will contain filepath or None if cancelled
 
         # Configure dialog size
-        self.geometry("600x550")
+        self.geometry(f"{self._WIDTH}x{self._HEIGHT}")
         self.minsize(500, 350)
 
         self._build_ui()
 
-        # Center on parent
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        # Center on parent using the configured size; no layout pass needed
+        x = parent.winfo_x() + (parent.winfo_width() - self._WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self._HEIGHT) // 2
         self.geometry(f"+{x}+{y}")
+        self.deiconify()
+        self.grab_set()
 
         # Load initial file list
         self._refresh_file_list()
@@ -181,8 +189,11 @@ class LoadCSVDialog(tk.Toplevel):
         info_frame = ttk.LabelFrame(main_frame, text="File Info", padding=5)
         info_frame.pack(fill=tk.X, pady=(10, 0))
 
-        self.info_text = tk.Text(info_frame, height=5, state='disabled', wrap='word')
-        self.info_text.pack(fill=tk.X)
+        # Read-only summary: a Label + StringVar is much lighter than a
+        # disabled Text widget and needs no state toggling to update.
+        self.info_var = tk.StringVar()
+        ttk.Label(info_frame, textvariable=self.info_var, justify='left',
+                  anchor='nw', wraplength=560).pack(fill=tk.X)
 
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -272,15 +283,9 @@ class LoadCSVDialog(tk.Toplevel):
             if settings.get('notes'):
                 info_text += f"Notes: {settings['notes']}\n"
 
-            self.info_text.config(state='normal')
-            self.info_text.delete("1.0", tk.END)
-            self.info_text.insert("1.0", info_text)
-            self.info_text.config(state='disabled')
+            self.info_var.set(info_text.rstrip('\n'))
         except Exception as e:
-            self.info_text.config(state='normal')
-            self.info_text.delete("1.0", tk.END)
-            self.info_text.insert("1.0", f"Error reading file: {e}")
-            self.info_text.config(state='disabled')
+            self.info_var.set(f"Error reading file: {e}")
 
     def _on_load(self):
         """Handle Load button click."""
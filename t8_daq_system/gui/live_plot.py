@@ -22,7 +22,10 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
-from t8_daq_system.utils.helpers import convert_temperature
+
+import numpy as np
+
+from t8_daq_system.utils.helpers import temperature_scale
 from t8_daq_system.hardware.frg702_reader import FRG702Reader
 
 
@@ -783,15 +786,11 @@ class LivePlot:
             )
             for name in tc_names:
                 values = list(plot_data.get(name, []))
-                # Unit conversion
-                if data_temp_unit != self._temp_unit:
-                    disp_u = self._temp_unit.replace('°', '')
-                    src_u = data_temp_unit.replace('°', '')
-                    values = [
-                        convert_temperature(v, src_u, disp_u) if v is not None else None
-                        for v in values
-                    ]
                 times, vals = self._prepare_data(timestamps, values, ws, now)
+                # Unit conversion on the decimated, None-free points only
+                if data_temp_unit != self._temp_unit and vals:
+                    k, b = temperature_scale(data_temp_unit, self._temp_unit)
+                    vals = np.asarray(vals, dtype=np.float64) * k + b
                 color = self._custom_tc_colors[color_idx % len(self._custom_tc_colors)]
                 style = self._linestyle_str_to_mpl(
                     self._custom_tc_styles[color_idx % len(self._custom_tc_styles)]
@@ -820,14 +819,11 @@ class LivePlot:
             frg_names = sorted(n for n in plot_data if self._sensor_belongs(n))
             for name in frg_names:
                 values = list(plot_data.get(name, []))
-                # Unit conversion: convert from data unit to display unit
-                if data_press_unit != self._press_unit:
-                    values = [
-                        FRG702Reader.convert_pressure(v, data_press_unit, self._press_unit)
-                        if v is not None else None
-                        for v in values
-                    ]
                 times, vals = self._prepare_data(timestamps, values, ws, now)
+                # Unit conversion: convert from data unit to display unit
+                if data_press_unit != self._press_unit and vals:
+                    factor = FRG702Reader.conversion_factor(data_press_unit, self._press_unit)
+                    vals = np.asarray(vals, dtype=np.float64) * factor
                 color = self._custom_press_colors[color_idx % len(self._custom_press_colors)]
                 style = self._linestyle_str_to_mpl(
                     self._custom_press_styles[color_idx % len(self._custom_press_styles)]
@@ -19,6 +19,8 @@ import sys
 import random
 import math
 
+import numpy as np
+
 from t8_daq_system.utils.startup_profiler import profiler
 
 
@@ -93,7 +95,7 @@ from t8_daq_system.data.data_buffer import DataBuffer
 from t8_daq_system.data.data_logger import DataLogger, create_metadata_dict
 from t8_daq_system.gui.live_plot import LivePlot
 from t8_daq_system.gui.sensor_panel import SensorPanel
-from t8_daq_system.utils.helpers import convert_temperature
+from t8_daq_system.utils.helpers import convert_temperature, temperature_scale
 from t8_daq_system.gui.dialogs import LoggingDialog, LoadCSVDialog
 from t8_daq_system.gui.settings_dialog import SettingsDialog
 from t8_daq_system.gui.pinout_display import PinoutDisplay
@@ -216,6 +218,17 @@ class MainWindow:
     # Available sampling rates in milliseconds
     SAMPLE_RATES = [100, 200, 500, 1000, 2000]
 
+    # Safety status → (indicator colour, label text, label foreground)
+    SAFETY_STATUS_STYLES = {
+        SafetyStatus.OK: ('#00FF00', 'OK', 'black'),
+        SafetyStatus.WARNING: ('#FFFF00', 'WARNING', 'orange'),
+        SafetyStatus.LIMIT_EXCEEDED: ('#FF0000', 'LIMIT EXCEEDED', 'red'),
+        SafetyStatus.SHUTDOWN_TRIGGERED: ('#FF0000', 'SHUTDOWN', 'red'),
+        SafetyStatus.RAMPDOWN_ACTIVE: ('#FF8800', 'RAMP-DOWN ACTIVE', 'red'),
+        SafetyStatus.ERROR: ('#FF0000', 'ERROR', 'red')
+    }
+    _SAFETY_STATUS_UNKNOWN = ('#333333', 'UNKNOWN', 'gray')
+
     def __init__(self, settings=None):
         profiler.section("MainWindow.__init__ START")
         profiler.checkpoint("Entering __init__ method")
@@ -230,8 +243,7 @@ class MainWindow:
 
         # Build the internal config dict from AppSettings
         self.config = self._build_config_from_settings(settings)
-        self._tc_names = {tc['name'] for tc in self.config['thermocouples']}
-        self._frg_names = {g['name'] for g in self.config.get('frg702_gauges', [])}
+        self._refresh_sensor_names()
         profiler.checkpoint("Config built from AppSettings")
 
         # Axis scale settings (from AppSettings)
@@ -333,10 +345,12 @@ class MainWindow:
         # Data acquisition engine
         self.daq = None
 
-        # Latest readings from acquisition thread
-        self._latest_readings = None
+        # Latest readings from acquisition thread. The frame is published as
+        # one (timestamp, all_readings, frg702_details, raw_voltages) tuple so
+        # the GUI tick always sees a single, consistent acquisition cycle
+        self._latest_frame = None
+        self._drawn_frame = None  # frame the sensor readout last showed
         self._latest_tc_readings = {}
-        self._latest_frg702_details = {}
 
         # Control flags
         self.is_running = False
@@ -367,7 +381,16 @@ class MainWindow:
         # Reconnection cooldown timers (prevent blocking GUI with repeated failed attempts)
         self._last_xgs_reconnect_time = 0
         self._last_lj_reconnect_time = 0
-        self._reconnect_interval = 30.0  # Only retry connection every 30 seconds
+        self._reconnect_interval = 30.0  # First retry after 30 seconds
+        # Each failed attempt doubles that device's cooldown up to the cap;
+        # it drops back to _reconnect_interval once the device is connected.
+        self._reconnect_max_interval = 240.0
+        self._lj_reconnect_delay = self._reconnect_interval
+        self._xgs_reconnect_delay = self._reconnect_interval
+
+        # Idle power-supply polling is throttled independently of the GUI tick
+        self._last_ps_idle_poll_time = 0
+        self._ps_idle_poll_interval = 0.5  # seconds
 
         # FIX 4: Plot skip counter - reduce plot frequency in frozen mode
         self._plot_skip_count = 10 if getattr(sys, 'frozen', False) else 3
@@ -599,8 +622,15 @@ class MainWindow:
 
     def _open_settings_dialog(self):
         """Open the persistent Settings dialog."""
-        SettingsDialog(self.root, self._app_settings,
-                       on_save_callback=self._apply_settings_to_gui)
+        # Built on first use and then re-shown, so later opens skip
+        # recreating the whole widget tree.
+        dialog = self._settings_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.show()
+            return
+        self._settings_dialog = SettingsDialog(
+            self.root, self._app_settings,
+            on_save_callback=self._apply_settings_to_gui)
 
     def _open_pinout_display(self):
         """Open (or bring to front) the live pinout display window."""
@@ -626,9 +656,20 @@ class MainWindow:
         blocks the main (GUI) thread.  On failure the app continues normally
         with ps_controller left as None (Disconnected state).
         """
+        xgs_future = None
         try:
             print("[DEFERRED] Starting hardware initialization...")
 
+            # Open the XGS-600 serial port on a worker thread while the T8
+            # connects below; either can take a second or more to time out
+            # and they share nothing until the readers are wired up.
+            if self.config.get('xgs600', {}).get('enabled', False):
+                from concurrent.futures import ThreadPoolExecutor
+                print("[DEFERRED] Connecting to XGS-600...")
+                executor = ThreadPoolExecutor(max_workers=1)
+                xgs_future = executor.submit(self._open_xgs600)
+                executor.shutdown(wait=False)
+
             # Connect to LabJack T8
             if self.connection:
                 print("[DEFERRED] Connecting to LabJack T8...")
@@ -656,10 +697,16 @@ class MainWindow:
                     self._last_labjack_read_failed = True
                     self._update_connection_state(False)
 
-            # Connect to XGS-600 if configured
-            if self.config.get('xgs600', {}).get('enabled', False):
-                print("[DEFERRED] Connecting to XGS-600...")
-                if self._connect_xgs600():
+            # Finish the XGS-600 connection started above
+            if xgs_future is not None:
+                future, xgs_future = xgs_future, None
+                xgs = future.result()
+                if xgs is None:
+                    # Leave retries to the auto-reconnect timer; calling
+                    # _connect_xgs600(None) here would repeat the blocking
+                    # open on the Tk thread
+                    print("[DEFERRED] XGS-600 connection failed")
+                elif self._connect_xgs600(xgs):
                     print("[DEFERRED] XGS-600 connected")
 
             print("[DEFERRED] Hardware initialization complete")
@@ -668,6 +715,18 @@ class MainWindow:
         except Exception as exc:
             print(f"[DEFERRED] Hardware init error (non-fatal): {exc}")
             self._hardware_init_attempted = True
+            # Don't leave a port opened by the worker held with no owner.
+            # The worker may still be opening it, so release it from a
+            # done-callback rather than waiting on the Tk thread.
+            if xgs_future is not None:
+                xgs_future.add_done_callback(self._release_xgs600)
+
+    @staticmethod
+    def _release_xgs600(future):
+        """Disconnect the controller an _open_xgs600() future produced, if any."""
+        xgs = future.result()
+        if xgs is not None:
+            xgs.disconnect()
 
     def _update_connection_state(self, connected):
         """Update UI to reflect connection state"""
@@ -718,6 +777,9 @@ class MainWindow:
         # Pinout window reference (created lazily)
         self._pinout_window = None
 
+        # Settings dialog (created on first open, then hidden and re-shown)
+        self._settings_dialog = None
+
         # Power Programmer state
         self._programmer_mode_active = False
         self._programmer_preview_data = ([], [], [])  # (times, voltages_or_temps, currents_or_None)
@@ -833,6 +895,8 @@ class MainWindow:
             safety_frame, text="OK", font=('Arial', 8)
         )
         self.safety_status_label.pack(side=tk.LEFT)
+        # Style currently shown, so per-tick updates can skip unchanged configs
+        self._safety_display_style = self.SAFETY_STATUS_STYLES[SafetyStatus.OK]
 
         # Reset Safety button (initially hidden)
         self.reset_safety_btn = ttk.Button(
@@ -998,6 +1062,7 @@ class MainWindow:
                 self.config['frg702_gauges'] = [
                     {"name": "FRG702_Mock", "sensor_code": "T1", "units": "mbar", "enabled": True}
                 ]
+                self._refresh_sensor_names()
             self.frg_count_var.set(str(len(self.config['frg702_gauges'])))
 
             # Set up Mock Power Supply
@@ -1437,20 +1502,19 @@ class MainWindow:
         Immediately command 0 V / 0 A to the power supply and stop any
         running executor. Safe to call at any time.
         """
-        import time as _time
-
         # Stop program executor if running
         if self._program_executor and self._program_executor.is_running():
             self._program_executor.stop()
 
-        # Command 0 V then 0 A to hardware
+        # Command 0 V now and 0 A 300 ms later; the gap is scheduled on the
+        # Tk loop so the window keeps repainting while the voltage settles
         if hasattr(self, 'ps_controller') and self.ps_controller is not None:
             try:
                 self.ps_controller.set_voltage(0.0)
-                _time.sleep(0.3)
-                self.ps_controller.set_current(0.0)
             except Exception as e:
                 messagebox.showwarning("Cut Power Warning", f"Error commanding 0V/0A: {e}")
+            else:
+                self.root.after(300, self._cut_power_current)
 
         # Reset run state
         self._programmer_ramp_running = False
@@ -1462,6 +1526,16 @@ class MainWindow:
             self.plot_ps.set_legend_label_overrides({})
             self.plot_ps.update(['PS_Voltage', 'PS_Current'])
 
+    def _cut_power_current(self):
+        """Second half of _cut_power_output(): command 0 A."""
+        ps = getattr(self, 'ps_controller', None)
+        if ps is None:
+            return
+        try:
+            ps.set_current(0.0)
+        except Exception as e:
+            messagebox.showwarning("Cut Power Warning", f"Error commanding 0V/0A: {e}")
+
     def _on_pressure_unit_change(self):
         """Handle pressure unit selection change."""
         new_unit = self.p_unit_var.get()
@@ -1470,9 +1544,9 @@ class MainWindow:
             for gauge in self.config['frg702_gauges']:
                 gauge['units'] = new_unit
         
-        # Update FRG702 reader target unit
-        if hasattr(self, 'frg702_reader') and self.frg702_reader:
-            self.frg702_reader.target_unit = new_unit
+        # Update FRG702 reader target unit (rebuilds its conversion factors)
+        if hasattr(self, 'frg702_reader') and hasattr(self.frg702_reader, 'set_output_unit'):
+            self.frg702_reader.set_output_unit(new_unit)
 
         # Update sensor panel if it exists
         if hasattr(self, 'sensor_panel'):
@@ -1532,10 +1606,8 @@ class MainWindow:
                 plot.ax.autoscale_view()
                 plot.canvas.draw_idle()
 
-        tc_names = [tc['name'] for tc in self.config['thermocouples']
-                    if tc.get('enabled', True)]
-        frg_names = [g['name'] for g in self.config.get('frg702_gauges', [])
-                     if g.get('enabled', True)]
+        tc_names = self._enabled_tc_names
+        frg_names = self._enabled_frg_names
 
         if self._viewing_historical and self._loaded_data:
             # Only push loaded data to plots on first entry; after that, plots
@@ -1709,6 +1781,21 @@ class MainWindow:
         else:
             self.status_var.set("Disconnected")
 
+    def _refresh_sensor_names(self):
+        """
+        Rebuild the sensor-name caches after self.config's sensor lists change.
+
+        _tc_names/_frg_names hold every configured name (for unit lookups);
+        _enabled_tc_names/_enabled_frg_names are the enabled names in config
+        order, as plotted on every redraw.
+        """
+        tcs = self.config['thermocouples']
+        gauges = self.config.get('frg702_gauges', [])
+        self._tc_names = {tc['name'] for tc in tcs}
+        self._frg_names = {g['name'] for g in gauges}
+        self._enabled_tc_names = [tc['name'] for tc in tcs if tc.get('enabled', True)]
+        self._enabled_frg_names = [g['name'] for g in gauges if g.get('enabled', True)]
+
     def _on_config_change(self):
         """
         Rebuild internal config dictionary from AppSettings and refresh hardware
@@ -1717,8 +1804,7 @@ class MainWindow:
         """
         # Re-build the entire config dict from settings
         self.config = self._build_config_from_settings(self._app_settings)
-        self._tc_names = {tc['name'] for tc in self.config['thermocouples']}
-        self._frg_names = {g['name'] for g in self.config.get('frg702_gauges', [])}
+        self._refresh_sensor_names()
         # Sync GUI vars (for historical reasons / other panels that watch them)
         self.tc_count_var.set(str(len(self.config['thermocouples'])))
         self.frg_count_var.set(str(len(self.config.get('frg702_gauges', []))))
@@ -1735,56 +1821,63 @@ class MainWindow:
         self._rebuild_sensor_panel()
         self._update_plot_settings()
 
+    # Indicator colours; each gets one shared PhotoImage
+    _INDICATOR_COLORS = ('#00FF00', '#333333')
+
     def _build_indicators(self):
         for widget in self.indicator_frame.winfo_children():
             widget.destroy()
         self.indicators = {}
+        self._indicator_colors = {}
 
         lbl_font = ('Arial', 7, 'bold')
-        canvas_size = 14
-
-        lj_frame = ttk.Frame(self.indicator_frame)
-        lj_frame.pack(side=tk.LEFT, padx=5)
-        ttk.Label(lj_frame, text="LJ", font=lbl_font).pack()
-        self.indicators['LabJack'] = tk.Canvas(lj_frame, width=canvas_size, height=canvas_size, bg='#333333', highlightthickness=1, highlightbackground="black")
-        self.indicators['LabJack'].pack()
-
-        xgs_frame = ttk.Frame(self.indicator_frame)
-        xgs_frame.pack(side=tk.LEFT, padx=5)
-        ttk.Label(xgs_frame, text="XGS", font=lbl_font).pack()
-        self.indicators['XGS600'] = tk.Canvas(xgs_frame, width=canvas_size, height=canvas_size, bg='#333333', highlightthickness=1, highlightbackground="black")
-        self.indicators['XGS600'].pack()
-
-        ps_frame = ttk.Frame(self.indicator_frame)
-        ps_frame.pack(side=tk.LEFT, padx=5)
-        ttk.Label(ps_frame, text="PS", font=lbl_font).pack()
-        self.indicators['PowerSupply'] = tk.Canvas(ps_frame, width=canvas_size, height=canvas_size, bg='#333333', highlightthickness=1, highlightbackground="black")
-        self.indicators['PowerSupply'].pack()
 
-        for i, tc in enumerate(self.config['thermocouples']):
-            name = tc['name']
+        # Solid 16x16 squares with a 1px black border, built once and reused
+        # by every indicator so a status change is a single image= swap.
+        if not getattr(self, '_indicator_imgs', None):
+            self._indicator_imgs = {}
+            for color in self._INDICATOR_COLORS:
+                img = tk.PhotoImage(width=16, height=16)
+                img.put("black", to=(0, 0, 16, 16))
+                img.put(color, to=(1, 1, 15, 15))
+                self._indicator_imgs[color] = img
+
+        def add_indicator(name, text, padx):
             f = ttk.Frame(self.indicator_frame)
-            f.pack(side=tk.LEFT, padx=2)
-            ttk.Label(f, text=f"TC{i+1}", font=lbl_font).pack()
-            self.indicators[name] = tk.Canvas(f, width=canvas_size, height=canvas_size, bg='#333333', highlightthickness=1, highlightbackground="black")
+            f.pack(side=tk.LEFT, padx=padx)
+            ttk.Label(f, text=text, font=lbl_font).pack()
+            self.indicators[name] = ttk.Label(f, image=self._indicator_imgs['#333333'])
             self.indicators[name].pack()
+            self._indicator_colors[name] = '#333333'
+
+        add_indicator('LabJack', "LJ", 5)
+        add_indicator('XGS600', "XGS", 5)
+        add_indicator('PowerSupply', "PS", 5)
+
+        for i, tc in enumerate(self.config['thermocouples']):
+            add_indicator(tc['name'], f"TC{i+1}", 2)
 
         for i, gauge in enumerate(self.config.get('frg702_gauges', [])):
-            name = gauge['name']
-            f = ttk.Frame(self.indicator_frame)
-            f.pack(side=tk.LEFT, padx=2)
-            ttk.Label(f, text=f"FRG{i+1}", font=lbl_font).pack()
-            self.indicators[name] = tk.Canvas(f, width=canvas_size, height=canvas_size, bg='#333333', highlightthickness=1, highlightbackground="black")
-            self.indicators[name].pack()
+            add_indicator(gauge['name'], f"FRG{i+1}", 2)
 
-    def _rebuild_sensor_panel(self):
-        for widget in self.panel_container.winfo_children():
-            widget.destroy()
+    def _set_indicator(self, name, color):
+        """Show *color* on an indicator, skipping the Tk call if unchanged."""
+        indicator = self.indicators.get(name)
+        if indicator is None or self._indicator_colors.get(name) == color:
+            return
+        indicator.config(image=self._indicator_imgs[color])
+        self._indicator_colors[name] = color
 
+    def _rebuild_sensor_panel(self):
         all_sensors = self.config['thermocouples']
         frg702_configs = self.config.get('frg702_gauges', [])
-        self.sensor_panel = SensorPanel(self.panel_container, all_sensors, frg702_configs)
-        self.sensor_panel.on_sensor_toggle(self._on_sensor_toggle)
+
+        # Reuse the existing tiles when the panel already exists
+        if hasattr(self, 'sensor_panel'):
+            self.sensor_panel.reconfigure(all_sensors, frg702_configs)
+        else:
+            self.sensor_panel = SensorPanel(self.panel_container, all_sensors, frg702_configs)
+            self.sensor_panel.on_sensor_toggle(self._on_sensor_toggle)
 
         self._build_indicators()
 
@@ -1891,18 +1984,17 @@ class MainWindow:
             )
 
     def _update_safety_display(self, status: SafetyStatus):
-        status_colors = {
-            SafetyStatus.OK: ('#00FF00', 'OK', 'black'),
-            SafetyStatus.WARNING: ('#FFFF00', 'WARNING', 'orange'),
-            SafetyStatus.LIMIT_EXCEEDED: ('#FF0000', 'LIMIT EXCEEDED', 'red'),
-            SafetyStatus.SHUTDOWN_TRIGGERED: ('#FF0000', 'SHUTDOWN', 'red'),
-            SafetyStatus.RAMPDOWN_ACTIVE: ('#FF8800', 'RAMP-DOWN ACTIVE', 'red'),
-            SafetyStatus.ERROR: ('#FF0000', 'ERROR', 'red')
-        }
-
-        color, text, fg = status_colors.get(status, ('#333333', 'UNKNOWN', 'gray'))
-        self.safety_indicator.config(bg=color)
-        self.safety_status_label.config(text=text, foreground=fg)
+        """Show *status* on the safety indicator; called every GUI tick."""
+        style = self.SAFETY_STATUS_STYLES.get(status, self._SAFETY_STATUS_UNKNOWN)
+        shown = self._safety_display_style
+        if style == shown:
+            return
+        color, text, fg = style
+        if color != shown[0]:
+            self.safety_indicator.config(bg=color)
+        if (text, fg) != shown[1:]:
+            self.safety_status_label.config(text=text, foreground=fg)
+        self._safety_display_style = style
 
     def _on_reset_safety(self):
         # Check if restart is allowed (temperature must be below threshold)
@@ -1940,10 +2032,14 @@ class MainWindow:
     def _on_ramp_stop(self):
         pass
 
+    def _next_reconnect_delay(self, delay):
+        """Double a reconnect cooldown after a failed attempt, up to the cap."""
+        return min(delay * 2, self._reconnect_max_interval)
+
     def _check_connections(self):
         if self._practice_mode:
             for name in self.indicators:
-                self.indicators[name].config(bg='#00FF00')
+                self._set_indicator(name, '#00FF00')
             return
 
         if not self.tc_reader:
@@ -1958,9 +2054,8 @@ class MainWindow:
                 all_readings.update(frg702_readings)
 
             for name, value in all_readings.items():
-                if name in self.indicators:
-                    color = '#00FF00' if value is not None else '#333333'
-                    self.indicators[name].config(bg=color)
+                color = '#00FF00' if value is not None else '#333333'
+                self._set_indicator(name, color)
         except Exception as e:
             print(f"Error checking connections: {e}")
 
@@ -2023,6 +2118,13 @@ class MainWindow:
                         safety_shutdown=False, raw_voltages=None, read_failed=False):
             # Update LabJack read status (Task 6)
             self._last_labjack_read_failed = read_failed
+            if not self._practice_mode and self.connection is not None:
+                # A live TC value proves the T8 link, so the GUI loop's
+                # is_connected() can skip its own USB probe this cycle
+                if read_failed:
+                    self.connection.note_read(False)
+                elif any(v is not None for v in tc_readings.values()):
+                    self.connection.note_read(True)
             if read_failed:
                 return
 
@@ -2035,10 +2137,8 @@ class MainWindow:
 
             self.data_buffer.add_reading(all_readings)
 
-            self._latest_readings = (timestamp, all_readings)
             self._latest_tc_readings = tc_readings
-            self._latest_frg702_details = frg702_details
-            self._latest_raw_voltages = raw_voltages
+            self._latest_frame = (timestamp, all_readings, frg702_details, raw_voltages)
 
             if self.is_logging:
                 log_readings = {}
@@ -2187,7 +2287,7 @@ class MainWindow:
         if self._practice_mode:
             lj_connected = True
         elif self._last_labjack_read_failed and not lj_connected and self._hardware_init_attempted:
-            if (now - self._last_lj_reconnect_time) >= self._reconnect_interval:
+            if (now - self._last_lj_reconnect_time) >= self._lj_reconnect_delay:
                 self._last_lj_reconnect_time = now
                 if self.connection.connect():
                     if self._initialize_hardware_readers():
@@ -2197,32 +2297,41 @@ class MainWindow:
                     else:
                         self.connection.disconnect()
                         lj_connected = False
+                if not lj_connected:
+                    self._lj_reconnect_delay = self._next_reconnect_delay(
+                        self._lj_reconnect_delay)
 
             if not lj_connected:
                 if self.status_var.get() != "Disconnected":
                     self._update_connection_state(False)
                     self.is_running = False
                     for name in self.indicators:
-                        self.indicators[name].config(bg='#333333')
+                        self._set_indicator(name, '#333333')
+
+        if lj_connected:
+            self._lj_reconnect_delay = self._reconnect_interval
 
         gui_profiler.start("labjack_indicator")
         # Update LabJack indicator
         color = '#00FF00' if lj_connected else '#333333'
-        if 'LabJack' in self.indicators:
-            self.indicators['LabJack'].config(bg=color)
+        self._set_indicator('LabJack', color)
 
         gui_profiler.start("xgs600_reconnect")
         # Auto-connect XGS-600 (only after initial deferred init)
         xgs_connected = (self.xgs600 is not None and self.xgs600.is_connected()) or self._practice_mode
         if not xgs_connected and not self._practice_mode and self._hardware_init_attempted and self.config.get('xgs600', {}).get('enabled', False):
-            if (now - self._last_xgs_reconnect_time) >= self._reconnect_interval:
+            if (now - self._last_xgs_reconnect_time) >= self._xgs_reconnect_delay:
                 self._last_xgs_reconnect_time = now
                 if self._connect_xgs600():
                     xgs_connected = True
+                else:
+                    self._xgs_reconnect_delay = self._next_reconnect_delay(
+                        self._xgs_reconnect_delay)
+        if xgs_connected:
+            self._xgs_reconnect_delay = self._reconnect_interval
 
         color = '#00FF00' if xgs_connected else '#333333'
-        if 'XGS600' in self.indicators:
-            self.indicators['XGS600'].config(bg=color)
+        self._set_indicator('XGS600', color)
 
         gui_profiler.start("keysight_reconnect")
         # PS is connected whenever the T8 is connected and the controller is initialised.
@@ -2237,11 +2346,14 @@ class MainWindow:
             ps_connected = self.ps_controller is not None
 
         color = '#00FF00' if ps_connected else '#333333'
-        if 'PowerSupply' in self.indicators:
-            self.indicators['PowerSupply'].config(bg=color)
-
-        # When not running, poll PS directly and update sensor-panel tiles
-        if ps_connected and self.ps_controller and not self.is_running:
+        self._set_indicator('PowerSupply', color)
+
+        # When not running, poll PS directly and update sensor-panel tiles.
+        # The sensor panel already skips unchanged tiles; the throttle keeps
+        # fast display rates from turning into back-to-back LJM reads.
+        if ps_connected and self.ps_controller and not self.is_running \
+                and (now - self._last_ps_idle_poll_time) >= self._ps_idle_poll_interval:
+            self._last_ps_idle_poll_time = now
             _ps_live = self.ps_controller.get_readings()
             if hasattr(self, 'sensor_panel'):
                 self.sensor_panel.update({
@@ -2266,28 +2378,47 @@ class MainWindow:
             gui_profiler.loop_end()
             return
 
+        # The acquisition thread publishes at its own rate; when no new frame
+        # has arrived since the last tick there is nothing new to show
+        frame = self._latest_frame
+        if frame is not None and frame is not self._drawn_frame:
+            self._drawn_frame = frame
+            self._update_sensor_readout(frame)
+
+        # Update plots (only every Nth call to reduce matplotlib overhead)
+        if should_redraw_plots:
+            self._update_live_plots()
+
+        gui_profiler.start("schedule_next")
+        self.root.after(self.config['display']['update_rate_ms'], self._update_gui)
+        gui_profiler.loop_end()
+
+    def _update_sensor_readout(self, frame):
+        """Refresh the sensor panel, pinout window and indicators from one frame."""
+        _, _, frg702_details, raw_voltages = frame
+
         gui_profiler.start("read_sensors")
         # Get current readings and update panel
         current = self.data_buffer.get_all_current()
 
-        display_readings = {}
-        t_unit = self.t_unit_var.get()
-
-        for name, value in current.items():
-            if value is None:
-                display_readings[name] = None
-                continue
-            if name in self._tc_names:
-                display_readings[name] = convert_temperature(value, 'C', t_unit)
-            else:
-                display_readings[name] = value
+        # One float array for the whole frame (NaN = no reading), so the TC
+        # unit conversion and the panel's value formatting are vectorised
+        names = list(current)
+        values = np.array([np.nan if v is None else v for v in current.values()],
+                          dtype=np.float64)
+        k, b = temperature_scale('C', self.t_unit_var.get())
+        if k != 1.0 or b != 0.0:
+            tc_names = self._tc_names
+            is_tc = np.fromiter((n in tc_names for n in names), dtype=bool,
+                                count=len(names))
+            values[is_tc] = values[is_tc] * k + b
 
         gui_profiler.start("sensor_panel_update")
-        self.sensor_panel.update(display_readings)
+        self.sensor_panel.update_bulk(names, values)
 
         # Update FRG-702 detailed status
-        if hasattr(self, '_latest_frg702_details') and self._latest_frg702_details:
-            self.sensor_panel.update_frg702_status(self._latest_frg702_details)
+        if frg702_details:
+            self.sensor_panel.update_frg702_status(frg702_details)
 
         # Update live pinout display if open (Change 6: moved from DAQ thread to GUI thread)
         if hasattr(self, '_pinout_window') and self._pinout_window is not None:
@@ -2295,44 +2426,37 @@ class MainWindow:
                 if self._pinout_window.winfo_exists():
                     self._pinout_window.update_readings(
                         all_readings=current,
-                        raw_voltages=getattr(self, '_latest_raw_voltages', {}),
-                        frg702_details=getattr(self, '_latest_frg702_details', {})
+                        raw_voltages=raw_voltages,
+                        frg702_details=frg702_details
                     )
             except tk.TclError:
                 self._pinout_window = None
 
         # Update indicators
         for name, value in current.items():
-            if name in self.indicators:
-                color = '#00FF00' if value is not None else '#333333'
-                self.indicators[name].config(bg=color)
+            color = '#00FF00' if value is not None else '#333333'
+            self._set_indicator(name, color)
 
-        # Update plots (only every Nth call to reduce matplotlib overhead)
-        if should_redraw_plots:
-            gui_profiler.start("plot_update")
-            tc_names = [tc['name'] for tc in self.config['thermocouples']
-                        if tc.get('enabled', True)]
-            frg_names = [g['name'] for g in self.config.get('frg702_gauges', [])
-                         if g.get('enabled', True)]
-
-            # If any plot is live, keep master scroll at 1.0
-            if hasattr(self, 'plot_tc') and self.plot_tc._is_live:
-                self.master_scroll_var.set(1.0)
+    def _update_live_plots(self):
+        """Redraw the TC, pressure and power supply plots from the data buffer."""
+        gui_profiler.start("plot_update")
+        tc_names = self._enabled_tc_names
+        frg_names = self._enabled_frg_names
 
-            if hasattr(self, 'plot_tc'):
-                # TC data in buffer is always in Celsius (converted at acquisition)
-                self.plot_tc.update(tc_names, data_units={'temp': 'C'})
-            if hasattr(self, 'plot_pressure'):
-                self.plot_pressure.update(frg_names, data_units={'press': self.p_unit_var.get()})
-            if hasattr(self, 'plot_ps'):
-                _ps_names = ['PS_Voltage', 'PS_Current']
-                if getattr(self, '_programmer_ramp_running', False):
-                    _ps_names += ['PS_Voltage_Setpoint', 'PS_CC_Limit']
-                self.plot_ps.update(_ps_names)
+        # If any plot is live, keep master scroll at 1.0
+        if hasattr(self, 'plot_tc') and self.plot_tc._is_live:
+            self.master_scroll_var.set(1.0)
 
-        gui_profiler.start("schedule_next")
-        self.root.after(self.config['display']['update_rate_ms'], self._update_gui)
-        gui_profiler.loop_end()
+        if hasattr(self, 'plot_tc'):
+            # TC data in buffer is always in Celsius (converted at acquisition)
+            self.plot_tc.update(tc_names, data_units={'temp': 'C'})
+        if hasattr(self, 'plot_pressure'):
+            self.plot_pressure.update(frg_names, data_units={'press': self.p_unit_var.get()})
+        if hasattr(self, 'plot_ps'):
+            _ps_names = ['PS_Voltage', 'PS_Current']
+            if getattr(self, '_programmer_ramp_running', False):
+                _ps_names += ['PS_Voltage_Setpoint', 'PS_CC_Limit']
+            self.plot_ps.update(_ps_names)
 
     def _initialize_hardware_readers(self):
         try:
@@ -2370,26 +2494,75 @@ class MainWindow:
             print(f"Error initializing hardware readers: {e}")
             return False
 
-    def _connect_xgs600(self):
+    def _open_xgs600(self, reuse=None):
+        """
+        Create an XGS600Controller from config and open its serial port.
+
+        Touches no GUI or reader state, so it is safe to run on a worker
+        thread.
+
+        Args:
+            reuse: A previously created controller. If its port settings
+                   still match config it is reconnected in place instead
+                   of building a new one.
+
+        Returns:
+            The connected controller, or None on failure.
+        """
+        xgs_config = self.config.get('xgs600', {})
+        try:
+            settings = (xgs_config['port'], xgs_config.get('baudrate', 9600),
+                        xgs_config.get('timeout', 1.0), xgs_config.get('address', '00'))
+            if reuse is not None and \
+                    (reuse.port, reuse.baudrate, reuse.timeout, reuse.address) == settings:
+                xgs = reuse
+            else:
+                xgs = XGS600Controller(
+                    port=settings[0],
+                    baudrate=settings[1],
+                    timeout=settings[2],
+                    address=settings[3],
+                    debug=False # Enable verbose serial logging for debugging
+                )
+            if xgs.connect(silent=True):
+                return xgs
+        except Exception:
+            pass
+        return None
+
+    def _connect_xgs600(self, xgs=None):
+        """
+        Connect the XGS-600 and build the FRG-702 reader on top of it.
+
+        Args:
+            xgs: A controller already opened by _open_xgs600(), or None to
+                 open one now.
+
+        Returns:
+            True if the controller is connected, False otherwise.
+        """
         xgs_config = self.config.get('xgs600', {})
         if not xgs_config.get('enabled', False):
+            if xgs is not None:
+                xgs.disconnect()
             return False
 
         try:
-            self.xgs600 = XGS600Controller(
-                port=xgs_config['port'],
-                baudrate=xgs_config.get('baudrate', 9600),
-                timeout=xgs_config.get('timeout', 1.0),
-                address=xgs_config.get('address', '00'),
-                debug=False # Enable verbose serial logging for debugging
-            )
-            if not self.xgs600.connect(silent=True):
-                self.xgs600 = None
-                return False
+            if xgs is None:
+                # Auto-reconnect: reopen the existing controller rather than
+                # rebuilding it and the FRG-702 reader on every attempt
+                xgs = self._open_xgs600(reuse=self.xgs600)
+                if xgs is None:
+                    return False
+            self.xgs600 = xgs
 
             frg702_config = self.config.get('frg702_gauges', [])
             if frg702_config:
-                self.frg702_reader = FRG702Reader(self.xgs600, frg702_config)
+                if isinstance(self.frg702_reader, FRG702Reader) and \
+                        self.frg702_reader.controller is self.xgs600:
+                    self.frg702_reader.gauges = frg702_config
+                else:
+                    self.frg702_reader = FRG702Reader(self.xgs600, frg702_config)
 
             # Update live DAQ engine if running
             if self.daq:
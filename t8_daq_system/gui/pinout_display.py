@@ -62,10 +62,14 @@ class PinoutDisplay(tk.Toplevel):
 
     REFRESH_MS = 200  # How often to redraw live value cells (ms)
 
+    _WIDTH = 900
+    _HEIGHT = 700
+
     def __init__(self, parent, config, app_settings):
         super().__init__(parent)
+        self.withdraw()
         self.title("Live Pinout Display")
-        self.geometry("900x700")
+        self.geometry(f"{self._WIDTH}x{self._HEIGHT}")
         self.minsize(700, 550)
         self.resizable(True, True)
         self.transient(parent)
@@ -88,12 +92,12 @@ class PinoutDisplay(tk.Toplevel):
         self._build_chrome()
         self._schedule_refresh()
 
-        # Centre over parent
-        self.update_idletasks()
+        # Centre over parent.  The window is still unmapped, so use the
+        # configured size rather than forcing a layout pass to measure it.
         px, py = parent.winfo_x(), parent.winfo_y()
         pw, ph = parent.winfo_width(), parent.winfo_height()
-        w, h   = self.winfo_width(), self.winfo_height()
-        self.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        self.geometry(f"+{px + (pw - self._WIDTH) // 2}+{py + (ph - self._HEIGHT) // 2}")
+        self.deiconify()
 
     # ──────────────────────────────────────────────────────────────────────────
     # Public API
@@ -50,11 +50,16 @@ class PreflightDialog(tk.Toplevel):
     app_settings : AppSettings
     """
 
+    # Bounds for the content-sized window
+    _MIN_WIDTH = 580
+    _MIN_HEIGHT = 300
+    _MAX_HEIGHT = 700
+
     def __init__(self, parent, config, app_settings):
         super().__init__(parent)
+        self.withdraw()
         self.title("Wiring Pre-flight Check")
         self.resizable(True, True)
-        self.grab_set()
         self.transient(parent)
 
         self._config   = config
@@ -65,12 +70,16 @@ class PreflightDialog(tk.Toplevel):
 
         self._build_widgets()
 
+        # The dialog sizes to its content, so one layout pass is needed to
+        # measure it; the requested size is valid while still unmapped.
         self.update_idletasks()
         px, py = parent.winfo_x(), parent.winfo_y()
         pw, ph = parent.winfo_width(), parent.winfo_height()
-        w, h   = self.winfo_width(), self.winfo_height()
-        self.geometry(f"{max(w, 580)}x{min(max(h, 300), 700)}"
-                      f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        w = max(self.winfo_reqwidth(), self._MIN_WIDTH)
+        h = min(max(self.winfo_reqheight(), self._MIN_HEIGHT), self._MAX_HEIGHT)
+        self.geometry(f"{w}x{h}+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        self.deiconify()
+        self.grab_set()
 
     # ──────────────────────────────────────────────────────────────────────────
 
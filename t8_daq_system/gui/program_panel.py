@@ -24,6 +24,9 @@ def _disp_to_k(value, unit):
 
 
 class BlockEditDialog(tk.Toplevel):
+    _WIDTH = 370
+    _HEIGHT = 320
+
     def __init__(self, parent, block, tc_names=None, entry_mode='Rate',
                  start_temp_k=293.15, display_unit='K'):
         super().__init__(parent)
@@ -34,18 +37,18 @@ class BlockEditDialog(tk.Toplevel):
         self._entry_mode = getattr(block, 'entry_mode', entry_mode)
         self._start_temp_k = start_temp_k  # chain temp at start of this block
         self._unit = display_unit           # 'C' or 'K'
+        self.withdraw()
         self.title(f"Edit {block.block_type.replace('_', ' ').title()}")
-        self.geometry("370x320")
-        self.grab_set()
+        self.geometry(f"{self._WIDTH}x{self._HEIGHT}")
         self.transient(parent)
         self._build_ui()
 
-        # Center dialog
-        self.update_idletasks()
+        # Center dialog using the fixed size; no layout pass needed
         px, py = parent.winfo_rootx(), parent.winfo_rooty()
         pw, ph = parent.winfo_width(), parent.winfo_height()
-        w, h = self.winfo_width(), self.winfo_height()
-        self.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        self.geometry(f"+{px + (pw - self._WIDTH) // 2}+{py + (ph - self._HEIGHT) // 2}")
+        self.deiconify()
+        self.grab_set()
 
     def _build_ui(self):
         main_frame = ttk.Frame(self, padding=20)
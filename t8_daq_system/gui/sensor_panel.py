@@ -5,12 +5,31 @@ PURPOSE: Display current sensor values as text/numbers
 
 import tkinter as tk
 from tkinter import ttk
+import numpy as np
+from t8_daq_system.utils.helpers import format_fixed_batch
 from t8_daq_system.hardware.frg702_reader import (
     STATUS_VALID, STATUS_UNDERRANGE, STATUS_OVERRANGE,
     STATUS_SENSOR_ERROR_NO_SUPPLY, STATUS_SENSOR_ERROR_PIRANI_DEFECTIVE,
 )
 
 
+# Shared status strings and colours, so every update reuses the same objects
+_WAITING = "WAITING"
+_CONNECTED = "CONNECTED"
+_DISCONNECTED = "DISCONNECTED"
+_ERROR = "ERROR"
+_OUTPUT_OFF = "OUTPUT OFF"
+_UNDERRANGE = "UNDERRANGE"
+_OVERRANGE = "OVERRANGE"
+
+_BLACK = 'black'
+_GRAY = 'gray'
+_RED = 'red'
+_GREEN = 'green'
+_ORANGE = 'orange'
+_ERROR_STATES = frozenset((_DISCONNECTED, _ERROR))
+
+
 class SensorPanel:
     def __init__(self, parent_frame, sensor_configs, frg702_configs=None):
         """
@@ -22,28 +41,80 @@ class SensorPanel:
             frg702_configs: optional list of FRG-702 gauge configs
         """
         self.parent = parent_frame
-        self.displays = {}        # sensor_name: Label widget for value
-        self.status_labels = {}   # sensor_name: Label widget for status
-        self.frames = {}          # sensor_name: LabelFrame widget
-        self.precisions = {}      # sensor_name: decimal places to show
-
-        # FRG-702 specific widgets
-        self.global_pressure_unit = "mbar"
-        self.frg702_names = set()      # sensor names that are FRG-702 gauges
 
         # Click-to-toggle state (Change 6)
-        self._sensor_visible = {}    # sensor_name: bool
         self._toggle_callbacks = []  # list of callable(name, visible)
 
+        # Tile slots are reused across reconfigure() calls instead of being
+        # destroyed and recreated; unused ones are hidden with grid_remove().
+        self._slots = []             # every slot ever created
+        self._free_slots = []        # slots not currently showing a sensor
+
         # Configure dimmed style for toggled-off tiles
         try:
             style = ttk.Style()
             style.configure('Dimmed.TLabelframe', background='#cccccc')
             style.configure('Dimmed.TLabelframe.Label', background='#cccccc',
-                            foreground='gray')
+                            foreground=_GRAY)
         except Exception:
             pass
 
+        # Tiles are built inside a body frame that is not mapped until every
+        # tile exists, so Tk runs a single geometry pass instead of one per
+        # grid()/pack() call.
+        self._body = ttk.Frame(parent_frame)
+
+        # Shared status summary beneath the tiles
+        self.summary_label = ttk.Label(
+            self._body,
+            text=_WAITING,
+            font=('Arial', 8, 'italic'),
+            foreground=_GRAY
+        )
+        self._summary_text = _WAITING
+
+        self._layout(sensor_configs, frg702_configs)
+
+        # Map the fully-populated body in one step
+        self._body.grid(row=0, column=0, sticky='w')
+
+    def reconfigure(self, sensor_configs, frg702_configs=None):
+        """
+        Rebuild the tile layout for a new sensor configuration.
+
+        Existing tiles are relabelled and re-shown rather than destroyed;
+        surplus tiles are hidden and kept for later reuse.
+
+        Args:
+            sensor_configs: list of thermocouple configs
+            frg702_configs: optional list of FRG-702 gauge configs
+        """
+        for slot in self._slots:
+            if slot['name'] is not None:
+                slot['frame'].grid_remove()
+                slot['name'] = None
+                self._free_slots.append(slot)
+        self._layout(sensor_configs, frg702_configs)
+
+    def _layout(self, sensor_configs, frg702_configs):
+        """Assign a tile slot to every enabled sensor plus the PS tiles."""
+        self.displays = {}        # sensor_name: Label widget for value
+        self.frames = {}          # sensor_name: LabelFrame widget
+        self.precisions = {}      # sensor_name: decimal places to show
+
+        # Per-sensor status is tallied into one shared summary label rather
+        # than a status label per tile.
+        self._states = {}         # sensor_name: status text (e.g. "CONNECTED")
+        self._shown = {}          # sensor_name: (text, foreground) last applied
+
+        # FRG-702 specific widgets
+        self.global_pressure_unit = "mbar"
+        self.frg702_names = set()      # sensor names that are FRG-702 gauges
+        self.unit_labels = {}          # sensor_name: unit Label widget
+        self._units = {}               # sensor_name: unit text currently shown
+
+        self._sensor_visible = {}    # sensor_name: bool
+
         i = 0  # grid index counter
 
         # Create a label for each standard sensor (Thermocouples)
@@ -52,44 +123,10 @@ class SensorPanel:
                 continue
 
             name = sensor['name']
-            units = sensor.get('units', '')
-
             # Thermocouple precision and placeholder
+            self._assign_slot(name, i, "--.--", sensor.get('units', ''),
+                              ('Arial', 14, 'bold'))
             self.precisions[name] = 2
-            placeholder = "--.--"
-            self._sensor_visible[name] = True
-
-            # Create frame for this sensor with fixed size
-            frame = ttk.LabelFrame(parent_frame, text=name, width=206, height=90)
-            frame.grid(row=0, column=i, padx=6, pady=5)
-            frame.pack_propagate(False)
-            self.frames[name] = frame
-
-            # Large number display
-            value_label = ttk.Label(
-                frame,
-                text=placeholder,
-                font=('Arial', 14, 'bold')
-            )
-            value_label.pack(padx=5, pady=1)
-
-            # Units label
-            units_label = ttk.Label(frame, text=units)
-            units_label.pack(pady=(0, 1))
-
-            # Status indicator
-            status_label = ttk.Label(
-                frame,
-                text="WAITING",
-                font=('Arial', 6, 'italic'),
-                foreground='gray'
-            )
-            status_label.pack(side=tk.BOTTOM, pady=1)
-
-            self.displays[name] = value_label
-            self.status_labels[name] = status_label
-
-            self._bind_tile_click(frame, name)
             i += 1
 
         # Create FRG-702 gauge displays
@@ -100,90 +137,79 @@ class SensorPanel:
 
                 name = gauge['name']
                 default_unit = gauge.get('units', 'mbar')
-                self._sensor_visible[name] = True
-                self.frg702_names.add(name)
-
-                # Same size frame as TC/PS panels
-                frame = ttk.LabelFrame(parent_frame, text=name, width=206, height=90)
-                frame.grid(row=0, column=i, padx=6, pady=5)
-                frame.pack_propagate(False)
-                self.frames[name] = frame
-
                 # Large value display (scientific notation)
-                value_label = ttk.Label(
-                    frame,
-                    text="-.--e--",
-                    font=('Courier', 14, 'bold')
-                )
-                value_label.pack(padx=5, pady=1)
-
-                # Unit display label (fixed)
-                self.unit_labels = {} if not hasattr(self, 'unit_labels') else self.unit_labels
-                self.unit_labels[name] = ttk.Label(frame, text=default_unit)
-                self.unit_labels[name].pack(pady=(0, 1))
-
-                # Status text label
-                status_label = ttk.Label(
-                    frame,
-                    text="WAITING",
-                    font=('Arial', 6, 'italic'),
-                    foreground='gray'
-                )
-                status_label.pack(side=tk.BOTTOM, pady=1)
-
-                self.displays[name] = value_label
-                self.status_labels[name] = status_label
+                slot = self._assign_slot(name, i, "-.--e--", default_unit,
+                                         ('Courier', 14, 'bold'))
+                self.frg702_names.add(name)
+                self.unit_labels[name] = slot['units']
+                self._units[name] = default_unit
                 self.precisions[name] = -1  # Flag: use scientific notation
-
-                self._bind_tile_click(frame, name)
                 i += 1
 
-        # ── PS Voltage tile (Change 3) ─────────────────────────────────────
-        self._sensor_visible['PS_Voltage'] = True
-        ps_v_frame = ttk.LabelFrame(parent_frame, text="PS Voltage", width=206, height=90)
-        ps_v_frame.grid(row=0, column=i, padx=6, pady=5)
-        ps_v_frame.pack_propagate(False)
-        self.frames['PS_Voltage'] = ps_v_frame
-
-        ps_v_label = ttk.Label(ps_v_frame, text="--- V", font=('Arial', 14, 'bold'))
-        ps_v_label.pack(padx=5, pady=1)
+        # ── PS Voltage / PS Current tiles (Change 3) ───────────────────────
+        self._assign_slot('PS_Voltage', i, "--- V", "V", ('Arial', 14, 'bold'),
+                          title="PS Voltage")
+        self.precisions['PS_Voltage'] = 2
+        i += 1
 
-        ps_v_units = ttk.Label(ps_v_frame, text="V")
-        ps_v_units.pack(pady=(0, 1))
+        self._assign_slot('PS_Current', i, "--- A", "A", ('Arial', 14, 'bold'),
+                          title="PS Current")
+        self.precisions['PS_Current'] = 2
+        i += 1
 
-        ps_v_status = ttk.Label(ps_v_frame, text="WAITING",
-                                font=('Arial', 6, 'italic'), foreground='gray')
-        ps_v_status.pack(side=tk.BOTTOM, pady=1)
+        self.summary_label.grid(row=1, column=0, columnspan=i, sticky='w', padx=6)
+        if self._summary_text != _WAITING:
+            self.summary_label.config(text=_WAITING, foreground=_GRAY)
+            self._summary_text = _WAITING
 
-        self.displays['PS_Voltage'] = ps_v_label
-        self.status_labels['PS_Voltage'] = ps_v_status
-        self.precisions['PS_Voltage'] = 2
+        self._refresh_name_cache()
 
-        self._bind_tile_click(ps_v_frame, 'PS_Voltage')
-        i += 1
+    def _new_slot(self):
+        """Create an empty tile (frame, value label, units label)."""
+        slot = {'name': None}
 
-        # ── PS Current tile (Change 3) ─────────────────────────────────────
-        self._sensor_visible['PS_Current'] = True
-        ps_i_frame = ttk.LabelFrame(parent_frame, text="PS Current", width=206, height=90)
-        ps_i_frame.grid(row=0, column=i, padx=6, pady=5)
-        ps_i_frame.pack_propagate(False)
-        self.frames['PS_Current'] = ps_i_frame
+        # Create frame for this sensor with fixed size
+        frame = ttk.LabelFrame(self._body, width=206, height=90)
+        frame.pack_propagate(False)
+        slot['frame'] = frame
 
-        ps_i_label = ttk.Label(ps_i_frame, text="--- A", font=('Arial', 14, 'bold'))
-        ps_i_label.pack(padx=5, pady=1)
+        # Large number display
+        slot['value'] = ttk.Label(frame)
+        slot['value'].pack(padx=5, pady=1)
 
-        ps_i_units = ttk.Label(ps_i_frame, text="A")
-        ps_i_units.pack(pady=(0, 1))
+        # Units label
+        slot['units'] = ttk.Label(frame)
+        slot['units'].pack(pady=(0, 1))
 
-        ps_i_status = ttk.Label(ps_i_frame, text="WAITING",
-                                font=('Arial', 6, 'italic'), foreground='gray')
-        ps_i_status.pack(side=tk.BOTTOM, pady=1)
+        self._bind_tile_click(slot)
+        self._slots.append(slot)
+        return slot
 
-        self.displays['PS_Current'] = ps_i_label
-        self.status_labels['PS_Current'] = ps_i_status
-        self.precisions['PS_Current'] = 2
+    def _assign_slot(self, name, column, placeholder, units, font, title=None):
+        """Show sensor *name* in a free (or new) slot at grid *column*."""
+        slot = self._free_slots.pop(0) if self._free_slots else self._new_slot()
+        slot['name'] = name
 
-        self._bind_tile_click(ps_i_frame, 'PS_Current')
+        frame = slot['frame']
+        try:
+            frame.configure(style='TLabelframe')
+        except Exception:
+            pass
+        frame.configure(text=title or name)
+        frame.grid(row=0, column=column, padx=6, pady=5)
+        slot['value'].configure(text=placeholder, font=font, foreground=_BLACK)
+        slot['units'].configure(text=units)
+
+        self.frames[name] = frame
+        self.displays[name] = slot['value']
+        self._states[name] = _WAITING
+        self._sensor_visible[name] = True
+        return slot
+
+    def _refresh_name_cache(self):
+        """Recompute the cached name set/tuple after tiles are added or removed."""
+        self._known_names = frozenset(self.displays)
+        self._cached_names = tuple(self.displays)
 
     # ──────────────────────────────────────────────────────────────────────
     # Click-to-toggle (Change 6)
@@ -197,11 +223,18 @@ class SensorPanel:
         """
         self._toggle_callbacks.append(callback)
 
-    def _bind_tile_click(self, frame, name):
-        """Bind <Button-1> to a tile frame and all its children."""
-        frame.bind('<Button-1>', lambda e, n=name: self._on_tile_click(n))
-        for child in frame.winfo_children():
-            child.bind('<Button-1>', lambda e, n=name: self._on_tile_click(n))
+    def _bind_tile_click(self, slot):
+        """Bind <Button-1> to a tile frame and its labels.
+
+        The handler reads the slot's current sensor name, so the binding
+        stays valid when the slot is reassigned by reconfigure().
+        """
+        def handler(event, s=slot):
+            if s['name'] is not None:
+                self._on_tile_click(s['name'])
+
+        for widget in (slot['frame'], slot['value'], slot['units']):
+            widget.bind('<Button-1>', handler)
 
     def _on_tile_click(self, name):
         """Toggle sensor visibility and notify registered callbacks."""
@@ -224,9 +257,7 @@ class SensorPanel:
             except Exception:
                 pass
             if name in self.displays:
-                self.displays[name].configure(foreground='black')
-            if name in self.status_labels:
-                self.status_labels[name].configure(foreground='gray')
+                self.displays[name].configure(foreground=_BLACK)
         else:
             try:
                 frame.configure(style='Dimmed.TLabelframe')
@@ -234,13 +265,53 @@ class SensorPanel:
                 pass
             if name in self.displays:
                 self.displays[name].configure(foreground='#aaaaaa')
-            if name in self.status_labels:
-                self.status_labels[name].configure(foreground='#aaaaaa')
+        # Foreground was changed behind the diff cache; force the next update
+        self._shown.pop(name, None)
 
     # ──────────────────────────────────────────────────────────────────────
     # Value updates
     # ──────────────────────────────────────────────────────────────────────
 
+    def _set_value(self, name, text, foreground):
+        """Configure a value label, skipping the Tk call if nothing changed."""
+        shown = (text, foreground)
+        if self._shown.get(name) != shown:
+            self.displays[name].config(text=text, foreground=foreground)
+            self._shown[name] = shown
+
+    def _refresh_summary(self):
+        """Tally per-sensor states into the shared summary label."""
+        ok = warn = err = 0
+        for state in self._states.values():
+            if state == _CONNECTED:
+                ok += 1
+            elif state in _ERROR_STATES:
+                err += 1
+            elif state != _WAITING:
+                warn += 1
+
+        parts = []
+        if ok:
+            parts.append(f"{ok} OK")
+        if warn:
+            parts.append(f"{warn} WARN")
+        if err:
+            parts.append(f"{err} ERR")
+        text = " · ".join(parts) if parts else _WAITING
+        if text == self._summary_text:
+            return
+
+        if err:
+            color = _RED
+        elif warn:
+            color = _ORANGE
+        elif ok:
+            color = _GREEN
+        else:
+            color = _GRAY
+        self.summary_label.config(text=text, foreground=color)
+        self._summary_text = text
+
     def update(self, readings):
         """
         Update displayed values and status.
@@ -250,52 +321,89 @@ class SensorPanel:
                                   'PS_Voltage': 12.3, 'PS_Current': 5.6}
         """
         for name, value in readings.items():
-            if name not in self.displays:
+            if name not in self._known_names:
                 continue
             if name == 'PS_Voltage':
                 if value is None:
-                    self.displays[name].config(text="--- V", foreground='gray')
-                    self.status_labels[name].config(text="DISCONNECTED", foreground='red')
+                    self._set_value(name, "--- V", _GRAY)
+                    self._states[name] = _DISCONNECTED
                 elif value < 0:
-                    self.displays[name].config(text=f"{value:.3f} V", foreground='black')
-                    self.status_labels[name].config(text="Output is turned off", foreground='red')
+                    self._set_value(name, f"{value:.3f} V", _RED)
+                    self._states[name] = _OUTPUT_OFF
                 else:
-                    self.displays[name].config(text=f"{value:.3f} V", foreground='black')
-                    self.status_labels[name].config(text="CONNECTED", foreground='green')
+                    self._set_value(name, f"{value:.3f} V", _BLACK)
+                    self._states[name] = _CONNECTED
             elif name == 'PS_Current':
                 if value is None:
-                    self.displays[name].config(text="--- A", foreground='gray')
-                    self.status_labels[name].config(text="DISCONNECTED", foreground='red')
+                    self._set_value(name, "--- A", _GRAY)
+                    self._states[name] = _DISCONNECTED
                 else:
                     # Check if PS_Voltage is negative to display same status
                     v_val = readings.get('PS_Voltage')
                     if v_val is not None and v_val < 0:
-                        self.displays[name].config(text=f"{value:.3f} A", foreground='black')
-                        self.status_labels[name].config(text="Output is turned off", foreground='red')
+                        self._set_value(name, f"{value:.3f} A", _RED)
+                        self._states[name] = _OUTPUT_OFF
                     else:
-                        self.displays[name].config(text=f"{value:.3f} A", foreground='black')
-                        self.status_labels[name].config(text="CONNECTED", foreground='green')
+                        self._set_value(name, f"{value:.3f} A", _BLACK)
+                        self._states[name] = _CONNECTED
             elif name in self.frg702_names:
                 # FRG-702 display: use scientific notation
                 self._update_frg702_display(name, value)
             elif value is None:
-                self.displays[name].config(text="---", foreground='gray')
-                self.status_labels[name].config(text="DISCONNECTED", foreground='red')
+                self._set_value(name, "---", _GRAY)
+                self._states[name] = _DISCONNECTED
             else:
                 precision = self.precisions.get(name, 1)
-                self.displays[name].config(text=f"{value:.{precision}f}",
-                                           foreground='black')
-                self.status_labels[name].config(text="CONNECTED", foreground='green')
+                self._set_value(name, f"{value:.{precision}f}", _BLACK)
+                self._states[name] = _CONNECTED
+
+        self._refresh_summary()
+
+    def update_bulk(self, names, values):
+        """
+        Update plain numeric tiles from parallel name/value sequences.
+
+        Values are formatted in one vectorised pass (per precision) instead
+        of one f-string per sensor. Non-finite values are shown as
+        disconnected. PS and FRG-702 tiles, which need their own formatting,
+        are routed through update().
+
+        Args:
+            names: sequence of sensor names
+            values: sequence or NumPy array of readings, same length as names
+        """
+        vals = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(vals)
+        texts = format_fixed_batch(
+            vals, [max(self.precisions.get(name, 1), 0) for name in names])
+
+        special = {}
+        for name, text, ok, value in zip(names, texts, finite, vals):
+            if name not in self._known_names:
+                continue
+            if name in ('PS_Voltage', 'PS_Current') or name in self.frg702_names:
+                special[name] = float(value) if ok else None
+            elif ok:
+                self._set_value(name, text, _BLACK)
+                self._states[name] = _CONNECTED
+            else:
+                self._set_value(name, "---", _GRAY)
+                self._states[name] = _DISCONNECTED
+
+        if special:
+            self.update(special)
+        else:
+            self._refresh_summary()
 
     def _update_frg702_display(self, name, value):
         """Update an FRG-702 gauge display with scientific notation."""
         if value is None:
-            self.displays[name].config(text="-.--e--", foreground='gray')
-            self.status_labels[name].config(text="DISCONNECTED", foreground='red')
+            self._set_value(name, "-.--e--", _GRAY)
+            self._states[name] = _DISCONNECTED
             return
 
-        self.displays[name].config(text=f"{value:.2e}", foreground='black')
-        self.status_labels[name].config(text="CONNECTED", foreground='green')
+        self._set_value(name, f"{value:.2e}", _BLACK)
+        self._states[name] = _CONNECTED
 
     def update_frg702_status(self, frg702_detail_readings):
         """
@@ -306,42 +414,57 @@ class SensorPanel:
                 e.g. {'FRG702_Chamber': {'pressure': 1.5e-6, 'status': 'valid', 'mode': 'Combined...'}}
         """
         for name, info in frg702_detail_readings.items():
-            if name not in self.displays:
+            if name not in self._known_names:
                 continue
 
             pressure = info.get('pressure')
             status = info.get('status', '')
 
             if status == STATUS_VALID:
-                self.displays[name].config(text=f"{pressure:.2e}", foreground='black')
-                self.status_labels[name].config(text="CONNECTED", foreground='green')
+                self._set_value(name, f"{pressure:.2e}", _BLACK)
+                self._states[name] = _CONNECTED
 
             elif status == STATUS_UNDERRANGE:
-                self.displays[name].config(text="UNDERRANGE", foreground='orange')
-                self.status_labels[name].config(text="UNDERRANGE", foreground='orange')
+                self._set_value(name, _UNDERRANGE, _ORANGE)
+                self._states[name] = _UNDERRANGE
 
             elif status == STATUS_OVERRANGE:
-                self.displays[name].config(text="OVERRANGE", foreground='orange')
-                self.status_labels[name].config(text="OVERRANGE", foreground='orange')
+                self._set_value(name, _OVERRANGE, _ORANGE)
+                self._states[name] = _OVERRANGE
 
             elif status == STATUS_SENSOR_ERROR_NO_SUPPLY:
-                self.displays[name].config(text="NO SUPPLY", foreground='red')
-                self.status_labels[name].config(text="ERROR", foreground='red')
+                self._set_value(name, "NO SUPPLY", _RED)
+                self._states[name] = _ERROR
 
             elif status == STATUS_SENSOR_ERROR_PIRANI_DEFECTIVE:
-                self.displays[name].config(text="DEFECTIVE", foreground='red')
-                self.status_labels[name].config(text="ERROR", foreground='red')
+                self._set_value(name, "DEFECTIVE", _RED)
+                self._states[name] = _ERROR
 
             else:
-                self.displays[name].config(text="-.--e--", foreground='gray')
-                self.status_labels[name].config(text="DISCONNECTED", foreground='red')
+                self._set_value(name, "-.--e--", _GRAY)
+                self._states[name] = _DISCONNECTED
+
+        self._refresh_summary()
 
     def update_global_pressure_unit(self, new_unit):
         """Update the global pressure unit and labels."""
         self.global_pressure_unit = new_unit
-        if hasattr(self, 'unit_labels'):
-            for label in self.unit_labels.values():
-                label.config(text=new_unit)
+        for name in self.unit_labels:
+            self.set_unit(name, new_unit)
+
+    def set_unit(self, name, unit):
+        """
+        Set the unit text shown on a single FRG-702 tile.
+
+        Args:
+            name: FRG-702 sensor name
+            unit: unit string to display (e.g. 'mbar', 'Torr', 'Pa')
+        """
+        label = self.unit_labels.get(name)
+        # Unit text is tracked in Python so unchanged labels need no Tk call
+        if label is not None and self._units.get(name) != unit:
+            label.config(text=unit)
+            self._units[name] = unit
 
     def set_error(self, sensor_name, message="ERR"):
         """
@@ -352,22 +475,24 @@ class SensorPanel:
             message: Error message to display
         """
         if sensor_name in self.displays:
-            self.displays[sensor_name].config(text=message, foreground='red')
-            self.status_labels[sensor_name].config(text="ERROR", foreground='red')
+            self._set_value(sensor_name, message, _RED)
+            self._states[sensor_name] = _ERROR
+            self._refresh_summary()
 
     def clear_all(self):
         """Reset all displays to default state."""
         for name in self.displays:
             if name == 'PS_Voltage':
-                self.displays[name].config(text="--- V", foreground='black')
+                self._set_value(name, "--- V", _BLACK)
             elif name == 'PS_Current':
-                self.displays[name].config(text="--- A", foreground='black')
+                self._set_value(name, "--- A", _BLACK)
             elif name in self.frg702_names:
-                self.displays[name].config(text="-.--e--", foreground='black')
+                self._set_value(name, "-.--e--", _BLACK)
             else:
                 placeholder = "--.--" if self.precisions.get(name) == 2 else "--.-"
-                self.displays[name].config(text=placeholder, foreground='black')
-            self.status_labels[name].config(text="WAITING", foreground='gray')
+                self._set_value(name, placeholder, _BLACK)
+            self._states[name] = _WAITING
+        self._refresh_summary()
 
     def highlight(self, sensor_name, color='green'):
         """
@@ -379,7 +504,8 @@ class SensorPanel:
         """
         if sensor_name in self.displays:
             self.displays[sensor_name].config(foreground=color)
+            self._shown.pop(sensor_name, None)
 
     def get_sensor_names(self):
-        """Get list of sensor names in the panel."""
-        return list(self.displays.keys())
+        """Get the sensor names in the panel (cached tuple)."""
+        return self._cached_names
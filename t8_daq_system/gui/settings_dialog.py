@@ -7,8 +7,122 @@ interface with sensor configuration, hardware settings, and axis scales.
 All fields map directly to AppSettings attributes.
 """
 
+import re
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, colorchooser
+import types
+from tkinter import ttk
+
+# ttk styles live in the Tk interpreter, not the dialog, so they only need
+# to be configured the first time a SettingsDialog is opened.
+_styles_configured = False
+
+
+def _setup_styles():
+    """Configure the dialog's ttk styles once per process."""
+    global _styles_configured
+    if _styles_configured:
+        return
+    style = ttk.Style()
+    style.configure('Settings.TFrame', background='#f0f0f0')
+    _styles_configured = True
+
+
+def _parse_geometry(geometry):
+    """Split a Tk ``"WxH+X+Y"`` geometry string into ``(w, h, x, y)`` ints."""
+    size, x, y = geometry.split('+', 2)
+    w, h = size.split('x')
+    return int(w), int(h), int(x), int(y)
+
+
+# Keystroke validation for numeric entries.  Each pattern matches every
+# prefix of a valid number ("-", "1.", "1e-" ...) so a value can be typed
+# character by character; the full parse still happens on Save.
+_PARTIAL_INT_RE = re.compile(r'-?\d*')
+_PARTIAL_FLOAT_RE = re.compile(r'-?(\d+\.?\d*|\.\d*)?([eE][-+]?\d*)?')
+
+
+def _is_partial_int(text):
+    """Return True if *text* is empty or could still become a whole number."""
+    return _PARTIAL_INT_RE.fullmatch(text) is not None
+
+
+def _is_partial_float(text):
+    """Return True if *text* is empty or could still become a number."""
+    return _PARTIAL_FLOAT_RE.fullmatch(text) is not None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Declarative layouts for the plain label/field sections
+#
+# Each section is (heading or None, LabelFrame title, rows) and each row is
+#   ('combo', label, attribute, values)
+#   ('entry', label, attribute, width)
+#   ('bool',  label, attribute)
+# Sections with custom widgets (browse buttons, per-TC rows, colour pickers,
+# QMS capture) are still built by hand in their tab builders.
+# ──────────────────────────────────────────────────────────────────────────────
+
+_TC_SECTION = ("Thermocouple Configuration", "Thermocouple", (
+    ('combo', "Count:", "tc_count", ("0", "1", "2", "3", "4", "5", "6", "7")),
+    ('combo', "Unit:",  "tc_unit",  ("C", "F", "K")),
+))
+
+_FRG_SECTION = ("FRG702 Gauge Configuration", "FRG702", (
+    ('combo', "Count:",          "frg_count",     ("0", "1", "2")),
+    ('combo', "Pressure Unit:",  "p_unit",        ("mbar", "Torr", "Pa")),
+    ('combo', "Interface:",      "frg_interface", ("XGS600", "Analog")),
+    ('entry', "AIN Pins (CSV):", "frg_pins",      15),
+))
+
+_HARDWARE_SECTIONS = (
+    ("Data Acquisition", "Sampling Rates", (
+        ('combo', "Sample Rate (ms):",  "sample_rate_ms",
+         ("100", "200", "500", "1000", "2000")),
+        ('combo', "Display Rate (ms):", "display_rate_ms",
+         ("100", "250", "500", "1000")),
+    )),
+    ("Hardware Enable", "Device Enable/Disable", (
+        ('bool', "Enable Keysight Power Supply",    "ps_enabled"),
+        ('bool', "Enable XGS-600 Gauge Controller", "xgs_enabled"),
+    )),
+    ("XGS600 Controller", "XGS600 Settings", (
+        ('entry', "COM Port:",    "xgs600_port",     15),
+        ('entry', "Baudrate:",    "xgs600_baudrate", 15),
+        ('entry', "Timeout (s):", "xgs600_timeout",  15),
+        ('entry', "Address:",     "xgs600_address",  15),
+    )),
+    ("Turbo Pump", "Turbo Pump Settings", (
+        ('bool',  "Enabled:",              "turbo_pump_enabled"),
+        ('entry', "Start Delay (ms):",     "turbo_pump_start_delay_ms",      15),
+        ('entry', "Stop Delay (ms):",      "turbo_pump_stop_delay_ms",       15),
+        ('entry', "Min Restart Delay (s):", "turbo_pump_min_restart_delay_s", 15),
+    )),
+)
+
+_PP_DEFAULTS_SECTION = (None, "Default Ramp Parameters", (
+    ('entry', "Default Duration (s):",      "pp_default_ramp_duration", 15),
+    ('entry', "Default Start Voltage (V):", "pp_default_start_v",       15),
+    ('entry', "Default Current Limit (A):", "pp_default_current_a",     15),
+))
+
+_PID_SECTION = (None, "PID Gains (Temperature Ramp)", (
+    ('entry', "Proportional Gain (Kp):", "pid_kp",           12),
+    ('entry', "Integral Gain (Ki):",     "pid_ki",           12),
+    ('entry', "Derivative Gain (Kd):",   "pid_kd",           12),
+    ('entry', "Windup Limit (K·s):",     "pid_windup_limit", 12),
+    ('entry', "Max Output (V frac):",    "pid_output_max",   12),
+))
+
+_PS_DAC_VALUES = ("DAC0", "DAC1")
+_PS_AIN_VALUES = tuple(f"AIN{i}" for i in range(8))
+
+# Rows only; the Paths tab frame also carries a wiring note in row 0
+_PS_PIN_ROWS = (
+    ('combo', "Voltage Prog (DAC):", "ps_voltage_pin",         _PS_DAC_VALUES),
+    ('combo', "Current Prog (DAC):", "ps_current_pin",         _PS_DAC_VALUES),
+    ('combo', "Voltage Mon (AIN):",  "ps_voltage_monitor_pin", _PS_AIN_VALUES),
+    ('combo', "Current Mon (AIN):",  "ps_current_monitor_pin", _PS_AIN_VALUES),
+)
 
 
 class SettingsDialog(tk.Toplevel):
@@ -25,54 +139,161 @@ class SettingsDialog(tk.Toplevel):
         Called after a successful save so the caller can refresh the GUI.
     """
 
+    _WIDTH = 550
+    _HEIGHT = 900
+
     def __init__(self, parent, settings, on_save_callback=None):
         super().__init__(parent)
+        # Stay unmapped while the widgets are built so Tk lays the dialog
+        # out in one pass instead of redrawing after every pack/grid call.
+        self.withdraw()
         self.title("Settings")
-        self.geometry("550x900")
-        self.minsize(550, 900)
+        self.geometry(f"{self._WIDTH}x{self._HEIGHT}")
+        self.minsize(self._WIDTH, self._HEIGHT)
         self.resizable(True, True)
-        self.grab_set()
         self.transient(parent)
+        # The dialog is kept and re-shown by its owner, so closing the
+        # window only hides it, like Cancel.
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self._parent = parent
 
         self._settings = settings
         self._on_save = on_save_callback
         self._result_saved = False
 
+        # AppSettings attribute name → Tk variable (or, for string choices, the
+        # readonly Combobox itself), filled as widgets are built
+        self._vars = {}
         self._tc_name_vars = []
         self._tc_label_vars = []
 
+        # Tabs are built on first selection; see _ensure_tab_built()
+        self._tab_builders = {}
+        self._built_tabs = []
+
+        # Tk validatecommands for numeric entries, registered once and
+        # shared by every Entry of that type; see _numeric_entry_options()
+        self._numeric_vcmds = {
+            tk.IntVar: (self.register(_is_partial_int), '%P'),
+            tk.DoubleVar: (self.register(_is_partial_float), '%P'),
+        }
+
         self._build_widgets()
-        self._load_values()
+        self._present()
+
+    def show(self):
+        """Reload every built tab from AppSettings and show the dialog again.
 
-        self.update_idletasks()
-        px, py = parent.winfo_x(), parent.winfo_y()
-        pw, ph = parent.winfo_width(), parent.winfo_height()
-        w, h = self.winfo_width(), self.winfo_height()
+        Owners keep one SettingsDialog and call this instead of building a
+        new one, so the widget tree is only created on the first open.
+        """
+        self._result_saved = False
+        for _key, entry in self._built_tabs:
+            _tab, name, _builder, loader, _saver = entry
+            self._load_fields(name)
+            if loader is not None:
+                loader()
+        self._on_tab_changed()
+        self._present()
+
+    def _present(self):
+        """Centre the withdrawn dialog over its parent, map it and go modal."""
+        parent = self._parent
+        # No update_idletasks() here: forcing a full layout pass just to
+        # measure the window is the most expensive step of opening the
+        # dialog.  The requested size (or the fixed minimum when Tk has not
+        # computed one yet) is all centring needs.
+        # One winfo call instead of four separate Tk round trips
+        pw, ph, px, py = _parse_geometry(parent.winfo_geometry())
+        w = max(self.winfo_reqwidth(), self._WIDTH)
+        h = max(self.winfo_reqheight(), self._HEIGHT)
         self.geometry(f"+{px + (pw - w) // 2}+{py + (ph - h) // 2}")
+        self.deiconify()
+        # Go modal only once the dialog is built and visible, so the main
+        # window keeps servicing its own redraws during construction.
+        self.grab_set()
 
     def _build_widgets(self):
         """Create the tabbed interface."""
-        
-        style = ttk.Style()
-        style.configure('Settings.TFrame', background='#f0f0f0')
-        
+        _setup_styles()
+
         notebook = ttk.Notebook(self)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._notebook = notebook
+
+        # (label, _FIELDS key, padding, builder, extra loader, extra saver).
+        # Only the first tab is populated now; the rest are built the first
+        # time they are selected.
+        tabs = (
+            ("Sensors", 'sensors', 15, self._build_sensor_tab,
+             self._load_sensor_values, self._save_sensor_values),
+            ("Hardware", 'hardware', 15, self._build_hardware_tab, None, None),
+            ("Appearance", 'scales', 0, self._build_scales_tab,
+             self._load_scales_values, self._save_scales_values),
+            ("Paths & Resources", 'paths', 15, self._build_paths_tab, None, None),
+            ("Power Programmer", 'power_programmer', 15,
+             self._build_power_programmer_tab, None, None),
+            ("QMS Trigger", 'qms_trigger', 15, self._build_qms_trigger_tab, None, None),
+        )
+        keys = []
+        for text, name, padding, builder, loader, saver in tabs:
+            tab = ttk.Frame(notebook, padding=padding)
+            notebook.add(tab, text=text)
+            key = str(tab)
+            self._tab_builders[key] = (tab, name, builder, loader, saver)
+            keys.append(key)
 
-        self._build_sensor_tab(notebook)
-        self._build_hardware_tab(notebook)
-        self._build_scales_tab(notebook)
-        self._build_paths_tab(notebook)
-        self._build_power_programmer_tab(notebook)
-        self._build_qms_trigger_tab(notebook)
+        self._ensure_tab_built(keys[0])
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         self._build_button_frame()
 
-    def _build_power_programmer_tab(self, notebook):
-        """Tab for Power Programmer settings."""
-        tab = ttk.Frame(notebook, padding=15)
-        notebook.add(tab, text="Power Programmer")
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab if this is its first showing."""
+        self._rebuild_stale_appearance()
+        self._ensure_tab_built(self._notebook.select())
+
+    def _rebuild_stale_appearance(self):
+        """Rebuild the Appearance tab if the sensor counts no longer match it.
+
+        Its per-channel rows are sized from the counts when it is built.
+        Unsaved edits on the tab are read out first and put back on the new
+        rows; channels added by the new count start from their defaults.
+        """
+        for _key, entry in self._built_tabs:
+            tab, name, builder, loader, saver = entry
+            if name != 'scales':
+                continue
+            if (len(self._tc_style_combos) == self._pending_count('tc_count')
+                    and len(self._press_style_combos) == self._pending_count('frg_count')):
+                return
+            pending = types.SimpleNamespace()
+            saver(pending)
+            # Raw Tcl values, so a half-typed number survives as typed
+            scalars = {attr: self.getvar(str(self._vars[attr]))
+                       for attr, _var_cls in self._FIELDS[name]}
+            for child in tab.winfo_children():
+                child.destroy()
+            builder(tab)
+            for attr, value in scalars.items():
+                self._vars[attr].set(value)
+            loader(pending)
+            return
 
+    def _ensure_tab_built(self, key):
+        """Populate the tab identified by *key* and load its values (once)."""
+        entry = self._tab_builders.pop(key, None)
+        if entry is None:
+            return
+        tab, name, builder, loader, _saver = entry
+        builder(tab)
+        self._load_fields(name)
+        if loader is not None:
+            loader()
+        self._built_tabs.append((key, entry))
+
+    def _build_power_programmer_tab(self, tab):
+        """Tab for Power Programmer settings."""
         ttk.Label(tab, text="Power Programmer Configuration",
                  font=('Arial', 11, 'bold')).pack(anchor='w', pady=(0, 10))
 
@@ -84,47 +305,21 @@ class SettingsDialog(tk.Toplevel):
         input_frame.pack(fill=tk.X, pady=5)
 
         self._pp_profiles_folder_var = tk.StringVar()
+        self._vars['pp_profiles_folder'] = self._pp_profiles_folder_var
         ttk.Entry(input_frame, textvariable=self._pp_profiles_folder_var,
                  width=35).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(input_frame, text="Browse…",
                   command=self._browse_pp_profiles_folder).pack(side=tk.LEFT, padx=5)
 
-        # Default Values
-        defaults_frame = ttk.LabelFrame(tab, text="Default Ramp Parameters", padding=10)
-        defaults_frame.pack(fill=tk.X, pady=5)
-
-        self._create_entry_row(defaults_frame, "Default Duration (s):", "pp_default_ramp_duration", 
-                              width=15, row=0)
-        self._create_entry_row(defaults_frame, "Default Start Voltage (V):", "pp_default_start_v", 
-                              width=15, row=1)
-        self._create_entry_row(defaults_frame, "Default Current Limit (A):", "pp_default_current_a",
-                              width=15, row=2)
-
-        # PID Gains
-        pid_frame = ttk.LabelFrame(tab, text="PID Gains (Temperature Ramp)", padding=10)
-        pid_frame.pack(fill=tk.X, pady=5)
-
-        self._pid_kp_var = tk.StringVar()
-        self._pid_ki_var = tk.StringVar()
-        self._pid_kd_var = tk.StringVar()
-        self._pid_windup_var = tk.StringVar()
-        self._pid_output_max_var = tk.StringVar()
-
-        self._create_entry_row(pid_frame, "Proportional Gain (Kp):", None, width=12, row=0, var=self._pid_kp_var)
-        self._create_entry_row(pid_frame, "Integral Gain (Ki):", None, width=12, row=1, var=self._pid_ki_var)
-        self._create_entry_row(pid_frame, "Derivative Gain (Kd):", None, width=12, row=2, var=self._pid_kd_var)
-        self._create_entry_row(pid_frame, "Windup Limit (K·s):", None, width=12, row=3, var=self._pid_windup_var)
-        self._create_entry_row(pid_frame, "Max Output (V frac):", None, width=12, row=4, var=self._pid_output_max_var)
+        self._build_section(tab, _PP_DEFAULTS_SECTION)
+        pid_frame = self._build_section(tab, _PID_SECTION)
 
         ttk.Label(pid_frame, text="Note: History may override these if 3+ matching runs exist.",
                   font=('Arial', 8), foreground='gray').grid(
             row=5, column=0, columnspan=2, sticky='w', padx=5, pady=(2, 0))
 
-    def _build_qms_trigger_tab(self, notebook):
+    def _build_qms_trigger_tab(self, tab):
         """Tab for QMS Auto-Click configuration."""
-        tab = ttk.Frame(notebook, padding=15)
-        notebook.add(tab, text="QMS Trigger")
-
         ttk.Label(tab, text="QMS Auto-Click Configuration",
                   font=('Arial', 11, 'bold')).pack(anchor='w', pady=(0, 10))
 
@@ -139,24 +334,30 @@ class SettingsDialog(tk.Toplevel):
         # Enable toggle
         enable_frame = ttk.LabelFrame(tab, text="Enable", padding=10)
         enable_frame.pack(fill=tk.X, pady=5)
-        self._qms_auto_click_enabled_var = tk.BooleanVar()
+        enabled_var = tk.BooleanVar()
+        self._vars['qms_auto_click_enabled'] = enabled_var
         ttk.Checkbutton(enable_frame,
                         text="Enable QMS auto-click on confirmation",
-                        variable=self._qms_auto_click_enabled_var).pack(anchor='w')
+                        variable=enabled_var).pack(anchor='w')
 
         # Coordinates
         coord_frame = ttk.LabelFrame(tab, text="Click Location", padding=10)
         coord_frame.pack(fill=tk.X, pady=5)
 
-        self._qms_click_x_var = tk.StringVar(value="0")
-        self._qms_click_y_var = tk.StringVar(value="0")
+        self._qms_click_x_var = tk.IntVar(value=0)
+        self._qms_click_y_var = tk.IntVar(value=0)
+        self._vars['qms_auto_click_x'] = self._qms_click_x_var
+        self._vars['qms_auto_click_y'] = self._qms_click_y_var
 
         xy_row = ttk.Frame(coord_frame)
         xy_row.pack(fill=tk.X, pady=4)
         ttk.Label(xy_row, text="X:", width=4).pack(side=tk.LEFT)
-        ttk.Entry(xy_row, textvariable=self._qms_click_x_var, width=8).pack(side=tk.LEFT, padx=(0, 12))
+        int_opts = self._numeric_entry_options(tk.IntVar)
+        ttk.Entry(xy_row, textvariable=self._qms_click_x_var, width=8,
+                  **int_opts).pack(side=tk.LEFT, padx=(0, 12))
         ttk.Label(xy_row, text="Y:", width=4).pack(side=tk.LEFT)
-        ttk.Entry(xy_row, textvariable=self._qms_click_y_var, width=8).pack(side=tk.LEFT)
+        ttk.Entry(xy_row, textvariable=self._qms_click_y_var, width=8,
+                  **int_opts).pack(side=tk.LEFT)
 
         self._qms_capture_label = ttk.Label(coord_frame, text="", foreground='gray')
         self._qms_capture_label.pack(anchor='w', pady=(4, 0))
@@ -192,8 +393,8 @@ class SettingsDialog(tk.Toplevel):
             try:
                 import pyautogui
                 x, y = pyautogui.position()
-                self._qms_click_x_var.set(str(x))
-                self._qms_click_y_var.set(str(y))
+                self._qms_click_x_var.set(x)
+                self._qms_click_y_var.set(y)
                 self._qms_capture_label.config(
                     text=f"Captured: ({x}, {y})", foreground='green')
             except ImportError:
@@ -208,80 +409,55 @@ class SettingsDialog(tk.Toplevel):
         """Perform a test click at the configured coordinates."""
         try:
             import pyautogui
-            x = int(self._qms_click_x_var.get())
-            y = int(self._qms_click_y_var.get())
+            x = self._qms_click_x_var.get()
+            y = self._qms_click_y_var.get()
             pyautogui.click(x, y)
             self._qms_capture_label.config(text=f"Test click sent to ({x}, {y})",
                                             foreground='green')
         except ImportError:
-            messagebox.showerror("Missing Library",
-                                 "pyautogui not installed.\nRun: pip install pyautogui",
-                                 parent=self)
-        except ValueError:
-            messagebox.showerror("Invalid Coordinates",
-                                 "X and Y must be integers.", parent=self)
+            self._qms_capture_label.config(
+                text="pyautogui not installed. Run: pip install pyautogui",
+                foreground='red')
+        except (tk.TclError, ValueError):
+            self._qms_capture_label.config(text="X and Y must be integers.",
+                                            foreground='red')
         except Exception as e:
-            messagebox.showerror("Click Error", str(e), parent=self)
+            self._qms_capture_label.config(text=f"Click error: {e}", foreground='red')
 
-    def _build_sensor_tab(self, notebook):
+    def _build_sensor_tab(self, tab):
         """Tab for sensor configuration."""
-        tab = ttk.Frame(notebook, padding=15)
-        notebook.add(tab, text="Sensors")
-
-        ttk.Label(tab, text="Thermocouple Configuration",
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(0, 10))
-
-        tc_frame = ttk.LabelFrame(tab, text="Thermocouple", padding=10)
-        tc_frame.pack(fill=tk.X, pady=5)
-
-        self._create_option_row(tc_frame, "Count:", "tc_count",
-                               ["0", "1", "2", "3", "4", "5", "6", "7"], row=0)
-        self._create_option_row(tc_frame, "Unit:", "tc_unit",
-                               ["C", "F", "K"], row=1)
+        self._build_section(tab, _TC_SECTION, first=True)
 
         # Rebuild per-TC type/pin rows whenever the count changes
-        self._tc_type_vars = []
-        self._tc_pin_vars  = []
-        self._tc_count_var.trace_add('write', lambda *_: self._on_tc_count_change())
+        self._tc_type_combos = []
+        self._tc_pin_combos  = []
+        self._vars['tc_count'].trace_add('write', self._on_tc_count_change)
 
         self._tc_types_frame = ttk.LabelFrame(tab, text="Thermocouple Types", padding=10)
         self._tc_types_frame.pack(fill=tk.X, pady=5)
 
-        ttk.Label(tab, text="FRG702 Gauge Configuration", 
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(15, 10))
-
-        frg_frame = ttk.LabelFrame(tab, text="FRG702", padding=10)
-        frg_frame.pack(fill=tk.X, pady=5)
-
-        self._create_option_row(frg_frame, "Count:", "frg_count", 
-                               ["0", "1", "2"], row=0)
-        self._create_option_row(frg_frame, "Pressure Unit:", "p_unit", 
-                               ["mbar", "Torr", "Pa"], row=1)
-        self._create_option_row(frg_frame, "Interface:", "frg_interface",
-                               ["XGS600", "Analog"], row=2)
-        self._create_entry_row(frg_frame, "AIN Pins (CSV):", "frg_pins", 
-                               width=15, row=3)
+        self._build_section(tab, _FRG_SECTION)
 
-    _TC_TYPE_VALUES = ["K", "J", "T", "E", "R", "S", "B", "N", "C"]
-    _AIN_PIN_VALUES = ["0", "1", "2", "3", "4", "5", "6", "7"]
+    _TC_TYPE_VALUES = ("K", "J", "T", "E", "R", "S", "B", "N", "C")
+    _AIN_PIN_VALUES = ("0", "1", "2", "3", "4", "5", "6", "7")
 
-    def _on_tc_count_change(self):
-        """Called when the TC count combobox value changes."""
+    def _on_tc_count_change(self, *_):
+        """Trace callback for the TC count variable; rebuilds the per-TC rows."""
         try:
-            count = int(self._tc_count_var.get())
-        except ValueError:
+            count = self._vars['tc_count'].get()
+        except (tk.TclError, ValueError):
             return
         self._rebuild_tc_type_rows(count)
 
     def _rebuild_tc_type_rows(self, count):
         """Destroy and recreate the per-TC type and pin rows for *count* thermocouples."""
-        existing_types = [v.get() for v in self._tc_type_vars]
-        existing_pins  = [v.get() for v in self._tc_pin_vars]
+        existing_types = [v.get() for v in self._tc_type_combos]
+        existing_pins  = [v.get() for v in self._tc_pin_combos]
         for w in self._tc_types_frame.winfo_children():
             w.destroy()
         
-        self._tc_type_vars = []
-        self._tc_pin_vars  = []
+        self._tc_type_combos = []
+        self._tc_pin_combos  = []
 
         if count == 0:
             ttk.Label(self._tc_types_frame,
@@ -304,11 +480,6 @@ class SettingsDialog(tk.Toplevel):
             default_type = existing_types[i] if i < len(existing_types) else self._settings.tc_type
             default_pin  = existing_pins[i]  if i < len(existing_pins)  else str(i)
 
-            type_var = tk.StringVar(value=default_type)
-            pin_var  = tk.StringVar(value=default_pin)
-            self._tc_type_vars.append(type_var)
-            self._tc_pin_vars.append(pin_var)
-
             # Link name from Appearance tab if already built, otherwise use from settings
             if i < len(self._tc_name_vars):
                 name_var = self._tc_name_vars[i]
@@ -333,71 +504,24 @@ class SettingsDialog(tk.Toplevel):
             row_f = ttk.Frame(self._tc_types_frame)
             row_f.pack(fill=tk.X, pady=2)
             ttk.Label(row_f, textvariable=label_var, width=14).pack(side=tk.LEFT, padx=5)
-            ttk.Combobox(row_f, textvariable=type_var, values=self._TC_TYPE_VALUES,
-                         state='readonly', width=5).pack(side=tk.LEFT, padx=5)
-            ttk.Combobox(row_f, textvariable=pin_var, values=self._AIN_PIN_VALUES,
-                         state='readonly', width=4).pack(side=tk.LEFT, padx=5)
-
-    def _build_hardware_tab(self, notebook):
+            type_combo = ttk.Combobox(row_f, values=self._TC_TYPE_VALUES,
+                                      state='readonly', width=5)
+            type_combo.set(default_type)
+            type_combo.pack(side=tk.LEFT, padx=5)
+            pin_combo = ttk.Combobox(row_f, values=self._AIN_PIN_VALUES,
+                                     state='readonly', width=4)
+            pin_combo.set(default_pin)
+            pin_combo.pack(side=tk.LEFT, padx=5)
+            self._tc_type_combos.append(type_combo)
+            self._tc_pin_combos.append(pin_combo)
+
+    def _build_hardware_tab(self, tab):
         """Tab for hardware-specific settings."""
-        tab = ttk.Frame(notebook, padding=15)
-        notebook.add(tab, text="Hardware")
-
-        ttk.Label(tab, text="Data Acquisition", 
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(0, 10))
-
-        acq_frame = ttk.LabelFrame(tab, text="Sampling Rates", padding=10)
-        acq_frame.pack(fill=tk.X, pady=5)
-
-        self._create_option_row(acq_frame, "Sample Rate (ms):", "sample_rate_ms",
-                               ["100", "200", "500", "1000", "2000"], row=0)
-        self._create_option_row(acq_frame, "Display Rate (ms):", "display_rate_ms",
-                               ["100", "250", "500", "1000"], row=1)
-
-        ttk.Label(tab, text="Hardware Enable",
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(15, 10))
-
-        enable_frame = ttk.LabelFrame(tab, text="Device Enable/Disable", padding=10)
-        enable_frame.pack(fill=tk.X, pady=5)
-
-        self._ps_enabled_var = tk.BooleanVar()
-        ttk.Checkbutton(enable_frame, text="Enable Keysight Power Supply",
-                        variable=self._ps_enabled_var).pack(anchor='w', padx=5, pady=4)
-
-        self._xgs_enabled_var = tk.BooleanVar()
-        ttk.Checkbutton(enable_frame, text="Enable XGS-600 Gauge Controller",
-                        variable=self._xgs_enabled_var).pack(anchor='w', padx=5, pady=4)
-
-        ttk.Label(tab, text="XGS600 Controller",
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(15, 10))
-
-        xgs_frame = ttk.LabelFrame(tab, text="XGS600 Settings", padding=10)
-        xgs_frame.pack(fill=tk.X, pady=5)
+        for i, section in enumerate(_HARDWARE_SECTIONS):
+            self._build_section(tab, section, first=(i == 0))
 
-        self._create_entry_row(xgs_frame, "COM Port:", "xgs600_port", width=15, row=0)
-        self._create_entry_row(xgs_frame, "Baudrate:", "xgs600_baudrate", width=15, row=1)
-        self._create_entry_row(xgs_frame, "Timeout (s):", "xgs600_timeout", width=15, row=2)
-        self._create_entry_row(xgs_frame, "Address:", "xgs600_address", width=15, row=3)
-
-        ttk.Label(tab, text="Turbo Pump", 
-                 font=('Arial', 11, 'bold')).pack(anchor='w', pady=(15, 10))
-
-        pump_frame = ttk.LabelFrame(tab, text="Turbo Pump Settings", padding=10)
-        pump_frame.pack(fill=tk.X, pady=5)
-
-        self._create_bool_row(pump_frame, "Enabled:", "turbo_pump_enabled", row=0)
-        self._create_entry_row(pump_frame, "Start Delay (ms):", "turbo_pump_start_delay_ms", 
-                              width=15, row=1)
-        self._create_entry_row(pump_frame, "Stop Delay (ms):", "turbo_pump_stop_delay_ms", 
-                              width=15, row=2)
-        self._create_entry_row(pump_frame, "Min Restart Delay (s):", 
-                              "turbo_pump_min_restart_delay_s", width=15, row=3)
-
-    def _build_scales_tab(self, notebook):
+    def _build_scales_tab(self, tab):
         """Tab for axis scale and appearance configuration (scrollable)."""
-        tab = ttk.Frame(notebook, padding=0)
-        notebook.add(tab, text='Appearance')
-
         # Scrollable canvas
         canvas = tk.Canvas(tab, highlightthickness=0)
         scrollbar = ttk.Scrollbar(tab, orient='vertical', command=canvas.yview)
@@ -424,24 +548,23 @@ class SettingsDialog(tk.Toplevel):
         canvas.bind('<Destroy>', lambda e: canvas.unbind_all('<MouseWheel>'))
 
         # ── Global axis mode ─────────────────────────────────────────────
-        self._abs_scale_var = tk.BooleanVar()
+        abs_scale_var = tk.BooleanVar()
+        self._vars['use_absolute_scales'] = abs_scale_var
         ttk.Checkbutton(inner, text='Use Absolute Y-Axis Scales (uncheck = auto-scale)',
-                       variable=self._abs_scale_var).pack(anchor='w', pady=(0, 10))
+                       variable=abs_scale_var).pack(anchor='w', pady=(0, 10))
 
         # ── Build three sections ─────────────────────────────────────────
         # Initialize appearance variable holders before building sections
         self._tc_color_vars = []
         self._tc_color_btns = []
-        self._tc_style_vars = []
+        self._tc_style_combos = []
         self._tc_width_vars = []
         self._press_color_vars = []
         self._press_color_btns = []
-        self._press_style_vars = []
+        self._press_style_combos = []
         self._press_width_vars = []
         self._ps_v_color_var = '#d62728'
         self._ps_i_color_var = '#ff7f0e'
-        self._ps_v_style_var = tk.StringVar(value='solid')
-        self._ps_i_style_var = tk.StringVar(value='solid')
         self._ps_v_width_var = tk.StringVar(value='2')
         self._ps_i_width_var = tk.StringVar(value='2')
 
@@ -449,7 +572,12 @@ class SettingsDialog(tk.Toplevel):
         self._build_pressure_appearance_section(inner)
         self._build_ps_appearance_section(inner)
 
-    _STYLE_CHOICES = ['solid', 'dashed', 'dotted', 'dashdot']
+    _STYLE_CHOICES = ('solid', 'dashed', 'dotted', 'dashdot')
+
+    # Fallback plot colours, cycled per channel when none is stored
+    _TC_DEFAULT_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728',
+                          '#9467bd', '#8c564b', '#e377c2', '#7f7f7f')
+    _PRESS_DEFAULT_COLORS = ('#17becf', '#bcbd22', '#7f7f7f', '#e377c2')
 
     def _make_color_picker_btn(self, parent, initial_color, on_color_chosen):
         """Create a color picker button that shows the selected color as its background."""
@@ -457,6 +585,7 @@ class SettingsDialog(tk.Toplevel):
                         cursor='hand2')
 
         def _pick():
+            from tkinter import colorchooser
             result = colorchooser.askcolor(color=btn['bg'], parent=self)
             if result and result[1]:
                 new_color = result[1]
@@ -466,20 +595,27 @@ class SettingsDialog(tk.Toplevel):
         btn.configure(command=_pick)
         return btn
 
+    def _pending_count(self, attr):
+        """Return a sensor count as currently chosen on the Sensors tab.
+
+        The Sensors tab is always built first, so the Appearance tab can size
+        its per-channel rows from the not-yet-saved count instead of the one
+        stored in AppSettings (which would need a save and reopen to catch up).
+        """
+        try:
+            return self._vars[attr].get()
+        except (KeyError, tk.TclError, ValueError):
+            return getattr(self._settings, attr)
+
     def _build_tc_appearance_section(self, parent):
         """Build the Temperatures Plot section inside the Appearance tab."""
-        self._temp_min_var = tk.StringVar()
-        self._temp_max_var = tk.StringVar()
-
         frame = ttk.LabelFrame(parent, text='Temperatures Plot', padding=8)
         frame.pack(fill=tk.X, pady=5)
 
-        axis_frame = ttk.Frame(frame)
+        axis_frame = self._mkframe(frame, labelled=False)
         axis_frame.pack(fill=tk.X, pady=(0, 5))
-        self._create_entry_row(axis_frame, 'Temp Min (°C):', None, width=15, row=0,
-                               var=self._temp_min_var)
-        self._create_entry_row(axis_frame, 'Temp Max (°C):', None, width=15, row=1,
-                               var=self._temp_max_var)
+        self._create_entry_row(axis_frame, 'Temp Min (°C):', 'temp_range_min', width=15, row=0)
+        self._create_entry_row(axis_frame, 'Temp Max (°C):', 'temp_range_max', width=15, row=1)
 
         ttk.Label(frame, text='Per-Channel Appearance',
                   font=('Arial', 9, 'bold')).pack(anchor='w', pady=(5, 2))
@@ -491,16 +627,15 @@ class SettingsDialog(tk.Toplevel):
         ttk.Label(hdr, text='Style',   width=9, font=('Arial', 8, 'bold')).pack(side=tk.LEFT, padx=4)
         ttk.Label(hdr, text='Width',   width=6, font=('Arial', 8, 'bold')).pack(side=tk.LEFT, padx=4)
 
-        tc_count = self._settings.tc_count
+        tc_count = self._pending_count('tc_count')
         tc_pin_list  = self._settings.get_tc_pin_list(tc_count)
         tc_type_list = self._settings.get_tc_type_list(tc_count)
         tc_name_list = self._settings.get_tc_name_list(tc_count, tc_pin_list, tc_type_list)
-        default_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728',
-                          '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
+        default_colors = self._TC_DEFAULT_COLORS
 
         self._tc_color_vars = []
         self._tc_color_btns = []
-        self._tc_style_vars = []
+        self._tc_style_combos = []
         self._tc_width_vars = []
 
         for i in range(tc_count):
@@ -513,10 +648,8 @@ class SettingsDialog(tk.Toplevel):
                 name_var = tk.StringVar(value=tc_name_list[i])
                 self._tc_name_vars.append(name_var)
             
-            style_var = tk.StringVar(value='solid')
             width_var = tk.StringVar(value='2')
             self._tc_color_vars.append(color)
-            self._tc_style_vars.append(style_var)
             self._tc_width_vars.append(width_var)
 
             row = ttk.Frame(frame)
@@ -534,25 +667,19 @@ class SettingsDialog(tk.Toplevel):
             btn.pack(side=tk.LEFT, padx=4)
             self._tc_color_btns.append(btn)
 
-            ttk.Combobox(row, textvariable=style_var, values=self._STYLE_CHOICES,
-                         state='readonly', width=9).pack(side=tk.LEFT, padx=4)
+            self._tc_style_combos.append(self._make_style_combo(row))
             ttk.Spinbox(row, textvariable=width_var, from_=1, to=4, width=4).pack(
                 side=tk.LEFT, padx=4)
 
     def _build_pressure_appearance_section(self, parent):
         """Build the Pressures Plot section inside the Appearance tab."""
-        self._press_min_var = tk.StringVar()
-        self._press_max_var = tk.StringVar()
-
         frame = ttk.LabelFrame(parent, text='Pressures Plot', padding=8)
         frame.pack(fill=tk.X, pady=5)
 
-        axis_frame = ttk.Frame(frame)
+        axis_frame = self._mkframe(frame, labelled=False)
         axis_frame.pack(fill=tk.X, pady=(0, 5))
-        self._create_entry_row(axis_frame, 'Press Min:', None, width=15, row=0,
-                               var=self._press_min_var)
-        self._create_entry_row(axis_frame, 'Press Max:', None, width=15, row=1,
-                               var=self._press_max_var)
+        self._create_entry_row(axis_frame, 'Press Min:', 'press_range_min', width=15, row=0)
+        self._create_entry_row(axis_frame, 'Press Max:', 'press_range_max', width=15, row=1)
 
         ttk.Label(frame, text='Per-Gauge Appearance',
                   font=('Arial', 9, 'bold')).pack(anchor='w', pady=(5, 2))
@@ -564,25 +691,23 @@ class SettingsDialog(tk.Toplevel):
         ttk.Label(hdr, text='Style',  width=9, font=('Arial', 8, 'bold')).pack(side=tk.LEFT, padx=4)
         ttk.Label(hdr, text='Width',  width=6, font=('Arial', 8, 'bold')).pack(side=tk.LEFT, padx=4)
 
-        frg_count = self._settings.frg_count
+        frg_count = self._pending_count('frg_count')
         frg_pin_list  = self._settings.get_frg_pin_list(frg_count)
         frg_name_list = self._settings.get_frg_name_list(frg_count, self._settings.frg_interface, frg_pin_list)
-        default_colors = ['#17becf', '#bcbd22', '#7f7f7f', '#e377c2']
+        default_colors = self._PRESS_DEFAULT_COLORS
 
         self._press_name_vars  = []
         self._press_color_vars = []
         self._press_color_btns = []
-        self._press_style_vars = []
+        self._press_style_combos = []
         self._press_width_vars = []
 
         for i in range(frg_count):
             color = default_colors[i % len(default_colors)]
             name_var  = tk.StringVar(value=frg_name_list[i])
-            style_var = tk.StringVar(value='solid')
             width_var = tk.StringVar(value='2')
             self._press_name_vars.append(name_var)
             self._press_color_vars.append(color)
-            self._press_style_vars.append(style_var)
             self._press_width_vars.append(width_var)
 
             row = ttk.Frame(frame)
@@ -600,31 +725,21 @@ class SettingsDialog(tk.Toplevel):
             btn.pack(side=tk.LEFT, padx=4)
             self._press_color_btns.append(btn)
 
-            ttk.Combobox(row, textvariable=style_var, values=self._STYLE_CHOICES,
-                         state='readonly', width=9).pack(side=tk.LEFT, padx=4)
+            self._press_style_combos.append(self._make_style_combo(row))
             ttk.Spinbox(row, textvariable=width_var, from_=1, to=4, width=4).pack(
                 side=tk.LEFT, padx=4)
 
     def _build_ps_appearance_section(self, parent):
         """Build the Power Supply Plot section inside the Appearance tab."""
-        self._psv_min_var = tk.StringVar()
-        self._psv_max_var = tk.StringVar()
-        self._psi_min_var = tk.StringVar()
-        self._psi_max_var = tk.StringVar()
-
         frame = ttk.LabelFrame(parent, text='Power Supply Plot', padding=8)
         frame.pack(fill=tk.X, pady=5)
 
-        axis_frame = ttk.Frame(frame)
+        axis_frame = self._mkframe(frame, labelled=False)
         axis_frame.pack(fill=tk.X, pady=(0, 5))
-        self._create_entry_row(axis_frame, 'Voltage Min (V):', None, width=15, row=0,
-                               var=self._psv_min_var)
-        self._create_entry_row(axis_frame, 'Voltage Max (V):', None, width=15, row=1,
-                               var=self._psv_max_var)
-        self._create_entry_row(axis_frame, 'Current Min (A):', None, width=15, row=2,
-                               var=self._psi_min_var)
-        self._create_entry_row(axis_frame, 'Current Max (A):', None, width=15, row=3,
-                               var=self._psi_max_var)
+        self._create_entry_row(axis_frame, 'Voltage Min (V):', 'ps_v_range_min', width=15, row=0)
+        self._create_entry_row(axis_frame, 'Voltage Max (V):', 'ps_v_range_max', width=15, row=1)
+        self._create_entry_row(axis_frame, 'Current Min (A):', 'ps_i_range_min', width=15, row=2)
+        self._create_entry_row(axis_frame, 'Current Max (A):', 'ps_i_range_max', width=15, row=3)
 
         ttk.Label(frame, text='Line Appearance',
                   font=('Arial', 9, 'bold')).pack(anchor='w', pady=(5, 2))
@@ -646,8 +761,7 @@ class SettingsDialog(tk.Toplevel):
 
         self._ps_v_color_btn = self._make_color_picker_btn(v_row, self._ps_v_color_var, _set_v_color)
         self._ps_v_color_btn.pack(side=tk.LEFT, padx=4)
-        ttk.Combobox(v_row, textvariable=self._ps_v_style_var, values=self._STYLE_CHOICES,
-                     state='readonly', width=9).pack(side=tk.LEFT, padx=4)
+        self._ps_v_style_combo = self._make_style_combo(v_row)
         ttk.Spinbox(v_row, textvariable=self._ps_v_width_var, from_=1, to=4, width=4).pack(
             side=tk.LEFT, padx=4)
 
@@ -661,14 +775,13 @@ class SettingsDialog(tk.Toplevel):
 
         self._ps_i_color_btn = self._make_color_picker_btn(i_row, self._ps_i_color_var, _set_i_color)
         self._ps_i_color_btn.pack(side=tk.LEFT, padx=4)
-        ttk.Combobox(i_row, textvariable=self._ps_i_style_var, values=self._STYLE_CHOICES,
-                     state='readonly', width=9).pack(side=tk.LEFT, padx=4)
+        self._ps_i_style_combo = self._make_style_combo(i_row)
         ttk.Spinbox(i_row, textvariable=self._ps_i_width_var, from_=1, to=4, width=4).pack(
             side=tk.LEFT, padx=4)
 
         # Safety limits at bottom
         ttk.Separator(frame, orient='horizontal').pack(fill=tk.X, pady=6)
-        limit_frame = ttk.Frame(frame)
+        limit_frame = self._mkframe(frame, labelled=False)
         limit_frame.pack(fill=tk.X)
         self._create_entry_row(limit_frame, 'Voltage Limit (V):', 'ps_voltage_limit', width=15, row=0)
         self._create_entry_row(limit_frame, 'Current Limit (A):', 'ps_current_limit', width=15, row=1)
@@ -676,7 +789,6 @@ class SettingsDialog(tk.Toplevel):
         # ── Voltage Setpoint Overlay Appearance ────────────────────────────────
         s = self._settings
         self._pp_v_color_var = s.pp_voltage_color
-        self._pp_v_style_var = tk.StringVar(value=s.pp_voltage_line_style)
         self._pp_v_width_var = tk.StringVar(value=s.pp_voltage_line_width)
 
         pp_frame = ttk.LabelFrame(parent, text='Voltage Setpoint Overlay', padding=8)
@@ -702,19 +814,15 @@ class SettingsDialog(tk.Toplevel):
 
         self._pp_v_color_btn = self._make_color_picker_btn(ppv_row, self._pp_v_color_var, _set_ppv_color)
         self._pp_v_color_btn.pack(side=tk.LEFT, padx=4)
-        ttk.Combobox(ppv_row, textvariable=self._pp_v_style_var,
-                     values=self._STYLE_CHOICES, state='readonly', width=9).pack(side=tk.LEFT, padx=4)
+        self._pp_v_style_combo = self._make_style_combo(ppv_row, s.pp_voltage_line_style)
         ttk.Spinbox(ppv_row, textvariable=self._pp_v_width_var, from_=1, to=4, width=4).pack(side=tk.LEFT, padx=4)
 
-    def _build_paths_tab(self, notebook):
+    def _build_paths_tab(self, tab):
         """Tab for file paths and power supply configuration."""
-        tab = ttk.Frame(notebook, padding=15)
-        notebook.add(tab, text="Paths & Resources")
-
         ttk.Label(tab, text="Keysight N5700 — Analog Connection",
                  font=('Arial', 11, 'bold')).pack(anchor='w', pady=(0, 10))
 
-        ps_int_frame = ttk.LabelFrame(tab, text="Power Supply (J1 DB25 → Phoenix Contact → T8)", padding=10)
+        ps_int_frame = self._mkframe(tab, text="Power Supply (J1 DB25 → Phoenix Contact → T8)", padding=10)
         ps_int_frame.pack(fill=tk.X, pady=5)
 
         ttk.Label(ps_int_frame,
@@ -722,16 +830,7 @@ class SettingsDialog(tk.Toplevel):
                   font=('Arial', 8), foreground='#555555').grid(
                   row=0, column=0, columnspan=2, sticky='w', padx=5, pady=(0, 6))
 
-        _AIN_OPTS = [f"AIN{i}" for i in range(8)]
-        _DAC_OPTS = ["DAC0", "DAC1"]
-        self._create_option_row(ps_int_frame, "Voltage Prog (DAC):", "ps_voltage_pin",
-                               _DAC_OPTS, row=1)
-        self._create_option_row(ps_int_frame, "Current Prog (DAC):", "ps_current_pin",
-                               _DAC_OPTS, row=2)
-        self._create_option_row(ps_int_frame, "Voltage Mon (AIN):", "ps_voltage_monitor_pin",
-                               _AIN_OPTS, row=3)
-        self._create_option_row(ps_int_frame, "Current Mon (AIN):", "ps_current_monitor_pin",
-                               _AIN_OPTS, row=4)
+        self._build_rows(ps_int_frame, _PS_PIN_ROWS, start_row=1)
 
         ttk.Label(tab, text="Logging",
                  font=('Arial', 11, 'bold')).pack(anchor='w', pady=(15, 10))
@@ -743,6 +842,7 @@ class SettingsDialog(tk.Toplevel):
         log_input_frame.pack(fill=tk.X, pady=5)
 
         self._log_folder_var = tk.StringVar()
+        self._vars['log_folder'] = self._log_folder_var
         ttk.Entry(log_input_frame, textvariable=self._log_folder_var,
                  width=35).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(log_input_frame, text="Browse…",
@@ -754,51 +854,108 @@ class SettingsDialog(tk.Toplevel):
         startup_frame = ttk.LabelFrame(tab, text="Pre-flight Check", padding=10)
         startup_frame.pack(fill=tk.X, pady=5)
 
-        self._skip_preflight_check_var = tk.BooleanVar()
+        skip_var = tk.BooleanVar()
+        self._vars['skip_preflight_check'] = skip_var
         ttk.Checkbutton(startup_frame,
                         text="Skip wiring pre-flight check on Start",
-                        variable=self._skip_preflight_check_var).pack(anchor='w', padx=5, pady=5)
+                        variable=skip_var).pack(anchor='w', padx=5, pady=5)
 
         logging_behaviour_frame = ttk.LabelFrame(tab, text="Logging Behaviour", padding=10)
         logging_behaviour_frame.pack(fill=tk.X, pady=5)
 
-        self._reset_graph_on_start_logging_var = tk.BooleanVar()
+        reset_var = tk.BooleanVar()
+        self._vars['reset_graph_on_start_logging'] = reset_var
         ttk.Checkbutton(logging_behaviour_frame,
                         text="Reset graphs when starting a new log",
-                        variable=self._reset_graph_on_start_logging_var).pack(anchor='w', padx=5, pady=5)
+                        variable=reset_var).pack(anchor='w', padx=5, pady=5)
+
+    def _build_section(self, tab, section, first=False):
+        """Build one (heading, frame title, rows) section and return its frame."""
+        heading, title, rows = section
+        if heading:
+            ttk.Label(tab, text=heading, font=('Arial', 11, 'bold')).pack(
+                anchor='w', pady=(0 if first else 15, 10))
+        frame = self._mkframe(tab, text=title, padding=10)
+        frame.pack(fill=tk.X, pady=5)
+        self._build_rows(frame, rows)
+        return frame
+
+    def _build_rows(self, frame, rows, start_row=0):
+        """Grid a sequence of ``('combo'|'entry'|'bool', ...)`` rows into *frame*."""
+        for row, (kind, label, attr, *extra) in enumerate(rows, start_row):
+            if kind == 'combo':
+                self._create_option_row(frame, label, attr, extra[0], row=row)
+            elif kind == 'entry':
+                self._create_entry_row(frame, label, attr, width=extra[0], row=row)
+            else:
+                self._create_bool_row(frame, label, attr, row=row)
+
+    @staticmethod
+    def _mkframe(parent, labelled=True, **kw):
+        """Create a frame for label/field rows with its field column stretching.
+
+        The row helpers below grid into column 1 but no longer configure it,
+        so the stretch is set once per frame rather than once per row.
+        """
+        if labelled:
+            frame = ttk.LabelFrame(parent, **kw)
+        else:
+            frame = ttk.Frame(parent, **kw)
+        frame.columnconfigure(1, weight=1)
+        return frame
 
     def _create_option_row(self, parent, label, var_name, values, row):
         """Helper to create a label + combobox row."""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
         
-        if var_name:
-            var = tk.StringVar()
-            setattr(self, f'_{var_name}_var', var)
+        var_cls = self._FIELD_VAR_TYPES.get(var_name, tk.StringVar)
+        if var_cls is tk.StringVar:
+            # A readonly Combobox already holds its text and has get()/set(),
+            # so string fields register the widget itself instead of a Tcl var.
+            combo = ttk.Combobox(parent, values=values, state='readonly', width=20)
+            if var_name:
+                self._vars[var_name] = combo
         else:
-            var = None
-        
-        combo = ttk.Combobox(parent, textvariable=var, values=values, 
-                            state='readonly', width=20)
+            # Typed fields keep an IntVar for int parsing and the count traces
+            var = var_cls()
+            if var_name:
+                self._vars[var_name] = var
+            combo = ttk.Combobox(parent, textvariable=var, values=values,
+                                 state='readonly', width=20)
         combo.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-        parent.columnconfigure(1, weight=1)
 
-    def _create_entry_row(self, parent, label, var_name, width=20, row=0, var=None):
+    def _make_style_combo(self, parent, value='solid'):
+        """Pack a readonly line-style Combobox; its own get()/set() hold the value."""
+        combo = ttk.Combobox(parent, values=self._STYLE_CHOICES,
+                             state='readonly', width=9)
+        combo.set(value)
+        combo.pack(side=tk.LEFT, padx=4)
+        return combo
+
+    def _create_entry_row(self, parent, label, var_name, width=20, row=0):
         """Helper to create a label + entry row."""
         ttk.Label(parent, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
         
-        if var is None:
-            var = tk.StringVar()
-            if var_name:
-                setattr(self, f'_{var_name}_var', var)
+        var_cls = self._FIELD_VAR_TYPES.get(var_name, tk.StringVar)
+        var = var_cls()
+        if var_name:
+            self._vars[var_name] = var
         
-        entry = ttk.Entry(parent, textvariable=var, width=width)
+        entry = ttk.Entry(parent, textvariable=var, width=width,
+                          **self._numeric_entry_options(var_cls))
         entry.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-        parent.columnconfigure(1, weight=1)
+
+    def _numeric_entry_options(self, var_cls):
+        """Entry options that reject non-numeric keystrokes for IntVar/DoubleVar fields."""
+        vcmd = self._numeric_vcmds.get(var_cls)
+        if vcmd is None:
+            return {}
+        return {'validate': 'key', 'validatecommand': vcmd}
 
     def _create_bool_row(self, parent, label, var_name, row):
         """Helper to create a label + checkbox row."""
         var = tk.BooleanVar()
-        setattr(self, f'_{var_name}_var', var)
+        self._vars[var_name] = var
         ttk.Checkbutton(parent, text=label, variable=var).grid(
             row=row, column=0, columnspan=2, sticky='w', padx=5, pady=5)
 
@@ -808,57 +965,173 @@ class SettingsDialog(tk.Toplevel):
         btn_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
 
         # Pack from right to left so they appear in the bottom right corner
-        ttk.Button(btn_frame, text="Cancel", command=self.destroy,
+        ttk.Button(btn_frame, text="Cancel", command=self._on_cancel,
                   width=12).pack(side=tk.RIGHT, padx=5)
         ttk.Button(btn_frame, text="Save", command=self._on_save_click,
                   width=12).pack(side=tk.RIGHT, padx=5)
         ttk.Button(btn_frame, text="Apply", command=self._on_apply_click,
                   width=12).pack(side=tk.RIGHT, padx=5)
 
-    def _load_values(self):
-        """Populate widgets from AppSettings."""
+    # ──────────────────────────────────────────────────────────────────────
+    # Scalar fields, per tab: (AppSettings attribute, Tk variable class).
+    # Numeric fields use IntVar/DoubleVar so Tcl does the conversion; string
+    # values are stripped on save.  Every attribute listed here has an entry
+    # in ``self._vars``.
+    # ──────────────────────────────────────────────────────────────────────
+
+    _FIELDS = {
+        'sensors': (
+            ('tc_count',      tk.IntVar),
+            ('tc_unit',       tk.StringVar),
+            ('frg_count',     tk.IntVar),
+            ('p_unit',        tk.StringVar),
+            ('frg_interface', tk.StringVar),
+            ('frg_pins',      tk.StringVar),
+        ),
+        'hardware': (
+            ('sample_rate_ms',                 tk.IntVar),
+            ('display_rate_ms',                tk.IntVar),
+            ('ps_enabled',                     tk.BooleanVar),
+            ('xgs_enabled',                    tk.BooleanVar),
+            ('xgs600_port',                    tk.StringVar),
+            ('xgs600_baudrate',                tk.IntVar),
+            ('xgs600_timeout',                 tk.DoubleVar),
+            ('xgs600_address',                 tk.StringVar),
+            ('turbo_pump_enabled',             tk.BooleanVar),
+            ('turbo_pump_start_delay_ms',      tk.IntVar),
+            ('turbo_pump_stop_delay_ms',       tk.IntVar),
+            ('turbo_pump_min_restart_delay_s', tk.IntVar),
+        ),
+        'scales': (
+            ('use_absolute_scales', tk.BooleanVar),
+            ('temp_range_min',      tk.DoubleVar),
+            ('temp_range_max',      tk.DoubleVar),
+            ('press_range_min',     tk.DoubleVar),
+            ('press_range_max',     tk.DoubleVar),
+            ('ps_v_range_min',      tk.DoubleVar),
+            ('ps_v_range_max',      tk.DoubleVar),
+            ('ps_i_range_min',      tk.DoubleVar),
+            ('ps_i_range_max',      tk.DoubleVar),
+            ('ps_voltage_limit',    tk.DoubleVar),
+            ('ps_current_limit',    tk.DoubleVar),
+        ),
+        'paths': (
+            ('ps_voltage_pin',               tk.StringVar),
+            ('ps_current_pin',               tk.StringVar),
+            ('ps_voltage_monitor_pin',       tk.StringVar),
+            ('ps_current_monitor_pin',       tk.StringVar),
+            ('log_folder',                   tk.StringVar),
+            ('skip_preflight_check',         tk.BooleanVar),
+            ('reset_graph_on_start_logging', tk.BooleanVar),
+        ),
+        'power_programmer': (
+            ('pp_profiles_folder',       tk.StringVar),
+            ('pp_default_ramp_duration', tk.IntVar),
+            ('pp_default_start_v',       tk.DoubleVar),
+            ('pp_default_current_a',     tk.DoubleVar),
+            ('pid_kp',                   tk.DoubleVar),
+            ('pid_ki',                   tk.DoubleVar),
+            ('pid_kd',                   tk.DoubleVar),
+            ('pid_windup_limit',         tk.DoubleVar),
+            ('pid_output_max',           tk.DoubleVar),
+        ),
+        'qms_trigger': (
+            ('qms_auto_click_enabled', tk.BooleanVar),
+            ('qms_auto_click_x',       tk.IntVar),
+            ('qms_auto_click_y',       tk.IntVar),
+        ),
+    }
+
+    # attribute → Tk variable class, used when the row helpers create vars
+    _FIELD_VAR_TYPES = {attr: var_cls
+                        for fields in _FIELDS.values()
+                        for attr, var_cls in fields}
+
+    _VAR_TYPE_NAMES = {tk.IntVar: "a whole number", tk.DoubleVar: "a number"}
+
+    def _load_fields(self, tab_name):
+        """Populate one tab's scalar fields from AppSettings."""
+        # AppSettings keeps every field as a plain instance attribute, so
+        # its __dict__ can be indexed directly instead of via getattr().
+        values = vars(self._settings)
+        variables = self._vars
+        for attr, _var_cls in self._FIELDS[tab_name]:
+            var, value = variables[attr], values[attr]
+            # Only write vars whose value differs: every set() is a Tcl
+            # variable write plus its traces (tc_count rebuilds the TC rows).
+            try:
+                current = var.get()
+            except (tk.TclError, ValueError):
+                current = None
+            if current != value:
+                var.set(value)
+
+    def _parse_fields(self, tab_name, values, errors):
+        """Parse one tab's scalar fields into *values*.
+
+        Args:
+            tab_name: Key into ``_FIELDS``.
+            values: Dict that receives ``{attribute: parsed value}``.
+            errors: List that receives one message per field that fails to parse.
+        """
+        variables = self._vars
+        for attr, var_cls in self._FIELDS[tab_name]:
+            try:
+                value = variables[attr].get()
+            except (tk.TclError, ValueError):
+                # IntVar/DoubleVar raise when the entry text is not numeric
+                errors.append(f"{attr}: must be "
+                              f"{self._VAR_TYPE_NAMES.get(var_cls, 'a valid value')}")
+                continue
+            values[attr] = value.strip() if isinstance(value, str) else value
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Per-tab extras that do not fit the scalar table
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _load_sensor_values(self):
+        """Fill the per-TC type/pin rows and TC names from AppSettings."""
         s = self._settings
-
-        self._tc_count_var.set(str(s.tc_count))
-        self._tc_unit_var.set(s.tc_unit)
-        # Build per-TC type+pin rows from stored values
-        types = s.get_tc_type_list(s.tc_count)
+        tc_types = s.get_tc_type_list(s.tc_count)
         pins  = s.get_tc_pin_list(s.tc_count)
-        self._rebuild_tc_type_rows(s.tc_count)
-        for i, (type_var, pin_var) in enumerate(zip(self._tc_type_vars, self._tc_pin_vars)):
-            type_var.set(types[i])
-            pin_var.set(str(pins[i]))
-        self._frg_count_var.set(str(s.frg_count))
-        self._p_unit_var.set(s.p_unit)
-        self._sample_rate_ms_var.set(str(s.sample_rate_ms))
-        self._display_rate_ms_var.set(str(s.display_rate_ms))
-        self._xgs600_port_var.set(s.xgs600_port)
-        self._xgs600_baudrate_var.set(str(s.xgs600_baudrate))
-        self._xgs600_timeout_var.set(str(s.xgs600_timeout))
-        self._xgs600_address_var.set(s.xgs600_address)
-        self._turbo_pump_enabled_var.set(s.turbo_pump_enabled)
-        self._turbo_pump_start_delay_ms_var.set(str(s.turbo_pump_start_delay_ms))
-        self._turbo_pump_stop_delay_ms_var.set(str(s.turbo_pump_stop_delay_ms))
-        self._turbo_pump_min_restart_delay_s_var.set(str(s.turbo_pump_min_restart_delay_s))
-        self._abs_scale_var.set(s.use_absolute_scales)
-        self._temp_min_var.set(str(s.temp_range_min))
-        self._temp_max_var.set(str(s.temp_range_max))
-        self._press_min_var.set(repr(s.press_range_min))
-        self._press_max_var.set(repr(s.press_range_max))
-        self._psv_min_var.set(str(s.ps_v_range_min))
-        self._psv_max_var.set(str(s.ps_v_range_max))
-        self._psi_min_var.set(str(s.ps_i_range_min))
-        self._psi_max_var.set(str(s.ps_i_range_max))
-        self._ps_voltage_limit_var.set(str(s.ps_voltage_limit))
-        self._ps_current_limit_var.set(str(s.ps_current_limit))
+        # The rows themselves were already built by the tc_count trace when
+        # _load_fields('sensors') set the count.
+        for i, (type_combo, pin_combo) in enumerate(zip(self._tc_type_combos, self._tc_pin_combos)):
+            type_combo.set(tc_types[i])
+            pin_combo.set(str(pins[i]))
+
+        # The name vars outlive a cancelled showing, so reset them too
+        count = len(self._tc_name_vars)
+        names = s.get_tc_name_list(count, s.get_tc_pin_list(count), s.get_tc_type_list(count))
+        for i, name_var in enumerate(self._tc_name_vars):
+            name_var.set(names[i])
+            if i < len(self._tc_label_vars):
+                self._tc_label_vars[i].set(f"{names[i]}:")
+
+    def _load_scales_values(self, pending=None):
+        """Apply the stored per-channel names, colours, styles and widths.
+
+        Args:
+            pending: Values captured by _save_scales_values() to apply instead
+                     of the stored ones (see _rebuild_stale_appearance()).
+        """
+        s = self._settings if pending is None else pending
+
+        # ── Appearance: gauge names ───────────────────────────────────────
+        if pending is None:
+            count = len(self._press_name_vars)
+            frg_names = s.get_frg_name_list(count, s.frg_interface, s.get_frg_pin_list(count))
+        else:
+            frg_names = s.frg_names.split(',')
+        for name_var, name in zip(self._press_name_vars, frg_names):
+            name_var.set(name)
 
         # ── Appearance: TC colors/styles/widths ───────────────────────────
         tc_colors  = [c.strip() for c in (s.tc_colors or '').split(',')]
         tc_styles  = [x.strip() for x in (s.tc_line_style or '').split(',')]
         tc_widths  = [x.strip() for x in (s.tc_line_width or '').split(',')]
-        default_tc_colors = ['#1f77b4','#ff7f0e','#2ca02c','#d62728',
-                              '#9467bd','#8c564b','#e377c2','#7f7f7f']
-        for i, (svar, wvar) in enumerate(zip(self._tc_style_vars, self._tc_width_vars)):
+        default_tc_colors = self._TC_DEFAULT_COLORS
+        for i, (style_combo, wvar) in enumerate(zip(self._tc_style_combos, self._tc_width_vars)):
             color = tc_colors[i] if i < len(tc_colors) else default_tc_colors[i % len(default_tc_colors)]
             style = tc_styles[i] if i < len(tc_styles) else 'solid'
             width = tc_widths[i] if i < len(tc_widths) else '2'
@@ -868,15 +1141,15 @@ class SettingsDialog(tk.Toplevel):
                     self._tc_color_btns[i].configure(bg=color)
                 except Exception:
                     pass
-            svar.set(style)
+            style_combo.set(style)
             wvar.set(width)
 
         # ── Appearance: Pressure colors/styles/widths ─────────────────────
         press_colors = [c.strip() for c in (s.press_colors or '').split(',')]
         press_styles = [x.strip() for x in (s.press_line_style or '').split(',')]
         press_widths = [x.strip() for x in (s.press_line_width or '').split(',')]
-        default_press_colors = ['#17becf','#bcbd22','#7f7f7f','#e377c2']
-        for i, (svar, wvar) in enumerate(zip(self._press_style_vars, self._press_width_vars)):
+        default_press_colors = self._PRESS_DEFAULT_COLORS
+        for i, (style_combo, wvar) in enumerate(zip(self._press_style_combos, self._press_width_vars)):
             color = press_colors[i] if i < len(press_colors) else default_press_colors[i % len(default_press_colors)]
             style = press_styles[i] if i < len(press_styles) else 'solid'
             width = press_widths[i] if i < len(press_widths) else '2'
@@ -886,7 +1159,7 @@ class SettingsDialog(tk.Toplevel):
                     self._press_color_btns[i].configure(bg=color)
                 except Exception:
                     pass
-            svar.set(style)
+            style_combo.set(style)
             wvar.set(width)
 
         # ── Appearance: PS colors/styles/widths ───────────────────────────
@@ -897,8 +1170,8 @@ class SettingsDialog(tk.Toplevel):
             self._ps_i_color_btn.configure(bg=s.ps_current_color)
         except Exception:
             pass
-        self._ps_v_style_var.set(s.ps_voltage_line_style)
-        self._ps_i_style_var.set(s.ps_current_line_style)
+        self._ps_v_style_combo.set(s.ps_voltage_line_style)
+        self._ps_i_style_combo.set(s.ps_current_line_style)
         self._ps_v_width_var.set(s.ps_voltage_line_width)
         self._ps_i_width_var.set(s.ps_current_line_width)
 
@@ -908,118 +1181,66 @@ class SettingsDialog(tk.Toplevel):
             self._pp_v_color_btn.configure(bg=s.pp_voltage_color)
         except Exception:
             pass
-        self._pp_v_style_var.set(s.pp_voltage_line_style)
+        self._pp_v_style_combo.set(s.pp_voltage_line_style)
         self._pp_v_width_var.set(s.pp_voltage_line_width)
 
-        self._log_folder_var.set(s.log_folder)
-        self._frg_interface_var.set(s.frg_interface)
-        self._frg_pins_var.set(s.frg_pins)
-        self._ps_voltage_pin_var.set(s.ps_voltage_pin)
-        self._ps_current_pin_var.set(s.ps_current_pin)
-        self._ps_voltage_monitor_pin_var.set(s.ps_voltage_monitor_pin)
-        self._ps_current_monitor_pin_var.set(s.ps_current_monitor_pin)
-        self._skip_preflight_check_var.set(s.skip_preflight_check)
-        self._reset_graph_on_start_logging_var.set(s.reset_graph_on_start_logging)
-        self._ps_enabled_var.set(s.ps_enabled)
-        self._xgs_enabled_var.set(s.xgs_enabled)
-        self._pp_profiles_folder_var.set(s.pp_profiles_folder)
-        self._pp_default_ramp_duration_var.set(str(s.pp_default_ramp_duration))
-        self._pp_default_start_v_var.set(str(s.pp_default_start_v))
-        self._pp_default_current_a_var.set(str(s.pp_default_current_a))
-        self._pid_kp_var.set(str(s.pid_kp))
-        self._pid_ki_var.set(str(s.pid_ki))
-        self._pid_kd_var.set(str(s.pid_kd))
-        self._pid_windup_var.set(str(s.pid_windup_limit))
-        self._pid_output_max_var.set(str(s.pid_output_max))
-
-        # QMS Auto-Click
-        self._qms_auto_click_enabled_var.set(s.qms_auto_click_enabled)
-        self._qms_click_x_var.set(str(s.qms_auto_click_x))
-        self._qms_click_y_var.set(str(s.qms_auto_click_y))
+    def _save_sensor_values(self, s):
+        """Write the per-TC type/pin rows and TC names back to AppSettings."""
+        s.tc_types = ",".join(v.get() for v in self._tc_type_combos)
+        s.tc_pins  = ",".join(v.get() for v in self._tc_pin_combos)
+        s.tc_type = self._tc_type_combos[0].get() if self._tc_type_combos else s.tc_type
+        # TC name vars are shared with the Appearance tab but always exist
+        # once the Sensors tab is built, so they are saved here.
+        s.tc_names = ','.join(v.get() for v in self._tc_name_vars)
+
+    def _save_scales_values(self, s):
+        """Write the per-channel appearance settings back to AppSettings."""
+        s.frg_names = ','.join(v.get() for v in self._press_name_vars)
+        s.tc_colors = ','.join(self._tc_color_vars)
+        s.tc_line_style = ','.join(v.get() for v in self._tc_style_combos)
+        s.tc_line_width = ','.join(v.get() for v in self._tc_width_vars)
+        s.press_colors = ','.join(self._press_color_vars)
+        s.press_line_style = ','.join(v.get() for v in self._press_style_combos)
+        s.press_line_width = ','.join(v.get() for v in self._press_width_vars)
+        s.ps_voltage_color = self._ps_v_color_var
+        s.ps_current_color = self._ps_i_color_var
+        s.ps_voltage_line_style = self._ps_v_style_combo.get()
+        s.ps_current_line_style = self._ps_i_style_combo.get()
+        s.ps_voltage_line_width = self._ps_v_width_var.get()
+        s.ps_current_line_width = self._ps_i_width_var.get()
+        s.pp_voltage_color      = self._pp_v_color_var
+        s.pp_voltage_line_style = self._pp_v_style_combo.get()
+        s.pp_voltage_line_width = self._pp_v_width_var.get()
 
     def _save_settings_from_gui(self):
-        """Internal helper to read all GUI vars and write to AppSettings."""
+        """Internal helper to read the built tabs' vars and write to AppSettings."""
         s = self._settings
-        try:
-            s.tc_count = int(self._tc_count_var.get())
-            s.tc_types = ",".join(v.get() for v in self._tc_type_vars)
-            s.tc_pins  = ",".join(v.get() for v in self._tc_pin_vars)
-            s.tc_type = self._tc_type_vars[0].get() if self._tc_type_vars else s.tc_type
-            s.tc_unit = self._tc_unit_var.get()
-            s.frg_count = int(self._frg_count_var.get())
-            s.p_unit = self._p_unit_var.get()
-            s.sample_rate_ms = int(self._sample_rate_ms_var.get())
-            s.display_rate_ms = int(self._display_rate_ms_var.get())
-            s.xgs600_port = self._xgs600_port_var.get().strip()
-            s.xgs600_baudrate = int(self._xgs600_baudrate_var.get())
-            s.xgs600_timeout = float(self._xgs600_timeout_var.get())
-            s.xgs600_address = self._xgs600_address_var.get().strip()
-            s.turbo_pump_enabled = self._turbo_pump_enabled_var.get()
-            s.turbo_pump_start_delay_ms = int(self._turbo_pump_start_delay_ms_var.get())
-            s.turbo_pump_stop_delay_ms = int(self._turbo_pump_stop_delay_ms_var.get())
-            s.turbo_pump_min_restart_delay_s = int(self._turbo_pump_min_restart_delay_s_var.get())
-            s.use_absolute_scales = self._abs_scale_var.get()
-            s.temp_range_min = float(self._temp_min_var.get())
-            s.temp_range_max = float(self._temp_max_var.get())
-            s.press_range_min = float(self._press_min_var.get())
-            s.press_range_max = float(self._press_max_var.get())
-            s.ps_v_range_min = float(self._psv_min_var.get())
-            s.ps_v_range_max = float(self._psv_max_var.get())
-            s.ps_i_range_min = float(self._psi_min_var.get())
-            s.ps_i_range_max = float(self._psi_max_var.get())
-            s.ps_voltage_limit = float(self._ps_voltage_limit_var.get())
-            s.ps_current_limit = float(self._ps_current_limit_var.get())
-
-            # ── Appearance settings ───────────────────────────────────────
-            s.tc_names  = ','.join(v.get() for v in self._tc_name_vars)
-            s.frg_names = ','.join(v.get() for v in self._press_name_vars)
-            s.tc_colors = ','.join(self._tc_color_vars)
-            s.tc_line_style = ','.join(v.get() for v in self._tc_style_vars)
-            s.tc_line_width = ','.join(v.get() for v in self._tc_width_vars)
-            s.press_colors = ','.join(self._press_color_vars)
-            s.press_line_style = ','.join(v.get() for v in self._press_style_vars)
-            s.press_line_width = ','.join(v.get() for v in self._press_width_vars)
-            s.ps_voltage_color = self._ps_v_color_var
-            s.ps_current_color = self._ps_i_color_var
-            s.ps_voltage_line_style = self._ps_v_style_var.get()
-            s.ps_current_line_style = self._ps_i_style_var.get()
-            s.ps_voltage_line_width = self._ps_v_width_var.get()
-            s.ps_current_line_width = self._ps_i_width_var.get()
-            s.pp_voltage_color      = self._pp_v_color_var
-            s.pp_voltage_line_style = self._pp_v_style_var.get()
-            s.pp_voltage_line_width = self._pp_v_width_var.get()
-
-            s.log_folder = self._log_folder_var.get().strip()
-            s.frg_interface = self._frg_interface_var.get()
-            s.frg_pins = self._frg_pins_var.get().strip()
-            s.ps_interface = "Analog"
-            s.ps_voltage_pin = self._ps_voltage_pin_var.get().strip()
-            s.ps_current_pin = self._ps_current_pin_var.get().strip()
-            s.ps_voltage_monitor_pin = self._ps_voltage_monitor_pin_var.get().strip()
-            s.ps_current_monitor_pin = self._ps_current_monitor_pin_var.get().strip()
-            s.skip_preflight_check = self._skip_preflight_check_var.get()
-            s.reset_graph_on_start_logging = self._reset_graph_on_start_logging_var.get()
-            s.ps_enabled = self._ps_enabled_var.get()
-            s.xgs_enabled = self._xgs_enabled_var.get()
-            s.pp_profiles_folder = self._pp_profiles_folder_var.get().strip()
-            s.pp_default_ramp_duration = int(self._pp_default_ramp_duration_var.get())
-            s.pp_default_start_v = float(self._pp_default_start_v_var.get())
-            s.pp_default_current_a = float(self._pp_default_current_a_var.get())
-            s.pid_kp = float(self._pid_kp_var.get())
-            s.pid_ki = float(self._pid_ki_var.get())
-            s.pid_kd = float(self._pid_kd_var.get())
-            s.pid_windup_limit = float(self._pid_windup_var.get())
-            s.pid_output_max = float(self._pid_output_max_var.get())
-            # QMS Auto-Click
-            s.qms_auto_click_enabled = self._qms_auto_click_enabled_var.get()
-            s.qms_auto_click_x = int(self._qms_click_x_var.get())
-            s.qms_auto_click_y = int(self._qms_click_y_var.get())
-        except ValueError as exc:
+
+        # Parse every field first so a bad entry leaves AppSettings untouched
+        # and the user sees all invalid fields at once.
+        values, errors = {}, []
+        for _key, entry in self._built_tabs:
+            self._parse_fields(entry[1], values, errors)
+        if errors:
+            from tkinter import messagebox
             messagebox.showerror("Invalid Value",
-                                f"Please check your entries:\n{exc}", parent=self)
+                                 "Please check your entries:\n" + "\n".join(errors),
+                                 parent=self)
             return False
 
-        s.save()
+        before = dict(vars(s))
+        for attr, value in values.items():
+            setattr(s, attr, value)
+        for _key, entry in self._built_tabs:
+            saver = entry[4]
+            if saver is not None:
+                saver(s)
+        s.ps_interface = "Analog"
+
+        # Write only the fields that were edited; none means no registry I/O
+        changed = [k for k, v in vars(s).items() if before.get(k) != v]
+        if changed:
+            s.save(changed)
         self._result_saved = True
 
         if callable(self._on_save):
@@ -1032,7 +1253,16 @@ class SettingsDialog(tk.Toplevel):
     def _on_save_click(self):
         """Validate and save all settings, then close."""
         if self._save_settings_from_gui():
-            self.destroy()
+            self._close()
+
+    def _on_cancel(self):
+        """Discard changes and close."""
+        self._close()
+
+    def _close(self):
+        """Release the grab and hide the dialog; show() brings it back."""
+        self.grab_release()
+        self.withdraw()
 
     def _on_apply_click(self):
         """Validate and save settings without closing."""
@@ -1040,6 +1270,7 @@ class SettingsDialog(tk.Toplevel):
 
     def _browse_pp_profiles_folder(self):
         """Open folder browser dialog for profiles."""
+        from tkinter import filedialog
         folder = filedialog.askdirectory(
             parent=self,
             title="Select Profiles Folder",
@@ -1050,6 +1281,7 @@ class SettingsDialog(tk.Toplevel):
 
     def _browse_log_folder(self):
         """Open folder browser dialog."""
+        from tkinter import filedialog
         folder = filedialog.askdirectory(
             parent=self,
             title="Select Log Folder",
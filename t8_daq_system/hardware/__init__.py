@@ -1 +1,36 @@
-"""Hardware layer for LabJack T8, XGS-600 controller, and Keysight power supply communication."""
+"""Hardware layer for LabJack T8, XGS-600 controller, and Keysight power supply communication.
+
+The driver classes are re-exported lazily: ``from t8_daq_system.hardware
+import XGS600Controller`` imports only that module, so the LJM native
+library is not loaded until a LabJack-backed class is first referenced.
+"""
+
+import importlib
+
+# public name → submodule that defines it
+_EXPORTS = {
+    'LabJackConnection':        'labjack_connection',
+    'ThermocoupleReader':       'thermocouple_reader',
+    'FRG702Reader':             'frg702_reader',
+    'FRG702AnalogReader':       'frg702_reader',
+    'XGS600Controller':         'xgs600_controller',
+    'KeysightAnalogController': 'keysight_analog_controller',
+    'CombinedReader':           'combined_reader',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
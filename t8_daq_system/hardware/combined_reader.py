@@ -0,0 +1,134 @@
+"""
+combined_reader.py
+PURPOSE: Read every LabJack-backed sensor in a single LJM transaction
+FLOW: Concatenate each reader's register names -> resolve to addresses once ->
+      one eReadAddresses per cycle -> slice the results back to each
+      reader's converter
+"""
+
+from labjack import ljm
+
+from t8_daq_system.utils.error_log import ErrorLog
+from t8_daq_system.hardware.thermocouple_reader import ThermocoupleReader
+from t8_daq_system.hardware.frg702_reader import FRG702AnalogReader
+from t8_daq_system.hardware.keysight_analog_controller import KeysightAnalogController
+
+
+class CombinedReader:
+    """
+    Fuses the per-cycle T8 reads of the thermocouple reader, the analog
+    FRG-702 reader and the analog power supply controller into one
+    eReadAddresses call.
+
+    Only readers that talk to the T8 take part in the fused read. Any other
+    attached reader (the serial XGS-600 FRG-702 reader, a practice-mode
+    stand-in) is read through its own methods in the same call. Each reader
+    still owns its register list and its conversion; this class only
+    batches the I/O.
+    """
+
+    def __init__(self, tc_reader=None, frg702_reader=None, ps_controller=None):
+        """
+        Args:
+            tc_reader: Thermocouple reader (or None)
+            frg702_reader: FRG-702 reader (or None)
+            ps_controller: Power supply controller (or None)
+        """
+        self.tc_reader = tc_reader
+        self.frg702_reader = frg702_reader
+        self.ps_controller = ps_controller
+        # The readers whose registers go into the fused read
+        self._fused = (
+            tc_reader if isinstance(tc_reader, ThermocoupleReader) else None,
+            frg702_reader if isinstance(frg702_reader, FRG702AnalogReader) else None,
+            ps_controller if isinstance(ps_controller, KeysightAnalogController) else None,
+        )
+        # Register names of the last read and their (addresses, data types)
+        # from ljm.namesToAddresses(); re-resolved only when a reader's
+        # register list changes
+        self._names = None
+        self._addresses = None
+        self._errors = ErrorLog(__name__)
+
+    def read_all(self):
+        """
+        Read all attached readers.
+
+        Returns:
+            (tc_readings, raw_voltages, frg702_details, ps_readings) in the
+            same formats as ThermocoupleReader.read_all()/read_raw_voltages(),
+            FRG702AnalogReader.read_all_with_status() and
+            KeysightAnalogController.get_readings(); parts whose reader is
+            not attached are empty dicts
+        """
+        tc, frg, ps = self._fused
+        handle = next((r.handle for r in self._fused if r is not None), None)
+        if handle is None or any(r is not None and r.handle != handle for r in self._fused):
+            return self._read_separately()
+
+        names = []
+        if tc is not None:
+            names += tc._read_names
+            names += tc._raw_names
+        if frg is not None:
+            names += frg._read_names
+        if ps is not None:
+            names += ps._monitor_names
+        if not names:
+            return self._read_separately()
+
+        try:
+            if names != self._names:
+                self._addresses = ljm.namesToAddresses(len(names), names)
+                self._names = names
+            addresses, data_types = self._addresses
+            values = ljm.eReadAddresses(handle, len(names), addresses, data_types)
+        except Exception as e:
+            # Anything the per-reader path would have survived (a bad
+            # handle, an unexpected wrapper error) must not end the cycle
+            self._errors.error("Combined sensor read (reading readers separately)", e)
+            return self._read_separately()
+
+        tc_readings, raw_voltages, frg702_details, ps_readings = {}, {}, {}, {}
+        pos = 0
+        if tc is not None:
+            n = len(tc._read_names)
+            tc_readings = tc._temperatures_from(values[pos:pos + n])
+            pos += n
+            n = len(tc._raw_names)
+            raw_voltages = tc._raw_voltages_from(values[pos:pos + n])
+            pos += n
+        elif self.tc_reader is not None:
+            tc_readings, raw_voltages = self._read_tc()
+        if frg is not None:
+            n = len(frg._read_names)
+            if n:
+                frg702_details = frg._details_from(values[pos:pos + n])
+            pos += n
+        elif self.frg702_reader is not None:
+            frg702_details = self.frg702_reader.read_all_with_status()
+        if ps is not None:
+            ps_readings = ps._readings_from(*values[pos:pos + 3])
+        elif self.ps_controller is not None:
+            ps_readings = self.ps_controller.get_readings()
+
+        return tc_readings, raw_voltages, frg702_details, ps_readings
+
+    def _read_tc(self):
+        """Read the thermocouple reader on its own: (tc_readings, raw_voltages)."""
+        tc_readings = self.tc_reader.read_all()
+        # Raw voltages are diagnostic only; never let them cost a cycle
+        try:
+            raw_voltages = self.tc_reader.read_raw_voltages()
+        except Exception as e:
+            self._errors.error("Raw voltage read", e)
+            raw_voltages = {}
+        return tc_readings, raw_voltages
+
+    def _read_separately(self):
+        """Fallback: one transaction per reader, using each reader's own error handling."""
+        frg, ps = self.frg702_reader, self.ps_controller
+        tc_readings, raw_voltages = self._read_tc() if self.tc_reader is not None else ({}, {})
+        frg702_details = frg.read_all_with_status() if frg is not None else {}
+        ps_readings = ps.get_readings() if ps is not None else {}
+        return tc_readings, raw_voltages, frg702_details, ps_readings
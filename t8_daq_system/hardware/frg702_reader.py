@@ -5,6 +5,14 @@ KEY CONCEPT: XGS-600 provides digital pressure readings over RS-232, eliminating
 analog voltage conversion. Pressure values are read directly from the controller.
 """
 
+import logging
+from math import exp, log
+
+import numpy as np
+
+from t8_daq_system.utils.error_log import ErrorLog
+
+logger = logging.getLogger(__name__)
 
 DEBUG_PRESSURE = False   # Set False to silence once working correctly
 
@@ -15,6 +23,12 @@ UNIT_CONVERSIONS = {
     'Pa': 100.0,
 }
 
+# FRG-702 analog characteristic p = 10^(1.667*U - 11.33) [mbar], rewritten
+# as exp(_V2P_SLOPE*U - _V2P_OFFSET) so the hot path is a single exp()
+_LN10 = log(10.0)
+_V2P_SLOPE = 1.667 * _LN10
+_V2P_OFFSET = 11.33 * _LN10
+
 # Status constants
 STATUS_VALID = 'valid'
 STATUS_UNDERRANGE = 'underrange'
@@ -22,6 +36,17 @@ STATUS_OVERRANGE = 'overrange'
 STATUS_SENSOR_ERROR_NO_SUPPLY = 'sensor_error_no_supply'
 STATUS_SENSOR_ERROR_PIRANI_DEFECTIVE = 'sensor_error_pirani_defective'
 
+# Status for each np.select() branch in voltages_to_pressures_mbar(),
+# ordered by rising voltage band
+_STATUS_BY_CODE = (
+    STATUS_SENSOR_ERROR_NO_SUPPLY,
+    STATUS_UNDERRANGE,
+    STATUS_VALID,
+    STATUS_OVERRANGE,
+    STATUS_SENSOR_ERROR_PIRANI_DEFECTIVE,
+)
+_CODE_VALID = 2
+
 # Operating mode constants
 MODE_PIRANI_ONLY = 'Pirani'
 MODE_COMBINED = 'Combined'
@@ -43,6 +68,47 @@ class FRG702Reader:
         self.gauges = frg702_config_list
         self._device_unit = None  # Cached unit setting from XGS-600 hardware
 
+    @property
+    def gauges(self):
+        """Gauge config list; assigning it rebuilds the enabled/name/dump caches."""
+        return self._gauges
+
+    @gauges.setter
+    def gauges(self, config_list):
+        self._gauges = config_list
+        self._enabled = [g for g in config_list if g.get('enabled', True)]
+        self._by_name = {g['name']: g for g in self._enabled}
+        # Whether any gauge is answered by the 0F dump; if none is, the dump
+        # would be a wasted serial transaction every poll
+        self._uses_dump = any(_dump_slot(g.get('sensor_code', '')) is not None
+                              for g in self._enabled)
+        self._factors_unit = None  # Device unit the factor cache was built for
+
+    def set_output_unit(self, unit):
+        """
+        Switch every gauge to a new target unit.
+
+        Use this rather than editing gauge['units'] in place so the cached
+        per-gauge conversion factors are rebuilt.
+
+        Args:
+            unit: Target unit ('mbar', 'Torr', 'Pa')
+        """
+        for gauge in self._gauges:
+            gauge['units'] = unit
+        self._factors_unit = None
+
+    def _conversion_factors(self, device_unit):
+        """Return [(gauge, target_unit, factor)], rebuilt only when units change."""
+        if self._factors_unit != device_unit:
+            self._factors = [
+                (g, g.get('units', 'mbar'),
+                 self.conversion_factor(device_unit, g.get('units', 'mbar')))
+                for g in self._enabled
+            ]
+            self._factors_unit = device_unit
+        return self._factors
+
     def _refresh_device_unit(self):
         """Query the XGS-600 for its current front-panel unit setting."""
         if self.controller and self.controller.is_connected():
@@ -51,6 +117,18 @@ class FRG702Reader:
                 self._device_unit = unit
         return self._device_unit
 
+    @staticmethod
+    def conversion_factor(from_unit, to_unit):
+        """
+        Return the multiplier that converts a pressure from one unit to another.
+
+        Callers converting many samples look this up once and multiply,
+        instead of calling convert_pressure() per value.
+        """
+        if from_unit == to_unit:
+            return 1.0
+        return UNIT_CONVERSIONS.get(to_unit, 1.0) / UNIT_CONVERSIONS.get(from_unit, 1.0)
+
     @staticmethod
     def convert_pressure(value, from_unit, to_unit):
         """
@@ -97,8 +175,40 @@ class FRG702Reader:
             return None, STATUS_OVERRANGE
 
         # Valid range: 1.82V to 8.6V (5e-9 to 1000 mbar)
-        pressure = 10 ** (1.667 * voltage - 11.33)
-        return pressure, STATUS_VALID
+        return exp(_V2P_SLOPE * voltage - _V2P_OFFSET), STATUS_VALID
+
+    @staticmethod
+    def classify_voltages(voltages):
+        """
+        Convert a batch of voltages into pressure and status-code arrays.
+
+        Args:
+            voltages: Sequence of gauge output voltages
+
+        Returns:
+            (pressures, codes) - float64 pressures in mbar (NaN unless the
+            gauge is in range) and int8 indices into _STATUS_BY_CODE
+        """
+        v = np.asarray(voltages, dtype=np.float64)
+        codes = np.select([v < 0.5, v < 1.82, v <= 8.6, v <= 9.5],
+                          [0, 1, _CODE_VALID, 3], default=4).astype(np.int8)
+        pressures = np.where(codes == _CODE_VALID,
+                             np.exp(_V2P_SLOPE * v - _V2P_OFFSET), np.nan)
+        return pressures, codes
+
+    @staticmethod
+    def voltages_to_pressures_mbar(voltages):
+        """
+        Vectorised voltage_to_pressure_mbar() for several gauges at once.
+
+        Args:
+            voltages: Sequence of gauge output voltages
+
+        Returns:
+            List of (pressure, status) tuples, one per voltage
+        """
+        pressures, codes = FRG702Reader.classify_voltages(voltages)
+        return _pairs(pressures, codes)
 
     @staticmethod
     def read_operating_mode(status_voltage):
@@ -133,7 +243,7 @@ class FRG702Reader:
                     'pressure': None,
                     'status': 'error',
                     'mode': MODE_UNKNOWN
-                } for g in self.gauges if g.get('enabled', True)
+                } for g in self._enabled
             }
 
         # Refresh device unit if not yet known
@@ -143,16 +253,20 @@ class FRG702Reader:
         # Fallback to Torr if query fails or is not yet performed
         device_unit = self._device_unit or 'Torr'
 
-        for gauge in self.gauges:
-            if not gauge.get('enabled', True):
-                continue
+        # One 0F dump answers every convection gauge in a single serial
+        # transaction; per-gauge 02xx queries are only a fallback.
+        dump = self.controller.read_all_pressures() if self._uses_dump else None
 
+        for gauge, target_unit, factor in self._conversion_factors(device_unit):
             sensor_code = gauge['sensor_code']
-            target_unit = gauge.get('units', 'mbar')
 
             try:
-                raw_pressure = self.controller.read_pressure(sensor_code)
-                pressure = self.convert_pressure(raw_pressure, device_unit, target_unit)
+                slot = _dump_slot(sensor_code)
+                if dump is not None and slot is not None and slot < len(dump):
+                    raw_pressure = dump[slot]
+                else:
+                    raw_pressure = self.controller.read_pressure(sensor_code)
+                pressure = raw_pressure * factor if raw_pressure is not None else None
 
                 if pressure is not None:
                     readings[gauge['name']] = {
@@ -176,7 +290,7 @@ class FRG702Reader:
                     }
 
             except Exception as e:
-                print(f"Error reading {gauge['name']}: {e}")
+                logger.warning("Error reading %s: %s", gauge['name'], e)
                 readings[gauge['name']] = {
                     'pressure': None,
                     'status': 'error',
@@ -238,31 +352,46 @@ class FRG702Reader:
         Returns:
             Pressure in target unit, or None if not found/error
         """
-        for gauge in self.gauges:
-            if gauge['name'] == channel_name and gauge.get('enabled', True):
-                target_unit = gauge.get('units', 'mbar')
-                
-                # Ensure we know the device unit
-                if self._device_unit is None:
-                    self._refresh_device_unit()
-                device_unit = self._device_unit or 'Torr'
-
-                try:
-                    raw = self.controller.read_pressure(gauge['sensor_code'])
-                    return self.convert_pressure(raw, device_unit, target_unit)
-                except Exception as e:
-                    print(f"Error reading {channel_name}: {e}")
-                    return None
-        return None
+        gauge = self._by_name.get(channel_name)
+        if gauge is None:
+            return None
+
+        target_unit = gauge.get('units', 'mbar')
+
+        # Ensure we know the device unit
+        if self._device_unit is None:
+            self._refresh_device_unit()
+        device_unit = self._device_unit or 'Torr'
+
+        try:
+            raw = self.controller.read_pressure(gauge['sensor_code'])
+            return self.convert_pressure(raw, device_unit, target_unit)
+        except Exception as e:
+            logger.warning("Error reading %s: %s", channel_name, e)
+            return None
 
     def get_enabled_channels(self):
         """Get list of enabled FRG-702 gauge names."""
-        return [g['name'] for g in self.gauges if g['enabled']]
+        return list(self._by_name)
+
+
+def _dump_slot(sensor_code):
+    """Index of a convection gauge (T1-T4) in the XGS-600 0F dump, else None."""
+    code = sensor_code.upper()
+    if len(code) == 2 and code[0] == 'T' and code[1] in '1234':
+        return int(code[1]) - 1
+    return None
+
+
+def _pairs(pressures, codes):
+    """Turn classify_voltages() arrays into (pressure|None, status) tuples."""
+    return [(p if c == _CODE_VALID else None, _STATUS_BY_CODE[c])
+            for p, c in zip(pressures.tolist(), codes.tolist())]
 
 
 class FRG702AnalogReader:
     """Read Leybold FRG-702 gauges via LabJack T8 analog inputs."""
-    
+
     def __init__(self, handle, frg702_config_list):
         """
         Initialize FRG-702 analog reader.
@@ -273,47 +402,122 @@ class FRG702AnalogReader:
         """
         self.handle = handle
         self.gauges = frg702_config_list
+        self._errors = ErrorLog(__name__)
+
+    @property
+    def gauges(self):
+        """Gauge config list; assigning it rebuilds the cached pin names."""
+        return self._gauges
+
+    @gauges.setter
+    def gauges(self, config_list):
+        self._gauges = config_list
+        self._enabled = [g for g in config_list if g.get('enabled', True)]
+        # Per-gauge columns, in self._enabled order
+        self._names = [g['name'] for g in self._enabled]
+        self._read_names = [g['pin'] for g in self._enabled]
+        # Gauge name → AIN pin, for read_single()
+        self._pin_by_name = dict(zip(self._names, self._read_names))
+
+    def _read_voltages(self):
+        """
+        Read every enabled gauge's AIN pin in a single LJM transaction.
+
+        Returns:
+            (enabled_gauges, voltages) - voltages is None if the batch failed
+        """
+        enabled = self._enabled
+        if not enabled:
+            return enabled, []
+
+        read_names = self._read_names
+        try:
+            # One eReadNames round-trip instead of one eReadName per gauge
+            voltages = ljm.eReadNames(self.handle, len(read_names), read_names)
+        except Exception as e:
+            self._errors.error("Batch analog gauge read", e)
+            return enabled, None
+        return enabled, voltages
+
+    def _sample(self):
+        """
+        Read and classify all enabled gauges.
+
+        Returns:
+            (enabled_gauges, voltages, pairs) - pairs is a list of
+            (pressure, status) tuples; voltages and pairs are None if the
+            batch read failed
+        """
+        enabled, voltages = self._read_voltages()
+        if voltages is None:
+            return enabled, None, None
+
+        pressures, codes = FRG702Reader.classify_voltages(voltages)
+        return enabled, voltages, _pairs(pressures, codes)
 
     def read_all(self):
         """Read all enabled gauges. Returns {name: pressure_mbar}."""
-        readings = {}
-        for gauge in self.gauges:
-            if not gauge.get('enabled', True):
-                continue
-            
-            try:
-                voltage = ljm.eReadName(self.handle, gauge['pin'])
-                pressure, _ = FRG702Reader.voltage_to_pressure_mbar(voltage)
-                readings[gauge['name']] = pressure
-            except Exception as e:
-                print(f"Error reading analog gauge {gauge['name']}: {e}")
-                readings[gauge['name']] = None
-        return readings
+        _, _, pairs = self._sample()
+        if pairs is None:
+            return dict.fromkeys(self._names)
+
+        return {
+            name: pressure
+            for name, (pressure, _) in zip(self._names, pairs)
+        }
 
     def read_all_with_status(self):
         """Read all enabled gauges with status and voltage."""
-        readings = {}
-        for gauge in self.gauges:
-            if not gauge.get('enabled', True):
-                continue
-            
-            try:
-                voltage = ljm.eReadName(self.handle, gauge['pin'])
-                pressure, status = FRG702Reader.voltage_to_pressure_mbar(voltage)
-                readings[gauge['name']] = {
-                    'pressure': pressure,
-                    'status': status,
-                    'mode': 'Analog',
-                    'voltage': voltage
-                }
-            except Exception as e:
-                readings[gauge['name']] = {
+        _, voltages = self._read_voltages()
+        if voltages is None:
+            return {
+                name: {
                     'pressure': None,
                     'status': 'error',
                     'mode': 'Analog',
                     'voltage': None
-                }
+                } for name in self._names
+            }
+        return self._details_from(voltages)
+
+    def _details_from(self, voltages):
+        """
+        Convert one batch of pin voltages (self._read_names order) into the
+        read_all_with_status() dict.
+        """
+        pressures, codes = FRG702Reader.classify_voltages(voltages)
+        pairs = _pairs(pressures, codes)
+
+        readings = {}
+        for name, voltage, (pressure, status) in zip(self._names, voltages, pairs):
+            readings[name] = {
+                'pressure': pressure,
+                'status': status,
+                'mode': 'Analog',
+                'voltage': voltage
+            }
         return readings
 
+    def read_single(self, channel_name):
+        """
+        Read just one analog gauge by name.
+
+        Args:
+            channel_name: Name of the gauge to read
+
+        Returns:
+            Pressure in mbar, or None if not found/out of range/error
+        """
+        pin = self._pin_by_name.get(channel_name)
+        if pin is None:
+            return None
+        try:
+            voltage = ljm.eReadName(self.handle, pin)
+        except Exception as e:
+            logger.warning("Error reading %s: %s", channel_name, e)
+            return None
+        pressure, _ = FRG702Reader.voltage_to_pressure_mbar(voltage)
+        return pressure
+
     def get_enabled_channels(self):
-        return [g['name'] for g in self.gauges if g.get('enabled', True)]
+        return list(self._pin_by_name)
@@ -17,8 +17,12 @@ WIRING:
     J1 Pin 15 -> FIO1         (Shut Off - pull HIGH to kill output)
 """
 
+import time
+
 from labjack import ljm
 
+from t8_daq_system.utils.error_log import ErrorLog
+
 
 class KeysightAnalogController:
     """
@@ -48,6 +52,15 @@ class KeysightAnalogController:
     # MAX DAC output is 5.0 V — hard limit per Keysight N5700 J1 spec (SW1-3 DOWN)
     _DAC_MAX_V = 5.0
 
+    # DAC setpoints and the Shut Off pin only change when this controller
+    # writes them, so their readbacks are reused for this long.  Every write
+    # path clears the cache first.
+    _READBACK_TTL_S = 0.25
+
+    # An out-of-range monitor reading repeats every cycle while the output is
+    # off; warn about it at most this often per monitor
+    _MONITOR_WARN_INTERVAL_S = 10
+
     def __init__(self, handle, rated_max_volts=6.0, rated_max_amps=180.0,
                  voltage_limit=None, current_limit=None,
                  voltage_pin="DAC0", current_pin="DAC1",
@@ -81,6 +94,13 @@ class KeysightAnalogController:
         self.current_limit = current_limit if current_limit is not None else rated_max_amps
         self.switch_4_position = switch_4_position.lower().strip()
         self.debug = debug
+        # register → (value, monotonic time); see _cached_read()
+        self._readback_cache = {}
+        # monotonic time of the last out-of-range monitor warning, per monitor
+        self._voltage_warn_time = float('-inf')
+        self._current_warn_time = float('-inf')
+        # get_readings() runs every acquisition cycle
+        self._errors = ErrorLog(__name__)
         
         if self.switch_4_position not in ['up', 'down']:
             print(f"Warning: Invalid switch_4_position '{self.switch_4_position}', defaulting to 'down'")
@@ -88,12 +108,22 @@ class KeysightAnalogController:
 
         # Keysight SW1 switch 4 determines monitor range
         self._MONITOR_RANGE_V = 10.0 if self.switch_4_position == 'up' else 5.0
+
+        # The switch and the ratings are fixed for the life of the controller,
+        # so fold each monitor's scaling and out-of-range bound into constants
+        # once instead of re-deriving them on every reading
+        self._v_monitor_scale = self.rated_max_volts / self._MONITOR_RANGE_V
+        self._i_monitor_scale = self.rated_max_amps / self._MONITOR_RANGE_V
+        self._v_monitor_max = self.rated_max_volts * 1.083
+        self._i_monitor_max = self.rated_max_amps * 1.028
         
         # Override class defaults with instance-specific pins
         self._DAC_VOLTAGE = voltage_pin
         self._DAC_CURRENT = current_pin
         self._AIN_VOLTAGE = voltage_monitor_pin
         self._AIN_CURRENT = current_monitor_pin
+        # Registers behind get_readings(), in _readings_from() argument order
+        self._monitor_names = [self._AIN_VOLTAGE, self._AIN_CURRENT, self._DIO_SHUTOFF]
 
         if self.debug:
             print(f"[DEBUG] KeysightAnalogController init: V_PIN={self._DAC_VOLTAGE}, I_PIN={self._DAC_CURRENT}, V_MON={self._AIN_VOLTAGE}, I_MON={self._AIN_CURRENT}")
@@ -159,8 +189,8 @@ class KeysightAnalogController:
         """
         try:
             # Set range to +-10V to safely cover the 0-5V Keysight monitor output
-            ljm.eWriteName(self.handle, f"{self._AIN_VOLTAGE}_RANGE", 10.0)
-            ljm.eWriteName(self.handle, f"{self._AIN_CURRENT}_RANGE", 10.0)
+            names = [f"{self._AIN_VOLTAGE}_RANGE", f"{self._AIN_CURRENT}_RANGE"]
+            ljm.eWriteNames(self.handle, len(names), names, [10.0, 10.0])
         except Exception as e:
             print(f"Warning: Could not configure AIN ranges for Keysight monitors: {e}")
 
@@ -229,7 +259,7 @@ class KeysightAnalogController:
     def _safe_dac_write(self, register, value):
         """
         Write a DAC value with a hard clamp to prevent exceeding 5.0 V.
-        This is the only place DAC values are written to the T8.
+        This is the only place non-zero DAC values are written to the T8.
         Raises ValueError if value is negative (programming error).
         """
         if value < 0.0:
@@ -241,7 +271,8 @@ class KeysightAnalogController:
         
         if self.debug:
             print(f"[DEBUG] LJM Write: {register} = {clamped:.4f}V (original: {value:.4f}V)")
-            
+
+        self.invalidate_cache()
         try:
             ljm.eWriteName(self.handle, register, clamped)
         except Exception as e:
@@ -250,6 +281,24 @@ class KeysightAnalogController:
             
         return clamped
 
+    def _cached_read(self, register):
+        """
+        Read a register, reusing a readback younger than _READBACK_TTL_S.
+
+        Failed reads raise and are not cached.
+        """
+        now = time.monotonic()
+        hit = self._readback_cache.get(register)
+        if hit is not None and now - hit[1] < self._READBACK_TTL_S:
+            return hit[0]
+        value = ljm.eReadName(self.handle, register)
+        self._readback_cache[register] = (value, now)
+        return value
+
+    def invalidate_cache(self):
+        """Drop cached readbacks so the next getter reads the hardware."""
+        self._readback_cache.clear()
+
     # ──────────────────────────────────────────────────────────────────────────
     # Setpoint commands (write to DAC)
     # ──────────────────────────────────────────────────────────────────────────
@@ -284,9 +333,10 @@ class KeysightAnalogController:
             # STEP 4: Send to T8 via clamped write
             actual_written = self._safe_dac_write(self._DAC_VOLTAGE, dac_v)
 
-            # STEP 5: Readback Verification
-            actual_dac_v = ljm.eReadName(self.handle, self._DAC_VOLTAGE)
+            # STEP 5: Readback Verification (debug only — the value is only
+            # printed, and a ramp writes setpoints back to back)
             if self.debug:
+                actual_dac_v = ljm.eReadName(self.handle, self._DAC_VOLTAGE)
                 print(f"DAC Readback:   {actual_dac_v:.4f} V")
                 print(f"--------------------------------\n")
 
@@ -325,9 +375,9 @@ class KeysightAnalogController:
             # STEP 4: Send to T8 via clamped write
             actual_written = self._safe_dac_write(self._DAC_CURRENT, dac_i)
 
-            # STEP 5: Readback Verification
-            actual_dac_i = ljm.eReadName(self.handle, self._DAC_CURRENT)
+            # STEP 5: Readback Verification (debug only, as in set_voltage)
             if self.debug:
+                actual_dac_i = ljm.eReadName(self.handle, self._DAC_CURRENT)
                 print(f"DAC Readback:   {actual_dac_i:.4f} V")
                 print(f"--------------------------------\n")
 
@@ -348,7 +398,7 @@ class KeysightAnalogController:
             float: Voltage setpoint in volts, or None on error
         """
         try:
-            dac_v = ljm.eReadName(self.handle, self._DAC_VOLTAGE)
+            dac_v = self._cached_read(self._DAC_VOLTAGE)
             return self._dac_to_volts(dac_v, self.rated_max_volts)
         except Exception as e:
             print(f"Failed to read voltage setpoint: {e}")
@@ -362,7 +412,7 @@ class KeysightAnalogController:
             float: Current setpoint in amperes, or None on error
         """
         try:
-            dac_v = ljm.eReadName(self.handle, self._DAC_CURRENT)
+            dac_v = self._cached_read(self._DAC_CURRENT)
             return self._dac_to_volts(dac_v, self.rated_max_amps)
         except Exception as e:
             print(f"Failed to read current setpoint: {e}")
@@ -387,36 +437,10 @@ class KeysightAnalogController:
         """
         try:
             raw_v = ljm.eReadName(self.handle, self._AIN_VOLTAGE)
-
-            # CRITICAL SCALING - 0-5V input represents 0-rated_max_volts output
-            actual_voltage = (raw_v / self._MONITOR_RANGE_V) * self.rated_max_volts
-
-            # Debug output - helps verify scaling is correct
-            if self.debug:
-                print(f"\n--- KEYSIGHT VOLTAGE MONITOR ---")
-                print(f"Raw AIN ({self._AIN_VOLTAGE}): {raw_v:.4f} V")
-                print(f"Monitor Range: {self._MONITOR_RANGE_V} V (Switch 4: {self.switch_4_position})")
-                print(f"Rated Max:     {self.rated_max_volts} V")
-                print(f"Scaled Value:  {actual_voltage:.3f} V (formula: ({raw_v:.4f} / {self._MONITOR_RANGE_V}) * {self.rated_max_volts})")
-                print(f"--------------------------------\n")
-
-            # Safety check for reasonable values - allow for small negative noise (-0.05V raw)
-            if raw_v < -0.05 or actual_voltage > self.rated_max_volts * 1.083:
-                import time as _time
-                _now = _time.monotonic()
-                if not hasattr(self, '_voltage_warn_time') or _now - self._voltage_warn_time >= 10:
-                    self._voltage_warn_time = _now
-                    print(f"WARNING: Voltage reading {actual_voltage:.3f}V is out of expected range (0-{self.rated_max_volts}V)")
-                    print(f"         Raw AIN reading was: {raw_v:.4f}V on {self._AIN_VOLTAGE}")
-                    if raw_v < -0.3:
-                        print(f"         HINT: A large negative raw reading typically means the Keysight")
-                        print(f"         output is OFF or not enabled. Check: (1) front panel output button,")
-                        print(f"         (2) FIO1 shutoff pin state, (3) SW1 switches 1 & 2 are UP.")
-
-            return actual_voltage
         except Exception as e:
             print(f"Failed to measure voltage on {self._AIN_VOLTAGE}: {e}")
             return None
+        return self._scale_voltage_monitor(raw_v)
 
     def get_current(self):
         """
@@ -433,21 +457,58 @@ class KeysightAnalogController:
         """
         try:
             raw_v = ljm.eReadName(self.handle, self._AIN_CURRENT)
+        except Exception as e:
+            print(f"Failed to measure current on {self._AIN_CURRENT}: {e}")
+            return None
+        return self._scale_current_monitor(raw_v)
 
-            # CRITICAL SCALING - 0-5V input represents 0-rated_max_amps output
-            actual_current = (raw_v / self._MONITOR_RANGE_V) * self.rated_max_amps
+    def _scale_voltage_monitor(self, raw_v):
+        """Scale a raw voltage-monitor AIN reading to output volts."""
+        # CRITICAL SCALING - 0-5V input represents 0-rated_max_volts output
+        actual_voltage = raw_v * self._v_monitor_scale
 
-            # Debug output - helps verify scaling is correct
-            if self.debug:
-                print(f"\n--- KEYSIGHT CURRENT MONITOR ---")
-                print(f"Raw AIN ({self._AIN_CURRENT}): {raw_v:.4f} V")
-                print(f"Monitor Range: {self._MONITOR_RANGE_V} V (Switch 4: {self.switch_4_position})")
-                print(f"Rated Max:     {self.rated_max_amps} A")
-                print(f"Scaled Value:  {actual_current:.2f} A (formula: ({raw_v:.4f} / {self._MONITOR_RANGE_V}) * {self.rated_max_amps})")
-                print(f"--------------------------------\n")
+        # Debug output - helps verify scaling is correct
+        if self.debug:
+            print(f"\n--- KEYSIGHT VOLTAGE MONITOR ---")
+            print(f"Raw AIN ({self._AIN_VOLTAGE}): {raw_v:.4f} V")
+            print(f"Monitor Range: {self._MONITOR_RANGE_V} V (Switch 4: {self.switch_4_position})")
+            print(f"Rated Max:     {self.rated_max_volts} V")
+            print(f"Scaled Value:  {actual_voltage:.3f} V (formula: ({raw_v:.4f} / {self._MONITOR_RANGE_V}) * {self.rated_max_volts})")
+            print(f"--------------------------------\n")
+
+        # Safety check for reasonable values - allow for small negative noise (-0.05V raw)
+        if raw_v < -0.05 or actual_voltage > self._v_monitor_max:
+            _now = time.monotonic()
+            if _now - self._voltage_warn_time >= self._MONITOR_WARN_INTERVAL_S:
+                self._voltage_warn_time = _now
+                print(f"WARNING: Voltage reading {actual_voltage:.3f}V is out of expected range (0-{self.rated_max_volts}V)")
+                print(f"         Raw AIN reading was: {raw_v:.4f}V on {self._AIN_VOLTAGE}")
+                if raw_v < -0.3:
+                    print(f"         HINT: A large negative raw reading typically means the Keysight")
+                    print(f"         output is OFF or not enabled. Check: (1) front panel output button,")
+                    print(f"         (2) FIO1 shutoff pin state, (3) SW1 switches 1 & 2 are UP.")
+
+        return actual_voltage
+
+    def _scale_current_monitor(self, raw_v):
+        """Scale a raw current-monitor AIN reading to output amperes."""
+        # CRITICAL SCALING - 0-5V input represents 0-rated_max_amps output
+        actual_current = raw_v * self._i_monitor_scale
 
-            # Safety check for reasonable values - allow for small negative noise (-0.05V raw)
-            if raw_v < -0.05 or actual_current > self.rated_max_amps * 1.028:
+        # Debug output - helps verify scaling is correct
+        if self.debug:
+            print(f"\n--- KEYSIGHT CURRENT MONITOR ---")
+            print(f"Raw AIN ({self._AIN_CURRENT}): {raw_v:.4f} V")
+            print(f"Monitor Range: {self._MONITOR_RANGE_V} V (Switch 4: {self.switch_4_position})")
+            print(f"Rated Max:     {self.rated_max_amps} A")
+            print(f"Scaled Value:  {actual_current:.2f} A (formula: ({raw_v:.4f} / {self._MONITOR_RANGE_V}) * {self.rated_max_amps})")
+            print(f"--------------------------------\n")
+
+        # Safety check for reasonable values - allow for small negative noise (-0.05V raw)
+        if raw_v < -0.05 or actual_current > self._i_monitor_max:
+            _now = time.monotonic()
+            if _now - self._current_warn_time >= self._MONITOR_WARN_INTERVAL_S:
+                self._current_warn_time = _now
                 print(f"WARNING: Current reading {actual_current:.2f}A is out of expected range (0-{self.rated_max_amps}A)")
                 print(f"         Raw AIN reading was: {raw_v:.4f}V on {self._AIN_CURRENT}")
                 if raw_v < -0.3:
@@ -455,10 +516,7 @@ class KeysightAnalogController:
                     print(f"         output is OFF or not enabled. Check: (1) front panel output button,")
                     print(f"         (2) FIO1 shutoff pin state, (3) SW1 switches 1 & 2 are UP.")
 
-            return actual_current
-        except Exception as e:
-            print(f"Failed to measure current on {self._AIN_CURRENT}: {e}")
-            return None
+        return actual_current
 
     def validate_scaling(self):
         """
@@ -568,6 +626,7 @@ class KeysightAnalogController:
         Returns:
             True if successful, False if failed
         """
+        self.invalidate_cache()
         try:
             self._set_pin_output(self._DIO_SHUTOFF)
             ljm.eWriteName(self.handle, self._DIO_SHUTOFF, 0)
@@ -588,13 +647,18 @@ class KeysightAnalogController:
         Returns:
             True if successful, False if failed after retries
         """
+        self.invalidate_cache()
         for attempt in range(3):
             try:
                 self._set_pin_output(self._DIO_SHUTOFF)
                 ljm.eWriteName(self.handle, self._DIO_SHUTOFF, 1)
                 readback = int(ljm.eReadName(self.handle, self._DIO_SHUTOFF))
                 print(f"[Keysight] output_off attempt {attempt+1}: wrote {self._DIO_SHUTOFF}=1, readback={readback} ({'OK' if readback == 1 else 'MISMATCH — output may still be ON!'})")
-                if not self.is_output_on():
+                # The readback above already is the is_output_on() check;
+                # reading FIO1 a second time only doubled the LJM traffic.
+                # It is a real pin read, so it also seeds the readback cache.
+                if readback != 0:
+                    self._readback_cache[self._DIO_SHUTOFF] = (readback, time.monotonic())
                     return True
             except Exception as e:
                 print(f"Output off attempt {attempt + 1} on {self._DIO_SHUTOFF} failed: {e}")
@@ -613,7 +677,7 @@ class KeysightAnalogController:
             bool: True if output is on, False if off or on error
         """
         try:
-            state = ljm.eReadName(self.handle, self._DIO_SHUTOFF)
+            state = self._cached_read(self._DIO_SHUTOFF)
             return int(state) == 0
         except Exception as e:
             print(f"Failed to check output state: {e}")
@@ -717,12 +781,30 @@ class KeysightAnalogController:
         Returns:
             dict matching the PowerSupplyController.get_status() format
         """
+        # Shut-off pin, both DAC setpoints and both monitors in one LJM
+        # transaction rather than five separate eReadName round-trips
+        names = [self._DIO_SHUTOFF, self._DAC_VOLTAGE, self._DAC_CURRENT,
+                 self._AIN_VOLTAGE, self._AIN_CURRENT]
+        try:
+            shutoff, dac_v, dac_i, raw_v, raw_i = ljm.eReadNames(
+                self.handle, len(names), names)
+        except Exception as e:
+            print(f"Failed to read power supply status: {e}")
+            output_on = False  # Assume off for safety
+            v_set = i_set = v_act = i_act = None
+        else:
+            output_on = int(shutoff) == 0
+            v_set = self._dac_to_volts(dac_v, self.rated_max_volts)
+            i_set = self._dac_to_volts(dac_i, self.rated_max_amps)
+            v_act = self._scale_voltage_monitor(raw_v)
+            i_act = self._scale_current_monitor(raw_i)
+
         return {
-            'output_on':        self.is_output_on(),
-            'voltage_setpoint': self.get_voltage_setpoint(),
-            'current_setpoint': self.get_current_setpoint(),
-            'voltage_actual':   self.get_voltage(),
-            'current_actual':   self.get_current(),
+            'output_on':        output_on,
+            'voltage_setpoint': v_set,
+            'current_setpoint': i_set,
+            'voltage_actual':   v_act,
+            'current_actual':   i_act,
             'errors':           self.get_errors(),
             'in_current_limit': self._is_in_current_limit(),
         }
@@ -753,6 +835,7 @@ class KeysightAnalogController:
         try:
             self._safe_dac_write(self._DAC_VOLTAGE, 0.0)
             self._safe_dac_write(self._DAC_CURRENT, 0.0)
+            self.invalidate_cache()
             ljm.eWriteName(self.handle, self._DIO_SHUTOFF, 0)
             return True
         except Exception as e:
@@ -770,23 +853,38 @@ class KeysightAnalogController:
         """
         success = True
 
-        # 1. Assert Shut Off (highest priority)
-        if not self.output_off():
-            success = False
+        # 1. Assert Shut Off and zero both program DACs in a single LJM
+        #    transaction. Shut Off is first in the list, so it is applied
+        #    first; 0 V needs no clamp, so the DACs skip _safe_dac_write().
+        self.invalidate_cache()
+        try:
+            self._set_pin_output(self._DIO_SHUTOFF)
+            names = [self._DIO_SHUTOFF, self._DAC_VOLTAGE, self._DAC_CURRENT]
+            ljm.eWriteNames(self.handle, len(names), names, [1, 0.0, 0.0])
+            coalesced = True
+        except Exception as e:
+            print(f"EMERGENCY SHUTDOWN: combined write failed ({e}), falling back to step-by-step")
+            coalesced = False
 
         self.interlock_active = True
 
-        # 2. Zero the voltage program DAC
-        try:
-            self._safe_dac_write(self._DAC_VOLTAGE, 0.0)
-        except Exception:
-            success = False
-
-        # 3. Zero the current program DAC
-        try:
-            self._safe_dac_write(self._DAC_CURRENT, 0.0)
-        except Exception:
-            success = False
+        if coalesced:
+            # 2. Verify Shut Off took; output_off() retries if it did not
+            try:
+                verified = int(ljm.eReadName(self.handle, self._DIO_SHUTOFF)) == 1
+            except Exception:
+                verified = False
+            if not verified and not self.output_off():
+                success = False
+        else:
+            # Fallback: the original one-write-per-step sequence
+            if not self.output_off():
+                success = False
+            for register in (self._DAC_VOLTAGE, self._DAC_CURRENT):
+                try:
+                    self._safe_dac_write(register, 0.0)
+                except Exception:
+                    success = False
 
         if success:
             print("EMERGENCY SHUTDOWN: Power supply output disabled")
@@ -835,8 +933,20 @@ class KeysightAnalogController:
         Returns:
             dict: {'PS_Voltage': float, 'PS_Current': float, 'PS_Output_On': bool}
         """
+        # Both monitors and the shut-off pin in one LJM transaction rather
+        # than three separate eReadName round-trips
+        names = self._monitor_names
+        try:
+            raw_v, raw_i, shutoff = ljm.eReadNames(self.handle, len(names), names)
+        except Exception as e:
+            self._errors.error("Power supply monitor read", e)
+            return {'PS_Voltage': None, 'PS_Current': None, 'PS_Output_On': False}
+        return self._readings_from(raw_v, raw_i, shutoff)
+
+    def _readings_from(self, raw_v, raw_i, shutoff):
+        """Scale one set of _monitor_names values into the get_readings() dict."""
         return {
-            'PS_Voltage':   self.get_voltage(),
-            'PS_Current':   self.get_current(),
-            'PS_Output_On': self.is_output_on(),
+            'PS_Voltage':   self._scale_voltage_monitor(raw_v),
+            'PS_Current':   self._scale_current_monitor(raw_i),
+            'PS_Output_On': int(shutoff) == 0,
         }
@@ -7,15 +7,30 @@ FLOW: Open device -> Return handle -> Close when done
 from labjack import ljm
 import json
 import os
+import time
+
+from t8_daq_system.utils.error_log import ErrorLog
 
 
 class LabJackConnection:
+    # is_connected() proves the link with a register read; a successful
+    # probe, or a successful read reported through note_read(), is trusted
+    # for this long so per-tick GUI checks don't each cost a USB round-trip
+    # that contends with acquisition reads.
+    PROBE_TTL_S = 2.0
+
     def __init__(self):
         """
         Initialize the LabJack connection manager.
         """
         self.handle = None
         self.device_info = None
+        self._last_probe_ok = None  # monotonic time of the last good probe
+        # tuple(names) → (addresses, data types) from ljm.namesToAddresses();
+        # register addresses are fixed for the device type, so entries stay
+        # valid across reconnects
+        self._addr_cache = {}
+        self._errors = ErrorLog(__name__)
 
     def connect(self):
         """
@@ -33,6 +48,7 @@ class LabJackConnection:
 
             # Get device info to confirm connection
             self.device_info = ljm.getHandleInfo(self.handle)
+            self._last_probe_ok = time.monotonic()
             print(f"Connected to T8, Serial: {self.device_info[2]}")
             return True
 
@@ -48,33 +64,62 @@ class LabJackConnection:
 
     def disconnect(self):
         """Always call this when done!"""
+        self._last_probe_ok = None
         if self.handle:
             ljm.close(self.handle)
             self.handle = None
             print("Disconnected from T8")
 
+    def note_read(self, ok):
+        """
+        Record the outcome of a read made through this handle elsewhere.
+
+        A successful data read proves the link as well as a probe does, so
+        it refreshes the liveness timestamp; a failure clears it so the
+        next is_connected() call probes the device again.
+        """
+        self._last_probe_ok = time.monotonic() if ok else None
+
     def get_handle(self):
         """Other parts of code use this to talk to the device."""
         return self.handle
 
-    def is_connected(self):
-        """Check if device is currently connected and responsive by performing a small read."""
+    def is_connected(self, max_age=None):
+        """
+        Check if device is currently connected and responsive by performing a small read.
+
+        Args:
+            max_age: Reuse a successful probe younger than this many seconds
+                     (default PROBE_TTL_S); pass 0 to force a fresh read.
+        """
         if self.handle is None:
             return False
-        
+
+        now = time.monotonic()
+        if max_age is None:
+            max_age = self.PROBE_TTL_S
+        if self._last_probe_ok is not None and now - self._last_probe_ok < max_age:
+            return True
+
         try:
             # A real read is more reliable than getHandleInfo for detecting physical USB pull
             ljm.eReadName(self.handle, "SERIAL_NUMBER")
+            self._last_probe_ok = now
             return True
         except ljm.LJMError:
             # Connection lost or handle invalid
             self.handle = None
+            self._last_probe_ok = None
             return False
 
     def read_names_batch(self, names):
         """
         Read multiple named registers in a single LJM call.
 
+        Names are resolved to Modbus addresses once per distinct name list
+        and read with eReadAddresses, so repeated polls skip LJM's
+        per-call name lookup.
+
         Args:
             names: List of register name strings, e.g. ["AIN0_EF_READ_A", "AIN1_EF_READ_A"]
 
@@ -84,12 +129,20 @@ class LabJackConnection:
         if not self.handle or not names:
             return [None] * len(names)
 
+        key = tuple(names)
         try:
-            results = ljm.eReadNames(self.handle, len(names), names)
-            return list(results)
+            resolved = self._addr_cache.get(key)
+            if resolved is None:
+                resolved = ljm.namesToAddresses(len(names), names)
+                self._addr_cache[key] = resolved
+            addresses, data_types = resolved
+            results = ljm.eReadAddresses(self.handle, len(names), addresses, data_types)
         except ljm.LJMError as e:
-            print(f"Batch read error: {e}")
+            self._errors.error("Batch read", e)
+            self.note_read(False)
             return [None] * len(names)
+        self.note_read(True)
+        return list(results)
 
     def get_device_info(self):
         """
@@ -125,22 +178,25 @@ class LabJackConnection:
             print("Cannot configure AIN: Device not connected")
             return False
 
+        # T8 specific: single-ended is the channel number itself.
+        # (On T7 it would be 199.) All channels are written in one
+        # transaction and verified with one batched readback.
+        channels = list(channels)
+        regs = [f"AIN{ch}_NEGATIVE_CH" for ch in channels]
+        if not regs:
+            return True
+        try:
+            ljm.eWriteNames(self.handle, len(regs), regs, channels)
+            readback = ljm.eReadNames(self.handle, len(regs), regs)
+        except ljm.LJMError as e:
+            print(f"Error configuring {', '.join(regs)}: {e}")
+            return False
+
         success = True
-        for ch in channels:
-            reg = f"AIN{ch}_NEGATIVE_CH"
-            # T8 specific: single-ended is channel number itself.
-            # (On T7 it would be 199).
-            val_to_write = ch 
-            try:
-                ljm.eWriteName(self.handle, reg, val_to_write)
-                # Verify write
-                val = ljm.eReadName(self.handle, reg)
-                if int(val) != val_to_write:
-                    print(f"Verification failed for {reg}: wrote {val_to_write}, read {val}")
-                    success = False
-                else:
-                    print(f"Successfully configured {reg} to single-ended ({val_to_write})")
-            except ljm.LJMError as e:
-                print(f"Error configuring {reg}: {e}")
+        for reg, ch, val in zip(regs, channels, readback):
+            if int(val) != ch:
+                print(f"Verification failed for {reg}: wrote {ch}, read {val}")
                 success = False
+            else:
+                print(f"Successfully configured {reg} to single-ended ({ch})")
         return success
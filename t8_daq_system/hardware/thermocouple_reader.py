@@ -6,17 +6,27 @@ KEY CONCEPT: T8 has "Extended Features" (EF) that do the math automatically
 
 DEBUG_TC = False   # Set False to silence TC debug output
 
+import time
+
 from labjack import ljm
 
+from t8_daq_system.utils.error_log import ErrorLog
+
 
 class ThermocoupleReader:
-    # Thermocouple type codes for AIN_EF_INDEX register
+    # Thermocouple type codes for AIN_EF_INDEX register, per the LabJack
+    # T-series thermocouple EF table (26 and 29 are unused indices)
     TC_TYPES = {
         'E': 20, 'J': 21, 'K': 22, 'R': 23,
         'T': 24, 'S': 25, 'N': 27, 'B': 28,
         'C': 30
     }
 
+    # read_single() answers from the last batch read if it is younger than
+    # this, so per-tick callers (the PID loop) piggyback on the acquisition
+    # thread's read instead of adding a USB round-trip of their own
+    BATCH_TTL_S = 0.1
+
     def __init__(self, handle, tc_config_list):
         """
         Initialize thermocouple reader.
@@ -28,50 +38,69 @@ class ThermocoupleReader:
         self.handle = handle
         self.thermocouples = tc_config_list
         self._debug_read_count = 0
+        # Read errors repeat every cycle while the device is unplugged
+        self._errors = ErrorLog(__name__)
         self._configure_channels()
 
+    @property
+    def thermocouples(self):
+        """TC config list; assigning it rebuilds the enabled/register caches."""
+        return self._thermocouples
+
+    @thermocouples.setter
+    def thermocouples(self, config_list):
+        self._thermocouples = config_list
+        self._enabled = [tc for tc in config_list if tc.get('enabled', True)]
+        # Per-channel columns for the batch reads, in self._enabled order
+        self._names = [tc['name'] for tc in self._enabled]
+        self._read_names = [f"AIN{tc['channel']}_EF_READ_A" for tc in self._enabled]
+        self._raw_names = [f"AIN{tc['channel']}" for tc in self._enabled]
+        self._raw_keys = [f"{tc['name']}_rawV" for tc in self._enabled]
+        # TC name → EF register, for read_single()
+        self._read_name_by_tc = dict(zip(self._names, self._read_names))
+        # (monotonic time, {name: °C or None}) of the last batch; see read_single()
+        self._last_batch = (None, {})
+
     def _configure_channels(self):
         """
         Set up each thermocouple channel on the T8.
         This tells the T8 "this channel has a Type K thermocouple"
         """
         if DEBUG_TC:
-            print(f"[TC DEBUG] Configuring {len([t for t in self.thermocouples if t['enabled']])} enabled TC channels")
-
-        for tc in self.thermocouples:
-            if not tc['enabled']:
-                continue
-
+            print(f"[TC DEBUG] Configuring {len(self._enabled)} enabled TC channels")
+
+        # Collect every register write and send them in one eWriteNames
+        # transaction instead of three eWriteName round-trips per channel.
+        # Per channel, in order:
+        #   AIN#_RANGE       = ±100mV (thermocouples use small voltages)
+        #   AIN#_EF_INDEX    = what type of extended feature (TC type)
+        #   AIN#_EF_CONFIG_A = output units (0=K, 1=C, 2=F); always Celsius
+        #                      for internal consistency, display converts
+        names, values = [], []
+        enabled_tcs = self._enabled
+        for tc in enabled_tcs:
             channel = tc['channel']
-            tc_type = tc['type']
+            names += [f"AIN{channel}_RANGE", f"AIN{channel}_EF_INDEX",
+                      f"AIN{channel}_EF_CONFIG_A"]
+            values += [0.1, self.TC_TYPES[tc['type']], 1]
 
-            # These are the register names we write to configure
-            # AIN#_EF_INDEX = what type of extended feature
-            # AIN#_EF_CONFIG_A = output units (0=K, 1=C, 2=F)
+        if not names:
+            return
 
-            index_name = f"AIN{channel}_EF_INDEX"
-            config_name = f"AIN{channel}_EF_CONFIG_A"
-            range_name = f"AIN{channel}_RANGE"
-
-            try:
-                # Set the voltage range (thermocouples use small voltages)
-                ljm.eWriteName(self.handle, range_name, 0.1)  # ±100mV range
-
-                # Set the thermocouple type
-                ljm.eWriteName(self.handle, index_name, self.TC_TYPES[tc_type])
-
-                # Set output units: always Celsius (1) for internal consistency
-                # Conversion for display is handled in the GUI
-                ljm.eWriteName(self.handle, config_name, 1)
+        try:
+            ljm.eWriteNames(self.handle, len(names), names, values)
+        except ljm.LJMError as e:
+            channels = ", ".join(f"{tc['name']} (AIN{tc['channel']})" for tc in enabled_tcs)
+            print(f"Error configuring thermocouples {channels}: {e}")
+            raise e
 
-                if DEBUG_TC:
-                    neg_ch = ljm.eReadName(self.handle, f"AIN{channel}_NEGATIVE_CH")
-                    print(f"[TC DEBUG] Configured {tc['name']}: AIN{channel}, type={tc_type} "
-                          f"(EF_INDEX={self.TC_TYPES[tc_type]}), RANGE=0.1V, "
-                          f"NEGATIVE_CH={int(neg_ch)}")
-            except ljm.LJMError as e:
-                print(f"Error configuring thermocouple {tc['name']} on AIN{channel}: {e}")
-                raise e
+        if DEBUG_TC:
+            for tc in enabled_tcs:
+                channel = tc['channel']
+                neg_ch = ljm.eReadName(self.handle, f"AIN{channel}_NEGATIVE_CH")
+                print(f"[TC DEBUG] Configured {tc['name']}: AIN{channel}, type={tc['type']} "
+                      f"(EF_INDEX={self.TC_TYPES[tc['type']]}), RANGE=0.1V, "
+                      f"NEGATIVE_CH={int(neg_ch)}")
 
     def read_all(self):
         """
@@ -80,30 +109,23 @@ class ThermocoupleReader:
         Returns:
             dict like {'TC1_Inlet': 25.3, 'TC2_Outlet': 28.1}
         """
-        enabled_tcs = [tc for tc in self.thermocouples if tc.get('enabled', True)]
+        enabled_tcs = self._enabled
 
         if not enabled_tcs:
             return {}
 
-        # Build list of EF register names for batch read
-        read_names = [f"AIN{tc['channel']}_EF_READ_A" for tc in enabled_tcs]
+        # EF register names for the batch read, built when the config was set
+        read_names = self._read_names
 
         try:
             # Single LJM call to read all thermocouple channels at once
             results = ljm.eReadNames(self.handle, len(read_names), read_names)
         except ljm.LJMError as e:
-            print(f"Batch thermocouple read error: {e}")
+            self._errors.error("Batch thermocouple read", e)
             # Fall back to individual reads
             return self._read_all_sequential()
 
-        # Process batch results
-        readings = {}
-        for i, tc in enumerate(enabled_tcs):
-            temp = results[i]
-            if temp == -9999:
-                readings[tc['name']] = None
-            else:
-                readings[tc['name']] = round(temp, 3)
+        readings = self._temperatures_from(results)
 
         if DEBUG_TC:
             self._debug_read_count += 1
@@ -136,26 +158,31 @@ class ThermocoupleReader:
             voltages in Volts (typically in the ±100 mV range for thermocouples).
             Returns ``None`` for a channel that fails to read.
         """
-        enabled_tcs = [tc for tc in self.thermocouples if tc.get('enabled', True)]
+        enabled_tcs = self._enabled
         if not enabled_tcs:
             return {}
 
         # Read AIN# (raw voltage) alongside AIN#_EF_READ_A (temperature)
-        raw_names = [f"AIN{tc['channel']}" for tc in enabled_tcs]
+        raw_names = self._raw_names
 
         try:
             results = ljm.eReadNames(self.handle, len(raw_names), raw_names)
         except ljm.LJMError as e:
-            print(f"Batch raw voltage read error: {e}")
-            return {f"{tc['name']}_rawV": None for tc in enabled_tcs}
+            self._errors.error("Batch raw voltage read", e)
+            return dict.fromkeys(self._raw_keys)
+
+        return self._raw_voltages_from(results)
 
-        raw_voltages = {}
-        for i, tc in enumerate(enabled_tcs):
-            v = results[i]
-            # Clamp obviously-bad values (open circuit on ±100 mV range reads ~±0.1)
-            raw_voltages[f"{tc['name']}_rawV"] = round(v, 8) if v is not None else None
+    def _temperatures_from(self, results):
+        """Map EF_READ_A values (self._read_names order) to {name: °C or None}."""
+        readings = {name: (None if temp == -9999 else temp)
+                    for name, temp in zip(self._names, results)}
+        self._last_batch = (time.monotonic(), readings)
+        return readings
 
-        return raw_voltages
+    def _raw_voltages_from(self, results):
+        """Map AIN# values (self._raw_names order) to {'<name>_rawV': volts}."""
+        return dict(zip(self._raw_keys, results))
 
     def _read_all_sequential(self):
         """
@@ -166,23 +193,15 @@ class ThermocoupleReader:
         """
         readings = {}
 
-        for tc in self.thermocouples:
-            if not tc['enabled']:
-                continue
-
-            channel = tc['channel']
-            read_name = f"AIN{channel}_EF_READ_A"
-
+        for name, read_name in zip(self._names, self._read_names):
             try:
                 temp = ljm.eReadName(self.handle, read_name)
-                if temp == -9999:
-                    readings[tc['name']] = None
-                else:
-                    readings[tc['name']] = round(temp, 3)
+                readings[name] = None if temp == -9999 else temp
             except ljm.LJMError as e:
-                print(f"Error reading {tc['name']}: {e}")
-                readings[tc['name']] = None
+                self._errors.error(name, e)
+                readings[name] = None
 
+        self._last_batch = (time.monotonic(), readings)
         return readings
 
     def read_single(self, channel_name):
@@ -195,20 +214,21 @@ class ThermocoupleReader:
         Returns:
             Temperature value or None if not found/error
         """
-        for tc in self.thermocouples:
-            if tc['name'] == channel_name and tc['enabled']:
-                read_name = f"AIN{tc['channel']}_EF_READ_A"
-                try:
-                    temp = ljm.eReadName(self.handle, read_name)
-                    if temp == -9999:
-                        return None
-                    
-                    return round(temp, 3)
-                except ljm.LJMError as e:
-                    print(f"Error reading {channel_name}: {e}")
-                    return None
-        return None
+        read_name = self._read_name_by_tc.get(channel_name)
+        if read_name is None:
+            return None
+        stamp, readings = self._last_batch
+        if stamp is not None and time.monotonic() - stamp < self.BATCH_TTL_S:
+            return readings.get(channel_name)
+        try:
+            temp = ljm.eReadName(self.handle, read_name)
+            if temp == -9999:
+                return None
+            return temp
+        except ljm.LJMError as e:
+            self._errors.error(channel_name, e)
+            return None
 
     def get_enabled_channels(self):
         """Get list of enabled thermocouple names."""
-        return [tc['name'] for tc in self.thermocouples if tc['enabled']]
+        return list(self._read_name_by_tc)
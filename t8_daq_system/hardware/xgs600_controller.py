@@ -12,6 +12,9 @@ import time
 # Enforce 200ms minimum between successive commands.
 _MIN_COMMAND_INTERVAL = 0.20  # seconds
 
+# #0013 reply code → pressure unit
+_UNIT_BY_CODE = {'0': 'Torr', '1': 'mbar', '2': 'Pa'}
+
 # Mirror the pressure debug flag from frg702_reader so both modules log together.
 try:
     from t8_daq_system.hardware.frg702_reader import DEBUG_PRESSURE
@@ -144,22 +147,22 @@ class XGS600Controller:
 
         # Build full command: #{address}{command}\r  (carriage return required)
         full_command = f"#{self.address}{command}\r"
+        payload = full_command.encode('ascii')
 
         try:
             # Clear input buffer before sending
             self._serial.reset_input_buffer()
 
-            if self.debug:
-                print(f"XGS-600 TX: {repr(full_command)} (hex: {full_command.encode('ascii').hex()})")
-
             # Send command
-            self._serial.write(full_command.encode('ascii'))
+            self._serial.write(payload)
             self._last_command_time = time.monotonic()
 
-            # Small delay to allow controller to process and begin responding
-            time.sleep(0.05)
+            # Bookkeeping goes here, while the controller is still parsing
+            # the command; read_until() then blocks only for the reply itself
+            # (no fixed settle delay — it already waits up to self.timeout).
+            if self.debug:
+                print(f"XGS-600 TX: {repr(full_command)} (hex: {payload.hex()})")
 
-            # Read response until \r (waits up to self.timeout)
             response = self._serial.read_until(b'\r', size=256)
 
             if not response:
@@ -225,19 +228,15 @@ class XGS600Controller:
         if response is None:
             return None
 
-        readings = response.split(',')
-        readings = [r.strip() for r in readings]
-
+        # float() ignores surrounding whitespace, so the padded fields parse
+        # directly; NOCBL (no cable / sensor not present) and blanks fail the
+        # conversion and become None.
         pressures = []
-        for value_str in readings:
-            # NOCBL means no cable / sensor not present — treat as None
-            if not value_str or value_str == 'NOCBL':
+        for value_str in response.split(','):
+            try:
+                pressures.append(float(value_str))
+            except ValueError:
                 pressures.append(None)
-            else:
-                try:
-                    pressures.append(float(value_str))
-                except ValueError:
-                    pressures.append(None)
 
         return pressures
 
@@ -268,15 +267,13 @@ class XGS600Controller:
         if response is None:
             return None
 
-        value_str = response.strip()
-        if not value_str or value_str == 'NOCBL':
-            return None
-
+        # Same single-pass parse as read_all_pressures(): float() ignores
+        # the padding, and NOCBL/blank replies land in the ValueError branch.
         try:
-            return float(value_str)
+            return float(response)
         except ValueError:
-            if self.debug:
-                print(f"XGS-600: Could not parse pressure '{value_str}' for sensor {sensor_code}")
+            if self.debug and response.strip() not in ('', 'NOCBL'):
+                print(f"XGS-600: Could not parse pressure '{response.strip()}' for sensor {sensor_code}")
             return None
 
     def read_units(self):
@@ -290,8 +287,7 @@ class XGS600Controller:
         if response is None:
             return None
 
-        unit_map = {'0': 'Torr', '1': 'mbar', '2': 'Pa'}
-        return unit_map.get(response.strip(), None)
+        return _UNIT_BY_CODE.get(response.strip())
 
     def read_controller_info(self):
         """
@@ -20,30 +20,9 @@ if __name__ == "__main__":
 # ============================================================================
 os.environ['ZEROCONF_DISABLE'] = '1'
 
-# ============================================================================
-# FROZEN EXE OPTIMIZATIONS
-# ============================================================================
-if getattr(sys, 'frozen', False):
-    print("[FROZEN MODE] Applying performance optimizations...")
-
-    # Matplotlib: disable font scanning (biggest startup bottleneck)
-    os.environ['MPLBACKEND'] = 'TkAgg'
-    if hasattr(sys, '_MEIPASS'):
-        mpl_data_dir = os.path.join(sys._MEIPASS, 'mpl-data')
-        os.makedirs(mpl_data_dir, exist_ok=True)
-        os.environ['MPLCONFIGDIR'] = mpl_data_dir
-
-    import matplotlib
-    matplotlib.use('TkAgg', force=True)
-
-    # Force matplotlib to skip font manager scanning
-    import matplotlib.font_manager as fm
-    try:
-        fm._load_fontmanager = lambda try_read_cache=True: fm.FontManager()
-    except Exception:
-        pass
-
-    print("[FROZEN MODE] Matplotlib optimization complete")
+# Frozen-EXE matplotlib environment (backend, config dir) is set by the
+# PyInstaller runtime hook t8_daq_system/_frozen_preload.py before this
+# module runs; matplotlib itself is not imported until a plot is built.
 
 # ============================================================================
 # PATH SETUP
@@ -78,13 +57,31 @@ class Logger:
             self.terminal.flush()
         self.log.flush()
 
-profiler.log("About to import MainWindow...")
-from t8_daq_system.gui.main_window import MainWindow
-profiler.log("MainWindow import complete")
 
-profiler.log("About to import AppSettings...")
-from t8_daq_system.settings.app_settings import AppSettings
-profiler.log("AppSettings import complete")
+def install_log_queue():
+    """
+    Route the logging module through a queue drained on a worker thread.
+
+    Hardware threads only enqueue records; the listener thread does the
+    synchronous write to stdout (and therefore log.txt).
+
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush it.
+    """
+    import logging
+    import logging.handlers
+    import queue
+
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
 
 
 def main():
@@ -108,6 +105,18 @@ def main():
     log_file = os.path.join(logs_dir, "log.txt")
     sys.stdout = Logger(log_file)
     sys.stderr = sys.stdout
+    log_listener = install_log_queue()
+
+    # The GUI stack (matplotlib, numpy, labjack, tkinter) is imported only
+    # now, after logging is in place, so module import is cheap and any
+    # import-time output lands in log.txt
+    profiler.log("About to import AppSettings...")
+    from t8_daq_system.settings.app_settings import AppSettings
+    profiler.log("AppSettings import complete")
+
+    profiler.log("About to import MainWindow...")
+    from t8_daq_system.gui.main_window import MainWindow
+    profiler.log("MainWindow import complete")
 
     # Load persistent settings from Windows Registry (silent defaults on first launch)
     profiler.log("Loading AppSettings from registry...")
@@ -129,7 +138,10 @@ def main():
     profiler.disable()
 
     profiler.log("Starting GUI main loop")
-    app.run()
+    try:
+        app.run()
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -9,11 +9,20 @@ No external JSON config files are used. On first launch (or if the registry
 key has never been written) load() silently returns all defaults.
 """
 
+import ctypes
+import sys
 import winreg
 
 # Registry key path under HKCU
 _REG_KEY = r"Software\T8_DAQ_System"
 
+# field → value of every setting the registry holds, filled by the first
+# load() and kept current by every save().  This process is the only writer,
+# so later load() calls copy from here instead of querying each value again,
+# and save() diffs against it to skip values the registry already holds.
+# None until a load() has read the key.
+_cached_values = None
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Defaults (used on first launch / missing keys)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -205,47 +214,96 @@ class AppSettings:
         Silently returns defaults for any key that is missing (e.g. first
         launch).  Never raises — the caller always gets a fully populated
         object.
+
+        Only the first call in a process reads the registry; later calls
+        copy the values it returned.  Use reload() to force a fresh read.
         """
+        global _cached_values
+        if _cached_values is not None:
+            for field, val in _cached_values.items():
+                setattr(self, field, val)
+            return self
+
         try:
             key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _REG_KEY)
         except FileNotFoundError:
             # Key doesn't exist yet — keep defaults, return self
+            _cached_values = {}
             return self
         except OSError:
             # Registry unavailable (non-Windows environment, permissions) — keep defaults
             return self
 
         try:
-            for field, (kind, default) in _DEFAULTS.items():
-                try:
-                    raw_value, _ = winreg.QueryValueEx(key, field)
-                    val = _coerce(raw_value, kind, default)
-                    setattr(self, field, val)
-                    pass  # field loaded successfully
-                except (FileNotFoundError, OSError):
-                    # Individual value missing — keep default
-                    pass
+            raw_values = _query_multiple(key, list(_DEFAULTS))
+            if raw_values is None:
+                # Batch query unavailable or some value missing (e.g. a
+                # setting added since the key was last saved) — walk the
+                # key's values once by index instead of looking each up by
+                # name; fields not present simply keep their defaults
+                raw_values = _enum_values(key)
         finally:
             winreg.CloseKey(key)
 
+        values = {}
+        for field, (kind, default) in _DEFAULTS.items():
+            raw_value = raw_values.get(field)
+            if raw_value is None:
+                continue  # Missing or unsupported registry type — keep default
+            val = _coerce(raw_value, kind, default)
+            setattr(self, field, val)
+            values[field] = val
+
+        _cached_values = values
         return self
 
-    def save(self) -> None:
+    def reload(self) -> "AppSettings":
+        """Load settings from the registry, bypassing the load() cache."""
+        global _cached_values
+        _cached_values = None
+        return self.load()
+
+    def save(self, fields=None) -> None:
         """
-        Write all settings atomically to the registry.
+        Write settings to the registry.
+
+        Once a load() has read the registry, only fields whose value differs
+        from what it holds (the shared load() cache, which every save keeps
+        current) are written, so saving an unchanged object makes no
+        registry calls at all.  Before that, every requested field is
+        written.
 
         Creates the registry key if it does not exist.
         Silently swallows any OS-level errors (e.g. non-Windows, permissions).
+
+        Args:
+            fields: Optional iterable of field names to write, e.g. only the
+                    ones an editor changed.  ``None`` writes every field.
         """
+        if fields is None:
+            fields = _DEFAULTS
+        stored = _cached_values if _cached_values is not None else {}
+        changed = []
+        for field in fields:
+            if field not in _DEFAULTS:
+                continue
+            kind, default = _DEFAULTS[field]
+            value = getattr(self, field, default)
+            if field in stored and stored[field] == value:
+                continue
+            changed.append((field, kind, value))
+        if not changed:
+            return  # Nothing to persist — don't even open the key
+
         try:
             key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, _REG_KEY)
         except OSError:
             return  # Registry unavailable — fail silently
 
         try:
-            for field, (kind, _default) in _DEFAULTS.items():
-                value = getattr(self, field, _default)
-                _write_value(key, field, value, kind)
+            for field, kind, value in changed:
+                if _write_value(key, field, value, kind) and _cached_values is not None:
+                    _cached_values[field] = value
         finally:
             winreg.CloseKey(key)
 
@@ -353,6 +411,80 @@ class AppSettings:
 # Internal helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Win32 constants for _query_multiple(); winreg's own are not used so the
+# decoding works (and is testable) without a real registry
+_ERROR_MORE_DATA = 234
+_REG_SZ = 1
+_REG_EXPAND_SZ = 2
+_REG_DWORD = 4
+
+
+class _VALENTW(ctypes.Structure):
+    """VALENTW entry for RegQueryMultipleValuesW."""
+    _fields_ = [
+        ("ve_valuename", ctypes.c_wchar_p),
+        ("ve_valuelen", ctypes.c_ulong),    # DWORD
+        ("ve_valueptr", ctypes.c_void_p),   # DWORD_PTR into the shared buffer
+        ("ve_type", ctypes.c_ulong),        # DWORD
+    ]
+
+
+def _query_multiple(key, names):
+    """
+    Read several values of an open key in one RegQueryMultipleValuesW call.
+
+    Returns:
+        {name: raw value} (None for types _decode_value() doesn't handle),
+        or None if the call is unavailable or failed — it fails outright if
+        any one of the names is missing.
+    """
+    if sys.platform != "win32":
+        return None
+    count = len(names)
+    entries = (_VALENTW * count)()
+    for entry, name in zip(entries, names):
+        entry.ve_valuename = name
+
+    size = ctypes.c_ulong(8192)
+    for _attempt in range(2):
+        buf = ctypes.create_string_buffer(size.value)
+        # On ERROR_MORE_DATA, size is updated to the required buffer length
+        rc = ctypes.windll.advapi32.RegQueryMultipleValuesW(
+            ctypes.c_void_p(key.handle), entries, count, buf, ctypes.byref(size))
+        if rc != _ERROR_MORE_DATA:
+            break
+    if rc != 0:
+        return None
+
+    return {
+        entry.ve_valuename: _decode_value(
+            entry.ve_type, ctypes.string_at(entry.ve_valueptr, entry.ve_valuelen))
+        for entry in entries
+    }
+
+
+def _enum_values(key) -> dict:
+    """Return {name: data} for every value of an open key, via RegEnumValue."""
+    values = {}
+    try:
+        _subkeys, value_count, _modified = winreg.QueryInfoKey(key)
+        for index in range(value_count):
+            name, data, _type = winreg.EnumValue(key, index)
+            values[name] = data
+    except OSError:
+        pass  # Keep whatever was read; the rest fall back to defaults
+    return values
+
+
+def _decode_value(reg_type: int, blob: bytes):
+    """Decode raw registry data the way winreg.QueryValueEx would."""
+    if reg_type == _REG_DWORD:
+        return int.from_bytes(blob[:4], "little")
+    if reg_type in (_REG_SZ, _REG_EXPAND_SZ):
+        return blob.decode("utf-16-le").split("\x00", 1)[0]
+    return None
+
+
 def _coerce(raw, kind: str, default):
     """Convert a raw registry value to the desired Python type."""
     try:
@@ -372,17 +504,20 @@ def _coerce(raw, kind: str, default):
     return default
 
 
-def _write_value(key, name: str, value, kind: str) -> None:
-    """Write a single value to an open registry key."""
+def _write_value(key, name: str, value, kind: str) -> bool:
+    """Write a single value to an open registry key; True if it was written."""
     try:
         if kind == "int":
             winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, int(value))
         elif kind == "float":
             # Registry has no native float type; store as string
-            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, repr(float(value)))
+            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, str(float(value)))
         elif kind == "bool":
             winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, 1 if value else 0)
         elif kind == "str":
             winreg.SetValueEx(key, name, 0, winreg.REG_SZ, str(value))
+        else:
+            return False
     except (OSError, TypeError):
-        pass  # Fail silently for individual values
+        return False  # Fail silently for individual values
+    return True
@@ -0,0 +1,54 @@
+"""
+error_log.py
+PURPOSE: Rate-limited reporting for errors that repeat every acquisition cycle
+"""
+
+import collections
+import logging
+import time
+
+
+class ErrorLog:
+    """
+    Records read errors in a bounded ring buffer and forwards each distinct
+    (source, error code) to the logging module at most once per interval.
+
+    A pulled USB cable makes every channel fail on every cycle; printing each
+    failure would flood stdout and log.txt and stall the acquisition thread
+    on console I/O.
+    """
+
+    def __init__(self, logger_name, interval_s=1.0, maxlen=50):
+        """
+        Args:
+            logger_name: Name of the logging.Logger that receives warnings
+            interval_s: Minimum seconds between warnings for the same
+                        (source, error code)
+            maxlen: Number of recent errors kept in self.recent
+        """
+        self._logger = logging.getLogger(logger_name)
+        self.interval_s = interval_s
+        # (monotonic time, source, message) of the most recent errors
+        self.recent = collections.deque(maxlen=maxlen)
+        self.suppressed = 0
+        self._last_emit = {}  # (source, error code) → monotonic time
+
+    def error(self, source, exc):
+        """
+        Record an error and log it unless the same one was logged recently.
+
+        Args:
+            source: What failed, e.g. a channel name or "Batch thermocouple read"
+            exc: The exception; LJMError's errorCode is used to group repeats
+        """
+        now = time.monotonic()
+        message = str(exc)
+        self.recent.append((now, source, message))
+
+        key = (source, getattr(exc, 'errorCode', message))
+        last = self._last_emit.get(key)
+        if last is not None and now - last < self.interval_s:
+            self.suppressed += 1
+            return
+        self._last_emit[key] = now
+        self._logger.warning("%s error: %s", source, message)
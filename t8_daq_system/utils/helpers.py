@@ -4,6 +4,9 @@ PURPOSE: Utility functions for timestamp formatting, unit conversions, etc.
 """
 
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 
 def format_timestamp(dt=None, format_str="%Y-%m-%d %H:%M:%S"):
@@ -37,6 +40,66 @@ def format_timestamp_filename(dt=None):
     return dt.strftime("%Y%m%d_%H%M%S")
 
 
+def format_fixed_batch(values, precisions):
+    """
+    Format a batch of numbers as fixed-point strings.
+
+    Values sharing a precision are formatted together with one
+    np.char.mod call, so the per-value cost stays in C.
+
+    Args:
+        values: sequence or NumPy array of numbers
+        precisions: decimal places per value (sequence of ints, same length)
+
+    Returns:
+        List of formatted strings, one per value
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    precs = np.asarray(precisions, dtype=np.int64)
+    out = np.empty(vals.shape, dtype=object)
+    for prec in np.unique(precs):
+        mask = precs == prec
+        out[mask] = np.char.mod(f"%.{int(prec)}f", vals[mask])
+    return out.tolist()
+
+
+def _unit_letter(unit):
+    """Normalise 'C', '°C', 'degC', etc. to a single upper-case letter."""
+    return unit.upper().replace('°', '').replace('DEG', '').strip()[0] if unit else 'C'
+
+
+# value = celsius * k + b for each unit (and celsius = (value - b) / k)
+_FROM_CELSIUS = {'F': (9 / 5, 32.0), 'K': (1.0, 273.15)}
+
+
+@lru_cache(maxsize=None)
+def temperature_scale(from_unit, to_unit):
+    """
+    Return (k, b) such that a converted temperature is value * k + b.
+
+    C, F and K are all linear in each other, so callers converting many
+    samples look the pair up once and apply it per value instead of
+    calling convert_temperature() each time.
+
+    Args:
+        from_unit: Source unit ('C', 'F', or 'K')
+        to_unit: Target unit ('C', 'F', or 'K')
+
+    Returns:
+        (k, b) tuple; (1.0, 0.0) when the units match
+    """
+    f = _unit_letter(from_unit)
+    t = _unit_letter(to_unit)
+    if f == t:
+        return 1.0, 0.0
+
+    k_in, b_in = _FROM_CELSIUS.get(f, (1.0, 0.0))
+    k_out, b_out = _FROM_CELSIUS.get(t, (1.0, 0.0))
+    # celsius = (value - b_in) / k_in, then target = celsius * k_out + b_out
+    k = k_out / k_in
+    return k, b_out - b_in * k
+
+
 def convert_temperature(value, from_unit, to_unit):
     """
     Convert temperature between units.
@@ -49,29 +112,10 @@ def convert_temperature(value, from_unit, to_unit):
     Returns:
         Converted temperature value
     """
-    # Normalize units: take last character if it contains a degree symbol, 
-    # otherwise take the first character.  Handles 'C', '°C', 'degC', etc.
-    f = from_unit.upper().replace('°', '').replace('DEG', '').strip()[0] if from_unit else 'C'
-    t = to_unit.upper().replace('°', '').replace('DEG', '').strip()[0] if to_unit else 'C'
-
-    if f == t:
+    k, b = temperature_scale(from_unit, to_unit)
+    if k == 1.0 and b == 0.0:
         return value
-
-    # Convert to Celsius first
-    if f == 'F':
-        celsius = (value - 32) * 5/9
-    elif f == 'K':
-        celsius = value - 273.15
-    else:
-        celsius = value
-
-    # Convert from Celsius to target
-    if t == 'F':
-        return celsius * 9/5 + 32
-    elif t == 'K':
-        return celsius + 273.15
-    else:
-        return celsius
+    return value * k + b
 
 
 def linear_scale(value, in_min, in_max, out_min, out_max):
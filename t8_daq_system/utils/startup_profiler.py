@@ -4,10 +4,16 @@ PURPOSE: Track startup timing to identify PyInstaller bottlenecks
 FIXED: Handle all encoding issues for Windows console
 """
 
+import os
 import sys
 import time
 
-PROFILER_ENABLED = False  # Set True to re-enable startup timing output
+# Startup timing output is off unless T8_PROFILE is set (e.g. T8_PROFILE=1)
+PROFILER_ENABLED = os.environ.get('T8_PROFILE', '') not in ('', '0')
+
+
+def _noop(*args, **kwargs):
+    pass
 
 
 class StartupProfiler:
@@ -20,6 +26,14 @@ class StartupProfiler:
             is_frozen = getattr(sys, 'frozen', False)
             mode = "FROZEN EXE" if is_frozen else "DEVELOPMENT"
             self.log(f"=== PROFILER ACTIVE ({mode}) ===")
+        else:
+            self._silence()
+
+    def _silence(self):
+        """Shadow the logging methods with a no-op on this instance."""
+        # Call sites then skip the enabled check and the message formatting
+        # inside section()/checkpoint()
+        self.log = self.section = self.checkpoint = _noop
 
     def _safe_print(self, text):
         """Print text safely, handling encoding errors."""
@@ -83,5 +97,6 @@ class StartupProfiler:
 
     def disable(self):
         self.enabled = False
+        self._silence()
 
 profiler = StartupProfiler()
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Unit tests for AppSettings - registry persistence.
+"""
+
+import unittest
+from unittest.mock import patch
+
+# conftest.py replaces winreg with a MagicMock on non-Windows hosts
+from t8_daq_system.settings import app_settings
+from t8_daq_system.settings.app_settings import AppSettings, _DEFAULTS
+
+
+class TestAppSettingsSave(unittest.TestCase):
+    """save() writes either every field or only the ones requested."""
+
+    def setUp(self):
+        patcher = patch('t8_daq_system.settings.app_settings.winreg')
+        self.winreg = patcher.start()
+        self.addCleanup(patcher.stop)
+        app_settings._cached_values = None
+        self.addCleanup(setattr, app_settings, '_cached_values', None)
+        # Empty registry key unless a test says otherwise
+        self.winreg.QueryInfoKey.return_value = (0, 0, 0)
+        self.settings = AppSettings()
+
+    def _written_names(self):
+        return [c.args[1] for c in self.winreg.SetValueEx.call_args_list]
+
+    def test_save_writes_every_field(self):
+        self.settings.save()
+        self.assertEqual(self._written_names(), list(_DEFAULTS))
+
+    def test_save_subset_writes_only_named_fields(self):
+        self.settings.tc_count = 4
+        self.settings.save(['tc_count', 'not_a_setting'])
+        self.assertEqual(self._written_names(), ['tc_count'])
+        self.winreg.SetValueEx.assert_called_once_with(
+            self.winreg.CreateKey.return_value, 'tc_count', 0,
+            self.winreg.REG_DWORD, 4)
+
+    def test_save_empty_subset_skips_registry(self):
+        self.settings.save([])
+        self.winreg.CreateKey.assert_not_called()
+        self.winreg.SetValueEx.assert_not_called()
+
+    def test_repeat_save_writes_only_changed_fields(self):
+        self.settings.load()
+        self.settings.save()
+        self.winreg.reset_mock()
+
+        self.settings.save()
+        self.winreg.CreateKey.assert_not_called()
+
+        self.settings.tc_count = 5
+        self.settings.save()
+        self.assertEqual(self._written_names(), ['tc_count'])
+
+    def test_loaded_values_are_not_rewritten(self):
+        self.winreg.QueryInfoKey.return_value = (0, 1, 0)
+        self.winreg.EnumValue.side_effect = [('tc_count', 3, self.winreg.REG_DWORD)]
+        self.settings.load()
+        self.assertEqual(self.settings.tc_count, 3)
+
+        self.settings.save()
+        self.assertNotIn('tc_count', self._written_names())
+        self.assertIn('tc_type', self._written_names())
+
+    def test_load_reads_registry_once(self):
+        AppSettings().load()
+        self.winreg.reset_mock()
+
+        AppSettings().load()
+        self.winreg.OpenKey.assert_not_called()
+
+        AppSettings().reload()
+        self.winreg.OpenKey.assert_called_once()
+
+    def test_save_updates_load_cache(self):
+        self.settings.load()
+        self.settings.tc_count = 6
+        self.settings.save()
+        self.winreg.reset_mock()
+
+        fresh = AppSettings().load()
+        self.winreg.OpenKey.assert_not_called()
+        self.assertEqual(fresh.tc_count, 6)
+
+    def test_stale_instance_saves_against_shared_cache(self):
+        first = AppSettings().load()
+        stale = AppSettings().load()
+        first.tc_count = 6
+        first.save(['tc_count'])
+        self.winreg.reset_mock()
+
+        # stale still holds the value loaded before first's save
+        stale.save(['tc_count'])
+        self.winreg.SetValueEx.assert_called_once_with(
+            self.winreg.CreateKey.return_value, 'tc_count', 0,
+            self.winreg.REG_DWORD, stale.tc_count)
+
+        self.winreg.reset_mock()
+        stale.save(['tc_count'])
+        self.winreg.CreateKey.assert_not_called()
+
+
+class TestRegistryDecoding(unittest.TestCase):
+    """Raw RegQueryMultipleValuesW data decodes like winreg.QueryValueEx."""
+
+    def test_decode_dword(self):
+        self.assertEqual(app_settings._decode_value(
+            app_settings._REG_DWORD, (1000).to_bytes(4, 'little')), 1000)
+
+    def test_decode_string_strips_terminator(self):
+        blob = 'AIN6,AIN7\x00'.encode('utf-16-le')
+        self.assertEqual(app_settings._decode_value(app_settings._REG_SZ, blob), 'AIN6,AIN7')
+
+    def test_decode_unknown_type_returns_none(self):
+        self.assertIsNone(app_settings._decode_value(3, b'\x01'))  # REG_BINARY
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -72,5 +72,20 @@ class TestDataBuffer(unittest.TestCase):
         self.assertEqual(buffer.data['TC1'][2], None) # Should be padded
         self.assertEqual(buffer.data['TC2'][2], 30.0)
 
+    def test_get_all_current_reuses_snapshot(self):
+        """The current-values dict is only rebuilt after a new reading."""
+        buffer = DataBuffer()
+        buffer.add_reading({'TC1': 1.0})
+        first = buffer.get_all_current()
+        self.assertIs(buffer.get_all_current(), first)
+
+        buffer.add_reading({'TC1': 2.0})
+        second = buffer.get_all_current()
+        self.assertIsNot(second, first)
+        self.assertEqual(second, {'TC1': 2.0})
+
+        buffer.clear()
+        self.assertEqual(buffer.get_all_current(), {})
+
 if __name__ == '__main__':
     unittest.main()
@@ -59,6 +59,33 @@ class TestDataLogger(unittest.TestCase):
             self.assertEqual(parts[1], '25.5')
             self.assertEqual(parts[2], '100.2')
 
+    def test_log_reading_column_precision(self):
+        """Gauge and power supply columns keep their fixed CSV precision."""
+        sensor_names = ['TC1', 'FRG702_1', 'PS_Voltage', 'PS_Current']
+        filepath = self.logger.start_logging(sensor_names)
+
+        self.logger.log_reading({'TC1': 25.5, 'FRG702_1': 1.234e-6,
+                                 'PS_Voltage': 2.5, 'PS_Current': None})
+        self.logger.stop_logging()
+
+        with open(filepath, 'r') as f:
+            data_line = [line for line in f
+                         if not line.startswith(('#', 'Timestamp'))][0]
+        self.assertEqual(data_line.strip().split(',')[1:],
+                         ['25.5', '1.23e-06', '2.5000', ''])
+
+    def test_log_reading_trims_full_precision_floats(self):
+        """Unrounded reader values are trimmed to DEFAULT_FORMAT on write."""
+        filepath = self.logger.start_logging(['TC1', 'TC1_rawV'])
+        self.logger.log_reading({'TC1': 25.123456789, 'TC1_rawV': 0.00123456789})
+        self.logger.stop_logging()
+
+        with open(filepath, 'r') as f:
+            data_line = [line for line in f
+                         if not line.startswith(('#', 'Timestamp'))][0]
+        self.assertEqual(data_line.strip().split(',')[1:],
+                         ['25.12346', '0.001234568'])
+
     def test_get_log_files(self):
         self.logger.start_logging(['S1'])
         self.logger.stop_logging()
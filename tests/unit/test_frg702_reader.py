@@ -4,8 +4,12 @@ Tests the conversion logic without requiring hardware dependencies.
 """
 
 import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
 from t8_daq_system.hardware.frg702_reader import (
     FRG702Reader,
+    FRG702AnalogReader,
     STATUS_SENSOR_ERROR_NO_SUPPLY,
     STATUS_UNDERRANGE,
     STATUS_OVERRANGE,
@@ -134,6 +138,15 @@ class TestFRG702UnitConversions(unittest.TestCase):
         result = FRG702Reader.convert_pressure(1013.25, 'mbar', 'Torr')
         self.assertAlmostEqual(result, 760, delta=1)
 
+    def test_conversion_factor_matches_convert_pressure(self):
+        """The cached multiplier agrees with the per-value conversion."""
+        for src in ('mbar', 'Torr', 'Pa'):
+            for dst in ('mbar', 'Torr', 'Pa'):
+                factor = FRG702Reader.conversion_factor(src, dst)
+                self.assertAlmostEqual(
+                    2.5 * factor, FRG702Reader.convert_pressure(2.5, src, dst),
+                    places=9, msg=f"{src}->{dst}")
+
 
 class TestFRG702OperatingMode(unittest.TestCase):
     """Test operating mode detection from Pin 6 status voltage."""
@@ -218,5 +231,159 @@ class TestFRG702PrecisionNotRounded(unittest.TestCase):
         self.assertLess(pressure, 1e-2)
 
 
+class TestFRG702VectorisedConversion(unittest.TestCase):
+    """The NumPy conversion must agree with the scalar formula."""
+
+    def test_matches_scalar_across_bands(self):
+        voltages = [0.0, 0.3, 0.5, 1.0, 1.82, 5.0, 6.8, 8.6, 9.0, 9.5, 10.5]
+        batch = FRG702Reader.voltages_to_pressures_mbar(voltages)
+        for v, (pressure, status) in zip(voltages, batch):
+            exp_p, exp_status = FRG702Reader.voltage_to_pressure_mbar(v)
+            self.assertEqual(status, exp_status, msg=f"{v} V")
+            if exp_p is None:
+                self.assertIsNone(pressure)
+            else:
+                self.assertAlmostEqual(pressure, exp_p, delta=exp_p * 1e-12)
+
+
+class TestFRG702AnalogBatchRead(unittest.TestCase):
+    """Analog gauges are read with one batched LJM call."""
+
+    def setUp(self):
+        self.gauges = [
+            {'name': 'FRG_A', 'pin': 'AIN2', 'enabled': True},
+            {'name': 'FRG_Off', 'pin': 'AIN3', 'enabled': False},
+            {'name': 'FRG_B', 'pin': 'AIN4', 'enabled': True},
+        ]
+        self.reader = FRG702AnalogReader(1, self.gauges)
+
+    @patch('t8_daq_system.hardware.frg702_reader.ljm')
+    def test_single_eReadNames_call(self, mock_ljm):
+        """Enabled pins are read in one transaction, disabled ones skipped."""
+        mock_ljm.eReadNames.return_value = [6.8, 0.3]
+        readings = self.reader.read_all_with_status()
+
+        mock_ljm.eReadNames.assert_called_once_with(1, 2, ['AIN2', 'AIN4'])
+        mock_ljm.eReadName.assert_not_called()
+        self.assertEqual(readings['FRG_A']['status'], STATUS_VALID)
+        self.assertAlmostEqual(readings['FRG_A']['pressure'], 1.0, delta=0.1)
+        self.assertEqual(readings['FRG_B']['status'], STATUS_SENSOR_ERROR_NO_SUPPLY)
+        self.assertNotIn('FRG_Off', readings)
+
+    @patch('t8_daq_system.hardware.frg702_reader.ljm')
+    def test_batch_failure_marks_all_gauges(self, mock_ljm):
+        """A failed batch read reports every enabled gauge as None."""
+        mock_ljm.eReadNames.side_effect = RuntimeError("timeout")
+        with self.assertLogs('t8_daq_system.hardware.frg702_reader', 'WARNING') as logs:
+            self.assertEqual(self.reader.read_all(), {'FRG_A': None, 'FRG_B': None})
+        self.assertIn("timeout", logs.output[0])
+
+    @patch('t8_daq_system.hardware.frg702_reader.ljm')
+    def test_reassigning_gauges_refreshes_pin_cache(self, mock_ljm):
+        """Replacing the gauge list rebuilds the cached read names."""
+        self.reader.gauges = [{'name': 'FRG_C', 'pin': 'AIN6'}]
+        mock_ljm.eReadNames.return_value = [5.0]
+        self.reader.read_all()
+        mock_ljm.eReadNames.assert_called_once_with(1, 1, ['AIN6'])
+        self.assertEqual(self.reader.get_enabled_channels(), ['FRG_C'])
+
+    @patch('t8_daq_system.hardware.frg702_reader.ljm')
+    def test_read_single_looks_up_pin_by_name(self, mock_ljm):
+        """read_single() reads only the named gauge's pin."""
+        mock_ljm.eReadName.return_value = 6.8
+        self.assertAlmostEqual(self.reader.read_single('FRG_B'), 1.0, delta=0.1)
+        mock_ljm.eReadName.assert_called_once_with(1, 'AIN4')
+        self.assertIsNone(self.reader.read_single('FRG_Off'))
+        self.assertEqual(mock_ljm.eReadName.call_count, 1)
+
+
+class TestFRG702ClassifyVoltages(unittest.TestCase):
+    """Batch conversion returns pressure and status-code arrays."""
+
+    def test_codes_and_nan_outside_range(self):
+        pressures, codes = FRG702Reader.classify_voltages([0.3, 1.0, 6.8, 9.0, 9.8])
+        self.assertEqual(codes.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(np.isnan(pressures).tolist(), [True, True, False, True, True])
+        expected, _ = FRG702Reader.voltage_to_pressure_mbar(6.8)
+        self.assertAlmostEqual(pressures[2], expected)
+
+
+class TestFRG702ReaderLookup(unittest.TestCase):
+    """XGS-600 reader resolves gauges through its cached name table."""
+
+    def test_read_single_uses_name_table(self):
+        controller = MagicMock()
+        controller.read_units.return_value = 'mbar'
+        controller.read_pressure.return_value = 2.0e-5
+        reader = FRG702Reader(controller, [
+            {'name': 'FRG_A', 'sensor_code': 'T1', 'units': 'mbar'},
+            {'name': 'FRG_B', 'sensor_code': 'T2', 'enabled': False},
+        ])
+
+        self.assertEqual(reader.read_single('FRG_A'), 2.0e-5)
+        controller.read_pressure.assert_called_once_with('T1')
+        self.assertIsNone(reader.read_single('FRG_B'))
+        self.assertEqual(reader.get_enabled_channels(), ['FRG_A'])
+
+    def test_set_output_unit_rebuilds_factors(self):
+        """Changing the output unit takes effect on the next batch read."""
+        controller = MagicMock()
+        controller.read_units.return_value = 'mbar'
+        controller.read_pressure.return_value = 2.0
+        reader = FRG702Reader(controller, [
+            {'name': 'FRG_A', 'sensor_code': 'T1', 'units': 'mbar'},
+        ])
+
+        self.assertEqual(reader.read_all(), {'FRG_A': 2.0})
+        reader.set_output_unit('Pa')
+        self.assertAlmostEqual(reader.read_all()['FRG_A'], 200.0)
+        self.assertEqual(reader.gauges[0]['units'], 'Pa')
+
+    def test_read_all_uses_single_dump(self):
+        """Convection gauges come from one 0F dump, not per-gauge queries."""
+        controller = MagicMock()
+        controller.read_units.return_value = 'Torr'
+        controller.read_all_pressures.return_value = [7.5e2, None, 1.0e-3, None]
+        reader = FRG702Reader(controller, [
+            {'name': 'FRG_A', 'sensor_code': 'T1', 'units': 'Torr'},
+            {'name': 'FRG_C', 'sensor_code': 't3', 'units': 'Torr'},
+            {'name': 'FRG_D', 'sensor_code': 'T2', 'units': 'Torr'},
+        ])
+
+        self.assertEqual(reader.read_all(),
+                         {'FRG_A': 7.5e2, 'FRG_C': 1.0e-3, 'FRG_D': None})
+        controller.read_all_pressures.assert_called_once_with()
+        controller.read_pressure.assert_not_called()
+
+    def test_read_all_falls_back_when_dump_fails(self):
+        """A failed dump falls back to the per-gauge 02xx query."""
+        controller = MagicMock()
+        controller.read_units.return_value = 'Torr'
+        controller.read_all_pressures.return_value = None
+        controller.read_pressure.return_value = 5.0e-4
+        reader = FRG702Reader(controller, [
+            {'name': 'FRG_A', 'sensor_code': 'T1', 'units': 'Torr'},
+        ])
+
+        self.assertEqual(reader.read_all(), {'FRG_A': 5.0e-4})
+        controller.read_pressure.assert_called_once_with('T1')
+
+    def test_read_all_skips_dump_without_convection_gauges(self):
+        """No 0F dump is sent when no gauge has a slot in it."""
+        controller = MagicMock()
+        controller.read_units.return_value = 'Torr'
+        controller.read_pressure.return_value = 1.0e-7
+        reader = FRG702Reader(controller, [
+            {'name': 'ION', 'sensor_code': 'I1', 'units': 'Torr'},
+        ])
+
+        self.assertEqual(reader.read_all(), {'ION': 1.0e-7})
+        controller.read_all_pressures.assert_not_called()
+
+        reader.gauges = [{'name': 'FRG_A', 'sensor_code': 'T1', 'units': 'Torr'}]
+        reader.read_all()
+        controller.read_all_pressures.assert_called_once_with()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,10 @@ mock_ljm = sys.modules['labjack'].ljm
 
 from t8_daq_system.hardware.thermocouple_reader import ThermocoupleReader
 from t8_daq_system.hardware.labjack_connection import LabJackConnection
+from t8_daq_system.hardware.xgs600_controller import XGS600Controller
+from t8_daq_system.hardware.frg702_reader import FRG702AnalogReader
+from t8_daq_system.hardware.keysight_analog_controller import KeysightAnalogController
+from t8_daq_system.hardware.combined_reader import CombinedReader
 
 class TestHardware(unittest.TestCase):
     def setUp(self):
@@ -50,9 +54,13 @@ class TestHardware(unittest.TestCase):
         self.assertTrue(conn.is_connected())
 
         # Test AIN single-ended configuration for T8 (should use channel index)
-        mock_ljm.eReadName.return_value = 4.0
-        self.assertTrue(conn.configure_ain_single_ended([4]))
-        mock_ljm.eWriteName.assert_any_call(self.mock_handle, "AIN4_NEGATIVE_CH", 4)
+        mock_ljm.eReadNames.return_value = [4.0, 5.0]
+        self.assertTrue(conn.configure_ain_single_ended([4, 5]))
+        regs = ["AIN4_NEGATIVE_CH", "AIN5_NEGATIVE_CH"]
+        mock_ljm.eWriteNames.assert_called_once_with(self.mock_handle, 2, regs, [4, 5])
+        mock_ljm.eReadNames.assert_called_once_with(self.mock_handle, 2, regs)
+        mock_ljm.eReadNames.return_value = [4.0, 199.0]
+        self.assertFalse(conn.configure_ain_single_ended([4, 5]))
 
         info = conn.get_device_info()
         self.assertEqual(info['serial_number'], 12345)
@@ -61,10 +69,68 @@ class TestHardware(unittest.TestCase):
         mock_ljm.close.assert_called_with(self.mock_handle)
         self.assertFalse(conn.is_connected())
 
+    def test_is_connected_reuses_recent_probe(self):
+        """A successful probe is trusted for PROBE_TTL_S; max_age=0 re-reads."""
+        mock_ljm.openS.return_value = self.mock_handle
+        conn = LabJackConnection()
+        conn.connect()
+        mock_ljm.eReadName.reset_mock()
+
+        self.assertTrue(conn.is_connected())
+        mock_ljm.eReadName.assert_not_called()
+
+        mock_ljm.eReadName.side_effect = mock_ljm.LJMError("unplugged")
+        self.assertFalse(conn.is_connected(max_age=0))
+        self.assertIsNone(conn.get_handle())
+        mock_ljm.eReadName.side_effect = None
+
+    def test_batch_reads_refresh_liveness(self):
+        """read_names_batch() results feed is_connected() without a probe."""
+        mock_ljm.openS.return_value = self.mock_handle
+        conn = LabJackConnection()
+        conn.connect()
+
+        mock_ljm.namesToAddresses.return_value = ([0], [3])
+        mock_ljm.eReadAddresses.side_effect = mock_ljm.LJMError("timeout")
+        self.assertEqual(conn.read_names_batch(["AIN0"]), [None])
+        mock_ljm.eReadAddresses.side_effect = None
+        mock_ljm.eReadName.reset_mock()
+        self.assertTrue(conn.is_connected())
+        mock_ljm.eReadName.assert_called_once_with(self.mock_handle, "SERIAL_NUMBER")
+
+        mock_ljm.eReadAddresses.return_value = [1.0]
+        conn.read_names_batch(["AIN0"])
+        mock_ljm.eReadName.reset_mock()
+        self.assertTrue(conn.is_connected())
+        mock_ljm.eReadName.assert_not_called()
+
+    def test_batch_reads_resolve_names_once(self):
+        """Register names are resolved to addresses on the first batch only."""
+        mock_ljm.openS.return_value = self.mock_handle
+        mock_ljm.namesToAddresses.return_value = ([8, 10], [3, 3])
+        mock_ljm.eReadAddresses.return_value = [1.5, 2.5]
+        conn = LabJackConnection()
+        conn.connect()
+
+        self.assertEqual(conn.read_names_batch(["AIN4", "AIN5"]), [1.5, 2.5])
+        self.assertEqual(conn.read_names_batch(["AIN4", "AIN5"]), [1.5, 2.5])
+        mock_ljm.namesToAddresses.assert_called_once_with(2, ["AIN4", "AIN5"])
+        mock_ljm.eReadAddresses.assert_called_with(self.mock_handle, 2, [8, 10], [3, 3])
+        mock_ljm.eReadNames.assert_not_called()
+
     def test_tc_reader_init(self):
         reader = ThermocoupleReader(self.mock_handle, self.tc_config)
-        # Check if some configuration calls were made
-        self.assertTrue(mock_ljm.eWriteName.called)
+        # All channel configuration goes out in a single batched write
+        mock_ljm.eWriteNames.assert_called_once_with(
+            self.mock_handle, 3,
+            ["AIN0_RANGE", "AIN0_EF_INDEX", "AIN0_EF_CONFIG_A"],
+            [0.1, ThermocoupleReader.TC_TYPES['K'], 1])
+
+    def test_tc_type_codes_match_ef_index_table(self):
+        """EF_INDEX codes follow the LabJack T-series thermocouple table."""
+        self.assertEqual(ThermocoupleReader.TC_TYPES, {
+            'E': 20, 'J': 21, 'K': 22, 'R': 23, 'T': 24,
+            'S': 25, 'N': 27, 'B': 28, 'C': 30})
 
     def test_tc_reader_read_all(self):
         # read_all() uses batch eReadNames (plural), returns a list
@@ -85,5 +151,169 @@ class TestHardware(unittest.TestCase):
 
         self.assertIsNone(readings['TC1'])
 
+    def test_tc_reader_register_names_follow_config(self):
+        """Batch register names are rebuilt only when the config is replaced."""
+        reader = ThermocoupleReader(self.mock_handle, self.tc_config)
+        names = reader._read_names
+        mock_ljm.eReadNames.return_value = [20.0]
+        reader.read_all()
+        self.assertIs(reader._read_names, names)
+
+        reader.thermocouples = self.tc_config + [
+            {"name": "TC2", "channel": 2, "type": "K", "enabled": True},
+            {"name": "TC3", "channel": 3, "type": "K", "enabled": False},
+        ]
+        mock_ljm.eReadNames.return_value = [20.0, 21.0]
+        self.assertEqual(reader.read_all(), {'TC1': 20.0, 'TC2': 21.0})
+        mock_ljm.eReadNames.assert_called_with(
+            self.mock_handle, 2, ["AIN0_EF_READ_A", "AIN2_EF_READ_A"])
+
+    def test_tc_reader_single_and_raw_use_cached_names(self):
+        """read_single() and read_raw_voltages() use the per-config caches."""
+        reader = ThermocoupleReader(self.mock_handle, self.tc_config)
+        mock_ljm.eReadName.return_value = 25.1234
+        self.assertEqual(reader.read_single('TC1'), 25.1234)
+        mock_ljm.eReadName.assert_called_with(self.mock_handle, "AIN0_EF_READ_A")
+        self.assertIsNone(reader.read_single('TC9'))
+
+        mock_ljm.eReadNames.return_value = [0.00123]
+        self.assertEqual(reader.read_raw_voltages(), {'TC1_rawV': 0.00123})
+        self.assertEqual(reader.get_enabled_channels(), ['TC1'])
+
+    def test_tc_read_single_reuses_recent_batch(self):
+        """read_single() answers from a batch younger than BATCH_TTL_S."""
+        reader = ThermocoupleReader(self.mock_handle, self.tc_config)
+        mock_ljm.eReadNames.return_value = [30.5]
+        reader.read_all()
+        mock_ljm.eReadName.reset_mock()
+        self.assertEqual(reader.read_single('TC1'), 30.5)
+        mock_ljm.eReadName.assert_not_called()
+
+        stamp, readings = reader._last_batch
+        reader._last_batch = (stamp - reader.BATCH_TTL_S, readings)
+        mock_ljm.eReadName.return_value = 31.0
+        self.assertEqual(reader.read_single('TC1'), 31.0)
+        mock_ljm.eReadName.assert_called_once_with(self.mock_handle, "AIN0_EF_READ_A")
+
+class TestCombinedReader(unittest.TestCase):
+    """T8-backed readers share one eReadAddresses transaction per cycle."""
+
+    NAMES = ["AIN0_EF_READ_A", "AIN0", "AIN2", "AIN4", "AIN5", "FIO1"]
+
+    def setUp(self):
+        mock_ljm.reset_mock(return_value=True, side_effect=True)
+        mock_ljm.LJMError = type("LJMError", (Exception,), {})
+        self.tc = ThermocoupleReader(1, [{"name": "TC1", "channel": 0, "type": "K",
+                                          "units": "C", "enabled": True}])
+        self.frg = FRG702AnalogReader(1, [{"name": "FRG_A", "pin": "AIN2", "enabled": True}])
+        self.ps = KeysightAnalogController(1, rated_max_volts=6.0, rated_max_amps=180.0)
+        mock_ljm.reset_mock(return_value=True, side_effect=True)
+        self.addresses = ([7000, 0, 4, 8, 10, 2001], [3, 3, 3, 3, 3, 0])
+        mock_ljm.namesToAddresses.return_value = self.addresses
+
+    def test_single_transaction_sliced_per_reader(self):
+        mock_ljm.eReadAddresses.return_value = [25.5, 0.001, 6.8, 2.5, 2.5, 0]
+        combined = CombinedReader(self.tc, self.frg, self.ps)
+        tc, raw, frg, ps = combined.read_all()
+
+        mock_ljm.namesToAddresses.assert_called_once_with(6, self.NAMES)
+        mock_ljm.eReadAddresses.assert_called_once_with(1, 6, *self.addresses)
+        mock_ljm.eReadNames.assert_not_called()
+        self.assertEqual(tc, {"TC1": 25.5})
+        self.assertEqual(raw, {"TC1_rawV": 0.001})
+        self.assertAlmostEqual(frg["FRG_A"]["pressure"], 1.0, delta=0.1)
+        self.assertAlmostEqual(ps["PS_Voltage"], 3.0)
+        self.assertAlmostEqual(ps["PS_Current"], 90.0)
+        self.assertTrue(ps["PS_Output_On"])
+
+    def test_addresses_resolved_until_registers_change(self):
+        mock_ljm.eReadAddresses.side_effect = lambda h, n, a, t: [1.0] * n
+        combined = CombinedReader(self.tc, self.frg, self.ps)
+        combined.read_all()
+        combined.read_all()
+        self.assertEqual(mock_ljm.namesToAddresses.call_count, 1)
+
+        self.frg.gauges = [{"name": "FRG_B", "pin": "AIN3"}]
+        mock_ljm.namesToAddresses.return_value = self.addresses
+        combined.read_all()
+        self.assertEqual(mock_ljm.namesToAddresses.call_count, 2)
+        self.assertEqual(mock_ljm.namesToAddresses.call_args.args[1][2], "AIN3")
+
+    def test_falls_back_to_separate_reads_on_error(self):
+        mock_ljm.eReadAddresses.side_effect = mock_ljm.LJMError("timeout")
+        mock_ljm.eReadNames.side_effect = lambda h, n, names: [25.5] * n
+        tc, _, _, _ = CombinedReader(self.tc, self.frg, self.ps).read_all()
+        self.assertEqual(tc, {"TC1": 25.5})
+        self.assertTrue(mock_ljm.eReadNames.called)
+
+    def test_falls_back_on_non_ljm_errors(self):
+        mock_ljm.namesToAddresses.side_effect = TypeError("bad handle")
+        mock_ljm.eReadNames.side_effect = lambda h, n, names: [25.5] * n
+        tc, _, _, _ = CombinedReader(self.tc, self.frg, self.ps).read_all()
+        self.assertEqual(tc, {"TC1": 25.5})
+
+    def test_non_t8_readers_are_read_on_their_own(self):
+        xgs_reader, other_ps = MagicMock(), MagicMock()
+        xgs_reader.read_all_with_status.return_value = {"FRG_X": {"pressure": 1e-6}}
+        other_ps.get_readings.return_value = {"PS_Voltage": 1.0}
+        mock_ljm.eReadAddresses.side_effect = lambda h, n, a, t: [25.5] * n
+
+        tc, raw, frg, ps = CombinedReader(self.tc, xgs_reader, other_ps).read_all()
+
+        self.assertEqual(mock_ljm.namesToAddresses.call_args.args[1],
+                         ["AIN0_EF_READ_A", "AIN0"])
+        self.assertEqual(tc, {"TC1": 25.5})
+        self.assertEqual(raw, {"TC1_rawV": 25.5})
+        self.assertEqual(frg, {"FRG_X": {"pressure": 1e-6}})
+        self.assertEqual(ps, {"PS_Voltage": 1.0})
+
+    def test_non_t8_tc_reader_keeps_raw_voltages(self):
+        tc_reader = MagicMock()
+        tc_reader.read_all.return_value = {"TC1": 20.0}
+        tc_reader.read_raw_voltages.return_value = {"TC1_rawV": 0.002}
+        tc, raw, _, _ = CombinedReader(tc_reader).read_all()
+        self.assertEqual(tc, {"TC1": 20.0})
+        self.assertEqual(raw, {"TC1_rawV": 0.002})
+
+
+class TestHardwarePackageExports(unittest.TestCase):
+    def test_lazy_exports_resolve_to_module_classes(self):
+        """Package-level names resolve on first access to the defining class."""
+        import t8_daq_system.hardware as hardware
+        self.assertIs(hardware.XGS600Controller, XGS600Controller)
+        self.assertIs(hardware.ThermocoupleReader, ThermocoupleReader)
+        self.assertIn('FRG702AnalogReader', dir(hardware))
+        with self.assertRaises(AttributeError):
+            hardware.NotADriver
+
+class TestXGS600Parsing(unittest.TestCase):
+    def test_read_all_pressures_parses_padded_dump(self):
+        """Padded values parse directly; NOCBL and blank slots become None."""
+        xgs = XGS600Controller('COM1')
+        xgs._serial = MagicMock(is_open=True)
+        with patch.object(xgs, 'send_command',
+                          return_value="7.592E+02,NOCBL    , 1.0E-06 ,"):
+            self.assertEqual(xgs.read_all_pressures(),
+                             [759.2, None, 1.0e-06, None])
+
+    def test_read_pressure_parses_single_reply(self):
+        """Single-gauge replies parse directly; NOCBL becomes None."""
+        xgs = XGS600Controller('COM1')
+        xgs._serial = MagicMock(is_open=True)
+        with patch.object(xgs, 'send_command', return_value=" 2.500E-03 "):
+            self.assertEqual(xgs.read_pressure('T1'), 2.5e-03)
+        with patch.object(xgs, 'send_command', return_value="NOCBL    "):
+            self.assertIsNone(xgs.read_pressure('T1'))
+
+    def test_send_command_reads_without_settle_delay(self):
+        """The reply is read straight after the write, with no fixed sleep."""
+        xgs = XGS600Controller('COM1')
+        xgs._serial = MagicMock(is_open=True)
+        xgs._serial.read_until.return_value = b'>1.0E-06\r'
+        with patch('t8_daq_system.hardware.xgs600_controller.time.sleep') as sleep:
+            self.assertEqual(xgs.send_command('02T1'), '1.0E-06')
+        sleep.assert_not_called()
+        xgs._serial.write.assert_called_once_with(b'#0002T1\r')
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,12 @@
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 from t8_daq_system.utils.helpers import (
     format_timestamp,
     format_timestamp_filename,
+    format_fixed_batch,
     convert_temperature,
+    temperature_scale,
     linear_scale,
     clamp
 )
@@ -18,6 +21,12 @@ class TestHelpers(unittest.TestCase):
         dt = datetime(2023, 12, 15, 14, 30, 22)
         self.assertEqual(format_timestamp_filename(dt), "20231215_143022")
 
+    def test_format_fixed_batch(self):
+        self.assertEqual(
+            format_fixed_batch([1.2345, 2.5, 10.0], [2, 0, 1]),
+            ["1.23", "2", "10.0"])
+        self.assertEqual(format_fixed_batch([], []), [])
+
     def test_convert_temperature(self):
         # C to F
         self.assertAlmostEqual(convert_temperature(0, 'C', 'F'), 32)
@@ -32,6 +41,14 @@ class TestHelpers(unittest.TestCase):
         # Same unit
         self.assertEqual(convert_temperature(25, 'C', 'C'), 25)
 
+    def test_temperature_scale(self):
+        """(k, b) pairs apply as value * k + b and accept degree spellings."""
+        k, b = temperature_scale('°F', 'K')
+        self.assertAlmostEqual(212 * k + b, 373.15)
+        self.assertEqual(temperature_scale('degC', 'C'), (1.0, 0.0))
+        k, b = temperature_scale('K', 'F')
+        self.assertAlmostEqual(0 * k + b, -459.67)
+
     def test_linear_scale(self):
         self.assertEqual(linear_scale(0.5, 0.5, 4.5, 0, 100), 0)
         self.assertEqual(linear_scale(4.5, 0.5, 4.5, 0, 100), 100)
@@ -42,5 +59,23 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(clamp(-1, 0, 10), 0)
         self.assertEqual(clamp(11, 0, 10), 10)
 
+
+class TestErrorLog(unittest.TestCase):
+    def test_repeated_error_logged_once_per_interval(self):
+        from t8_daq_system.utils.error_log import ErrorLog
+        log = ErrorLog('t8_daq_system.test_error_log', interval_s=1.0, maxlen=3)
+        with patch('t8_daq_system.utils.error_log.time.monotonic', return_value=100.0):
+            with self.assertLogs('t8_daq_system.test_error_log', 'WARNING') as cm:
+                for _ in range(5):
+                    log.error('TC_1', RuntimeError('device not found'))
+                log.error('TC_2', RuntimeError('device not found'))
+        self.assertEqual(len(cm.output), 2)
+        self.assertEqual(log.suppressed, 4)
+        self.assertEqual(len(log.recent), 3)
+
+        with patch('t8_daq_system.utils.error_log.time.monotonic', return_value=101.5):
+            with self.assertLogs('t8_daq_system.test_error_log', 'WARNING'):
+                log.error('TC_1', RuntimeError('device not found'))
+
 if __name__ == '__main__':
     unittest.main()
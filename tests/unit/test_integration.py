@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import MagicMock, patch
 import sys
+import math
+import threading
 import json
 import os
 import tempfile
@@ -155,5 +157,163 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(len(call_count), 1,
                          "_auto_start_acquisition should call _on_start only once")
 
+    @patch('t8_daq_system.gui.main_window.XGS600Controller')
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_xgs600_reconnect_reuses_controller(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk, mock_xgs_cls):
+        """Auto-reconnect reopens the same XGS-600 controller and FRG-702 reader."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.config['xgs600'] = {'enabled': True, 'port': 'COM4'}
+        xgs = mock_xgs_cls.return_value
+        xgs.port, xgs.baudrate, xgs.timeout, xgs.address = 'COM4', 9600, 1.0, '00'
+        xgs.connect.return_value = True
+
+        self.assertTrue(app._connect_xgs600())
+        reader = app.frg702_reader
+        self.assertIsNotNone(reader)
+        self.assertTrue(app._connect_xgs600())
+
+        mock_xgs_cls.assert_called_once()
+        self.assertEqual(xgs.connect.call_count, 2)
+        self.assertIs(app.frg702_reader, reader)
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_deferred_init_skips_connect_when_xgs600_open_fails(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """A failed worker-thread open is not retried on the Tk thread."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.config['xgs600'] = {'enabled': True, 'port': 'COM4'}
+        app.connection = None
+        app._open_xgs600 = MagicMock(return_value=None)
+        app._connect_xgs600 = MagicMock()
+
+        app._deferred_hardware_init()
+
+        app._open_xgs600.assert_called_once_with()
+        app._connect_xgs600.assert_not_called()
+        self.assertTrue(app._hardware_init_attempted)
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_deferred_init_error_releases_port_without_waiting(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """On an init error the worker's port is closed once the open finishes."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.config['xgs600'] = {'enabled': True, 'port': 'COM4'}
+        app.connection = MagicMock()
+        app.connection.connect.side_effect = RuntimeError("USB error")
+        xgs = MagicMock()
+        release = threading.Event()
+
+        def slow_open():
+            release.wait(5)
+            return xgs
+        app._open_xgs600 = slow_open
+
+        app._deferred_hardware_init()
+        # Returned while the worker was still opening the port
+        xgs.disconnect.assert_not_called()
+
+        disconnected = threading.Event()
+        xgs.disconnect.side_effect = lambda: disconnected.set()
+        release.set()
+        self.assertTrue(disconnected.wait(5))
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_cut_power_schedules_current_step(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """Cut Power commands 0 V at once and defers 0 A to the Tk loop."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.ps_controller = MagicMock()
+        app.root = MagicMock()
+
+        app._cut_power_output()
+        app.ps_controller.set_voltage.assert_called_once_with(0.0)
+        app.ps_controller.set_current.assert_not_called()
+        app.root.after.assert_called_once_with(300, app._cut_power_current)
+
+        app._cut_power_current()
+        app.ps_controller.set_current.assert_called_once_with(0.0)
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_gui_tick_redraws_readout_once_per_frame(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """The sensor readout refreshes only when a new frame was published."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.is_running = True
+        app._update_sensor_readout = MagicMock()
+
+        frame = (0.0, {'TC1': 25.0}, {}, {})
+        app._latest_frame = frame
+        app._update_gui()
+        app._update_gui()
+        app._update_sensor_readout.assert_called_once_with(frame)
+
+        app._latest_frame = (0.1, {'TC1': 25.1}, {}, {})
+        app._update_gui()
+        self.assertEqual(app._update_sensor_readout.call_count, 2)
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_sensor_readout_updates_panel_in_one_batch(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """The readout converts TC values and hands the panel one array."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app._tc_names = {'TC1'}
+        app.t_unit_var = MagicMock(get=MagicMock(return_value='F'))
+        app.data_buffer = MagicMock()
+        app.data_buffer.get_all_current.return_value = {
+            'TC1': 100.0, 'FRG1': None, 'PS_Voltage': 3.0}
+
+        app._update_sensor_readout((0.0, {}, {}, {}))
+
+        names, values = app.sensor_panel.update_bulk.call_args[0]
+        self.assertEqual(names, ['TC1', 'FRG1', 'PS_Voltage'])
+        self.assertAlmostEqual(values[0], 212.0)
+        self.assertTrue(math.isnan(values[1]))
+        self.assertEqual(values[2], 3.0)
+
+    @patch('t8_daq_system.gui.main_window.tk.Tk')
+    @patch('t8_daq_system.gui.main_window.LivePlot')
+    @patch('t8_daq_system.gui.main_window.SensorPanel')
+    @patch('t8_daq_system.gui.main_window.AppSettings')
+    def test_plots_use_cached_enabled_names(
+            self, mock_settings_cls, mock_sensor_panel, mock_plot, mock_tk):
+        """Plot redraws use the enabled-name lists built on config change."""
+        mock_settings = self._make_mock_settings(mock_settings_cls)
+        app = MainWindow(settings=mock_settings)
+        app.config['thermocouples'] = [{'name': 'TC_A'},
+                                       {'name': 'TC_B', 'enabled': False}]
+        app.config['frg702_gauges'] = [{'name': 'FRG_A'}]
+        app._refresh_sensor_names()
+
+        mock_plot.return_value.update.reset_mock()
+        app._update_live_plots()
+        plotted = [c.args[0] for c in mock_plot.return_value.update.call_args_list]
+        self.assertEqual(plotted[:2], [['TC_A'], ['FRG_A']])
+        self.assertEqual(app._tc_names, {'TC_A', 'TC_B'})
+
 if __name__ == '__main__':
     unittest.main()
@@ -221,6 +221,30 @@ class TestLivePlotUpdateFromLoadedData(unittest.TestCase):
         # Empty data should not crash
         plot.update_from_loaded_data({'timestamps': []})
 
+    @patch('t8_daq_system.gui.live_plot.FigureCanvasTkAgg')
+    @patch('t8_daq_system.gui.live_plot.Figure')
+    def test_render_converts_units_after_filtering(self, mock_figure, mock_canvas):
+        """Display-unit conversion applies to the filtered points as one array."""
+        mock_ax = MagicMock()
+        mock_ax.plot.return_value = [MagicMock()]
+        mock_fig = MagicMock()
+        mock_fig.add_subplot.return_value = mock_ax
+        mock_figure.return_value = mock_fig
+        mock_canvas.return_value.get_tk_widget.return_value = MagicMock()
+
+        from t8_daq_system.gui.live_plot import LivePlot
+        plot = LivePlot(MagicMock(), MagicMock())
+        plot.set_units("°F")
+
+        now = datetime.now()
+        timestamps = [now - timedelta(seconds=2 - i) for i in range(3)]
+        plot._render(timestamps, {'TC_1': [0.0, None, 100.0]},
+                     data_units={'temp': 'C'})
+
+        times, vals = mock_ax.plot.call_args[0]
+        self.assertEqual(times, [timestamps[0], timestamps[2]])
+        self.assertEqual(list(vals), [32.0, 212.0])
+
 
 class TestLivePlotSliderMode(unittest.TestCase):
     """Test the dual-mode timeline slider (History % vs 2-min Window)."""
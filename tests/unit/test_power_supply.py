@@ -215,6 +215,16 @@ class TestKeysightAnalogController(unittest.TestCase):
         self.assertIn("WARNING", output)
         self.assertAlmostEqual(result, 187.2, places=4)
 
+    def test_current_warning_is_rate_limited(self):
+        """A persistently out-of-range current monitor warns once per interval."""
+        import io
+        from contextlib import redirect_stdout
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            self.controller._scale_current_monitor(-0.5)
+            self.controller._scale_current_monitor(-0.5)
+        self.assertEqual(buf.getvalue().count("WARNING"), 1)
+
     def test_get_voltage_no_warning_in_range(self):
         """Normal reading (2.5V → 3.0V) must not trigger a WARNING."""
         import io
@@ -296,15 +306,14 @@ class TestKeysightAnalogController(unittest.TestCase):
         """output_off() should retry if the pin read-back still shows output ON."""
         # Each attempt in output_off calls:
         # 1. _set_pin_output -> eReadName('FIO_DIRECTION')
-        # 2. output_off -> eReadName('FIO1') for readback print
-        # 3. is_output_on -> eReadName('FIO1')
-        # Total 3 reads per attempt.
+        # 2. output_off -> eReadName('FIO1') readback, which is also the check
+        # Total 2 reads per attempt.
         #
-        # Attempt 1 (EIO1=0): reads [0.0, 0.0, 0.0]
-        # Attempt 2 (EIO1=0): reads [0.0, 0.0, 0.0]
-        # Attempt 3 (EIO1=1): reads [0.0, 1.0, 1.0]
+        # Attempt 1 (EIO1=0): reads [0.0, 0.0]
+        # Attempt 2 (EIO1=0): reads [0.0, 0.0]
+        # Attempt 3 (EIO1=1): reads [0.0, 1.0]
         mock_ljm.reset_mock(return_value=True, side_effect=True)
-        mock_ljm.eReadName.side_effect = [0.0]*3 + [0.0]*3 + [0.0, 1.0, 1.0]
+        mock_ljm.eReadName.side_effect = [0.0]*2 + [0.0]*2 + [0.0, 1.0]
         result = self.controller.output_off()
         self.assertTrue(result)
         shutoff_writes = [c for c in mock_ljm.eWriteName.call_args_list
@@ -322,6 +331,50 @@ class TestKeysightAnalogController(unittest.TestCase):
         mock_ljm.eReadName.return_value = 1.0
         self.assertFalse(self.controller.is_output_on())
 
+    def test_setpoint_readback_cached_until_write(self):
+        """Repeated setpoint reads reuse the DAC readback until a new write."""
+        mock_ljm.reset_mock()
+        mock_ljm.eReadName.return_value = 2.5
+        self.controller.get_voltage_setpoint()
+        self.controller.get_voltage_setpoint()
+        self.assertEqual(mock_ljm.eReadName.call_count, 1)
+
+        self.controller.set_voltage(1.2)
+        mock_ljm.eReadName.reset_mock()
+        self.controller.get_voltage_setpoint()
+        mock_ljm.eReadName.assert_called_once_with(self.handle, 'DAC0')
+
+    def test_set_voltage_skips_readback_unless_debug(self):
+        """Setpoint writes are a single eWriteName; the readback is debug-only."""
+        mock_ljm.reset_mock()
+        self.assertTrue(self.controller.set_voltage(3.0))
+        self.assertTrue(self.controller.set_current(90.0))
+        mock_ljm.eReadName.assert_not_called()
+
+    def test_output_state_cache_cleared_by_output_off(self):
+        mock_ljm.eReadName.return_value = 0.0
+        self.assertTrue(self.controller.is_output_on())
+        mock_ljm.eReadName.return_value = 1.0
+        self.controller.output_off()
+        self.assertFalse(self.controller.is_output_on())
+
+    def test_is_output_on_reads_pin_after_output_off(self):
+        """is_output_on() reports the Shut Off pin, not the last command."""
+        mock_ljm.eReadName.return_value = 1.0
+        self.controller.output_off()
+        self.controller.invalidate_cache()
+        # Pin released externally (front panel, reconnect) after the command
+        mock_ljm.eReadName.return_value = 0.0
+        self.assertTrue(self.controller.is_output_on())
+
+    def test_is_output_on_reuses_output_off_readback(self):
+        """The verified output_off() readback answers an immediate poll."""
+        mock_ljm.eReadName.return_value = 1.0
+        self.controller.output_off()
+        mock_ljm.eReadName.reset_mock()
+        self.assertFalse(self.controller.is_output_on())
+        mock_ljm.eReadName.assert_not_called()
+
     def test_is_output_on_returns_false_on_error(self):
         mock_ljm.eReadName.side_effect = Exception("read error")
         result = self.controller.is_output_on()
@@ -331,10 +384,27 @@ class TestKeysightAnalogController(unittest.TestCase):
     # ── Emergency shutdown ────────────────────────────────────────────────────
 
     def test_emergency_shutdown_zeros_dacs_and_asserts_shutoff(self):
-        """emergency_shutdown() must: assert FIO1=1, DAC0=0, DAC1=0."""
+        """emergency_shutdown() asserts FIO1=1 and zeros DAC0/DAC1 in one write."""
         mock_ljm.eReadName.return_value = 1.0  # FIO1 read-back confirms off
+        mock_ljm.eWriteName.reset_mock()
         result = self.controller.emergency_shutdown()
         self.assertTrue(result)
+        mock_ljm.eWriteNames.assert_called_with(
+            self.handle, 3, ['FIO1', 'DAC0', 'DAC1'], [1, 0.0, 0.0])
+        # Only the FIO_DIRECTION update goes through eWriteName
+        write_regs = [c[0][1] for c in mock_ljm.eWriteName.call_args_list]
+        self.assertEqual(write_regs, ['FIO_DIRECTION'])
+        self.assertTrue(self.controller.interlock_active)
+
+    def test_emergency_shutdown_falls_back_to_separate_writes(self):
+        """If the combined write fails, each step is written on its own."""
+        mock_ljm.eReadName.return_value = 1.0
+        mock_ljm.eWriteNames.side_effect = Exception("LJM error")
+        try:
+            result = self.controller.emergency_shutdown()
+        finally:
+            mock_ljm.eWriteNames.side_effect = None
+        self.assertTrue(result)
         write_calls = {(c[0][1], c[0][2]) for c in mock_ljm.eWriteName.call_args_list}
         self.assertIn(('FIO1', 1), write_calls)
         self.assertIn(('DAC0', 0.0), write_calls)
@@ -354,7 +424,7 @@ class TestKeysightAnalogController(unittest.TestCase):
     # ── get_readings / get_status ─────────────────────────────────────────────
 
     def test_get_readings_returns_expected_keys(self):
-        mock_ljm.eReadName.return_value = 5.0
+        mock_ljm.eReadNames.return_value = [5.0, 5.0, 0]
         readings = self.controller.get_readings()
         self.assertIn('PS_Voltage', readings)
         self.assertIn('PS_Current', readings)
@@ -362,17 +432,57 @@ class TestKeysightAnalogController(unittest.TestCase):
 
     def test_get_readings_voltage_value(self):
         """AIN4=5 V on 6.0 V supply → PS_Voltage=6.0 V (5V monitor range, full scale)."""
-        mock_ljm.eReadName.return_value = 5.0
+        mock_ljm.eReadNames.return_value = [5.0, 2.5, 0]
         readings = self.controller.get_readings()
         self.assertAlmostEqual(readings['PS_Voltage'], 6.0)
+        self.assertAlmostEqual(readings['PS_Current'], 90.0)
+        self.assertTrue(readings['PS_Output_On'])
+
+    def test_get_readings_single_batched_read(self):
+        """Both monitors and FIO1 are read in one eReadNames transaction."""
+        mock_ljm.reset_mock()
+        mock_ljm.eReadNames.return_value = [0.0, 0.0, 1]
+        readings = self.controller.get_readings()
+        mock_ljm.eReadNames.assert_called_once_with(
+            self.handle, 3, ['AIN4', 'AIN5', 'FIO1'])
+        mock_ljm.eReadName.assert_not_called()
+        self.assertFalse(readings['PS_Output_On'])
+
+    def test_get_readings_batch_failure(self):
+        mock_ljm.eReadNames.side_effect = mock_ljm.LJMError("timeout")
+        readings = self.controller.get_readings()
+        self.assertIsNone(readings['PS_Voltage'])
+        self.assertIsNone(readings['PS_Current'])
+        self.assertFalse(readings['PS_Output_On'])
 
     def test_get_status_contains_required_keys(self):
-        mock_ljm.eReadName.return_value = 0.0
+        mock_ljm.eReadNames.return_value = [0, 0.0, 0.0, 0.0, 0.0]
         status = self.controller.get_status()
         for key in ('output_on', 'voltage_setpoint', 'current_setpoint',
                     'voltage_actual', 'current_actual', 'errors', 'in_current_limit'):
             self.assertIn(key, status)
 
+    def test_get_status_single_batched_read(self):
+        """Shut-off pin, DAC setpoints and monitors come from one eReadNames."""
+        mock_ljm.reset_mock()
+        mock_ljm.eReadNames.return_value = [0, 2.5, 2.5, 5.0, 2.5]
+        status = self.controller.get_status()
+        mock_ljm.eReadNames.assert_called_once_with(
+            self.handle, 5, ['FIO1', 'DAC0', 'DAC1', 'AIN4', 'AIN5'])
+        mock_ljm.eReadName.assert_not_called()
+        self.assertTrue(status['output_on'])
+        self.assertAlmostEqual(status['voltage_setpoint'], 3.0)
+        self.assertAlmostEqual(status['current_setpoint'], 90.0)
+        self.assertAlmostEqual(status['voltage_actual'], 6.0)
+        self.assertAlmostEqual(status['current_actual'], 90.0)
+
+    def test_get_status_batch_failure(self):
+        mock_ljm.eReadNames.side_effect = mock_ljm.LJMError("timeout")
+        status = self.controller.get_status()
+        self.assertFalse(status['output_on'])
+        self.assertIsNone(status['voltage_actual'])
+        self.assertIsNone(status['current_setpoint'])
+
     def test_get_errors_always_empty(self):
         """No error queue on the analog interface."""
         self.assertEqual(self.controller.get_errors(), [])
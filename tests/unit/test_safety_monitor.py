@@ -437,6 +437,16 @@ class TestSafetyMonitorThreadSafety(unittest.TestCase):
         self.assertEqual(len(results), 500)
         self.assertTrue(all(results))
 
+    def test_status_getters_do_not_wait_for_lock(self):
+        """GUI-polled getters return while another thread holds the lock."""
+        monitor = SafetyMonitor()
+        with monitor._lock:
+            self.assertEqual(monitor.status, SafetyStatus.OK)
+            self.assertTrue(monitor.enabled)
+            self.assertFalse(monitor.is_rampdown_active)
+            self.assertFalse(monitor.is_restart_locked)
+            self.assertIsNone(monitor.get_last_event())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,142 @@
+"""
+Unit tests for SensorPanel - status summary and display update logic
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+# conftest.py handles mocking of tkinter, matplotlib, and hardware libs
+from t8_daq_system.gui.sensor_panel import SensorPanel
+from t8_daq_system.hardware.frg702_reader import STATUS_VALID, STATUS_OVERRANGE
+
+
+class TestSensorPanelSummary(unittest.TestCase):
+    """Test the shared status summary label and the display diff cache."""
+
+    def setUp(self):
+        patcher = patch('t8_daq_system.gui.sensor_panel.ttk')
+        mock_ttk = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Give every widget its own mock so per-label calls can be inspected
+        mock_ttk.Label.side_effect = lambda *a, **k: MagicMock()
+        mock_ttk.LabelFrame.side_effect = lambda *a, **k: MagicMock()
+
+        tcs = [
+            {'name': 'TC1', 'units': 'C', 'enabled': True},
+            {'name': 'TC2', 'units': 'C', 'enabled': True},
+        ]
+        gauges = [{'name': 'FRG702_Chamber', 'units': 'mbar', 'enabled': True}]
+        self.panel = SensorPanel(MagicMock(), tcs, gauges)
+
+    def _summary(self):
+        return self.panel.summary_label.config.call_args.kwargs['text']
+
+    def test_no_per_tile_status_labels(self):
+        """Tiles no longer carry their own status label."""
+        self.assertFalse(hasattr(self.panel, 'status_labels'))
+
+    def test_summary_counts_connected_and_errors(self):
+        """Summary shows OK and ERR counts after an update."""
+        self.panel.update({'TC1': 25.0, 'TC2': None, 'PS_Voltage': 1.0,
+                           'PS_Current': 0.5})
+        self.assertEqual(self._summary(), "3 OK · 1 ERR")
+        self.assertEqual(
+            self.panel.summary_label.config.call_args.kwargs['foreground'], 'red')
+
+    def test_summary_counts_warnings(self):
+        """Out-of-range gauges are tallied as warnings."""
+        self.panel.update({'TC1': 25.0, 'TC2': 26.0})
+        self.panel.update_frg702_status({
+            'FRG702_Chamber': {'pressure': None, 'status': STATUS_OVERRANGE},
+        })
+        self.assertEqual(self._summary(), "2 OK · 1 WARN")
+
+    def test_summary_not_reconfigured_when_unchanged(self):
+        """Summary label is only configured when its text changes."""
+        self.panel.update({'TC1': 25.0})
+        self.panel.update({'TC1': 26.0})
+        self.assertEqual(self.panel.summary_label.config.call_count, 1)
+
+    def test_value_label_skips_identical_updates(self):
+        """Unchanged value text does not trigger another Tk configure."""
+        label = self.panel.displays['TC1']
+        self.panel.update({'TC1': 25.0})
+        self.panel.update({'TC1': 25.001})
+        label.config.assert_called_once_with(text="25.00", foreground='black')
+
+    def test_frg702_valid_status(self):
+        """Valid FRG-702 readings display in scientific notation."""
+        self.panel.update_frg702_status({
+            'FRG702_Chamber': {'pressure': 1.5e-6, 'status': STATUS_VALID},
+        })
+        self.panel.displays['FRG702_Chamber'].config.assert_called_with(
+            text="1.50e-06", foreground='black')
+
+    def test_clear_all_resets_summary(self):
+        """clear_all returns every sensor to WAITING."""
+        self.panel.update({'TC1': 25.0})
+        self.panel.clear_all()
+        self.assertEqual(self._summary(), "WAITING")
+
+    def test_update_bulk_formats_values(self):
+        """update_bulk formats a NumPy batch and flags NaN as disconnected."""
+        self.panel.update_bulk(['TC1', 'TC2', 'PS_Voltage'],
+                               np.array([25.126, np.nan, 3.0]))
+        self.panel.displays['TC1'].config.assert_called_once_with(
+            text="25.13", foreground='black')
+        self.panel.displays['TC2'].config.assert_called_once_with(
+            text="---", foreground='gray')
+        self.panel.displays['PS_Voltage'].config.assert_called_once_with(
+            text="3.000 V", foreground='black')
+        self.assertEqual(self._summary(), "2 OK · 1 ERR")
+
+    def test_unknown_names_are_ignored(self):
+        """Readings for sensors not owned by the panel are skipped."""
+        self.panel.update({'NotAPanelSensor': 1.0, 'TC1': 25.0})
+        self.assertNotIn('NotAPanelSensor', self.panel._states)
+        self.assertEqual(self.panel.get_sensor_names(),
+                         ('TC1', 'TC2', 'FRG702_Chamber', 'PS_Voltage', 'PS_Current'))
+
+    def test_pressure_unit_only_reconfigures_on_change(self):
+        """Unit labels are only touched when the unit actually changes."""
+        label = self.panel.unit_labels['FRG702_Chamber']
+        self.panel.update_global_pressure_unit('mbar')
+        label.config.assert_not_called()
+        self.panel.update_global_pressure_unit('Torr')
+        self.panel.update_global_pressure_unit('Torr')
+        label.config.assert_called_once_with(text='Torr')
+
+    def test_reconfigure_reuses_tiles(self):
+        """reconfigure() relabels existing tiles instead of creating new ones."""
+        frames_before = set(map(id, self.panel.frames.values()))
+        self.panel.reconfigure([{'name': 'TC_A', 'units': 'C'}])
+
+        self.assertEqual(self.panel.get_sensor_names(),
+                         ('TC_A', 'PS_Voltage', 'PS_Current'))
+        self.assertTrue(set(map(id, self.panel.frames.values())) <= frames_before)
+        # Two of the original five tiles are now spare and hidden
+        self.assertEqual(len(self.panel._free_slots), 2)
+        for slot in self.panel._free_slots:
+            slot['frame'].grid_remove.assert_called()
+
+    def test_reconfigure_grows_when_needed(self):
+        """Extra sensors get freshly created tiles once the free list is empty."""
+        tcs = [{'name': f'TC{n}', 'units': 'C'} for n in range(1, 5)]
+        self.panel.reconfigure(tcs, [{'name': 'FRG702_Chamber'}])
+        self.assertEqual(len(self.panel._slots), 7)
+        self.assertEqual(self.panel._free_slots, [])
+        self.panel.update({'TC4': 30.0})
+        self.assertEqual(self._summary(), "1 OK")
+
+    def test_set_unit_single_gauge(self):
+        """set_unit updates one gauge label and ignores unknown names."""
+        self.panel.set_unit('FRG702_Chamber', 'Pa')
+        self.panel.set_unit('TC1', 'Pa')
+        self.panel.unit_labels['FRG702_Chamber'].config.assert_called_once_with(text='Pa')
+        self.assertNotIn('TC1', self.panel.unit_labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Unit tests for SettingsDialog helpers that do not need a live Tk window
+"""
+
+import importlib.util
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+# conftest.py handles mocking of tkinter, matplotlib, and hardware libs
+from t8_daq_system.gui import settings_dialog
+from t8_daq_system.gui.settings_dialog import (
+    _is_partial_float, _is_partial_int, _parse_geometry)
+from t8_daq_system.settings.app_settings import AppSettings, _DEFAULTS
+
+
+class TestSettingsDialogHelpers(unittest.TestCase):
+    """Test the module-level geometry and input-validation helpers."""
+
+    def test_parse_geometry(self):
+        """Tk geometry strings split into width, height, x and y."""
+        self.assertEqual(_parse_geometry("1200x800+35+20"), (1200, 800, 35, 20))
+
+    def test_parse_geometry_negative_offsets(self):
+        """Windows maximised on a secondary monitor report negative offsets."""
+        self.assertEqual(_parse_geometry("1920x1040+-8+-8"), (1920, 1040, -8, -8))
+
+    def test_partial_int_validation(self):
+        """Whole-number entries accept digits and a leading minus only."""
+        for text in ("", "-", "250", "-12"):
+            self.assertTrue(_is_partial_int(text), text)
+        for text in ("1.5", "12a", "1-", "1e3"):
+            self.assertFalse(_is_partial_int(text), text)
+
+    def test_partial_float_validation(self):
+        """Number entries accept every prefix of a float, exponents included."""
+        for text in ("", "-", ".", "1.", "-0.25", "1e", "1e-", "1e-06", "5E+2"):
+            self.assertTrue(_is_partial_float(text), text)
+        for text in ("abc", "1.2.3", "1e5e", "--1", "1,5"):
+            self.assertFalse(_is_partial_float(text), text)
+
+
+
+class TestSettingsDialogLayouts(unittest.TestCase):
+    """Test the declarative section layouts."""
+
+    def _all_rows(self):
+        sections = (settings_dialog._TC_SECTION, settings_dialog._FRG_SECTION,
+                    settings_dialog._PP_DEFAULTS_SECTION, settings_dialog._PID_SECTION,
+                    *settings_dialog._HARDWARE_SECTIONS)
+        for _heading, _title, rows in sections:
+            yield from rows
+        yield from settings_dialog._PS_PIN_ROWS
+
+    def test_rows_map_to_app_settings(self):
+        """Every row is bound to a persisted AppSettings field."""
+        for kind, label, attr, *_ in self._all_rows():
+            with self.subTest(label=label):
+                self.assertIn(kind, ('combo', 'entry', 'bool'))
+                self.assertIn(attr, _DEFAULTS)
+
+    def test_attributes_are_unique(self):
+        """No setting is bound to two rows."""
+        attrs = [row[2] for row in self._all_rows()]
+        self.assertEqual(len(attrs), len(set(attrs)))
+
+
+class _Var:
+    """Stand-in for a Tk variable: holds its value, registered by name."""
+    registry = {}
+
+    def __init__(self, master=None, value=None):
+        self._value = value
+        self._name = f"PY_VAR{len(self.registry)}"
+        self.registry[self._name] = self
+
+    def __str__(self):
+        return self._name
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+    def trace_add(self, mode, callback):
+        pass
+
+
+class _Toplevel:
+    def getvar(self, name):
+        return _Var.registry[name].get()
+
+
+def _load_dialog_class():
+    """Load settings_dialog against a stub tkinter so SettingsDialog is a real class.
+
+    With conftest's MagicMock tkinter, subclassing tk.Toplevel yields a mock
+    and the dialog's own methods cannot be called.
+    """
+    fake_tk = MagicMock()
+    fake_tk.Toplevel = _Toplevel
+    fake_tk.TclError = type('TclError', (Exception,), {})
+    fake_tk.StringVar = fake_tk.IntVar = fake_tk.DoubleVar = fake_tk.BooleanVar = _Var
+    spec = importlib.util.spec_from_file_location(
+        '_settings_dialog_under_test', settings_dialog.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {'tkinter': fake_tk, 'tkinter.ttk': fake_tk.ttk}):
+        spec.loader.exec_module(module)
+    return module.SettingsDialog
+
+
+class TestSettingsDialogReshow(unittest.TestCase):
+    """The dialog is kept between showings; state must not leak across them."""
+
+    def setUp(self):
+        cls = _load_dialog_class()
+        self.settings = AppSettings()
+        self.dlg = dlg = cls.__new__(cls)
+        dlg._settings = self.settings
+        dlg._vars = {attr: _Var(value=getattr(self.settings, attr))
+                     for attr, _cls in cls._FIELDS['sensors'] + cls._FIELDS['scales']}
+
+    def test_cancelled_name_edits_are_reset_on_show(self):
+        """Edit a TC name, cancel, re-show: the stored name is back."""
+        dlg = self.dlg
+        self.settings.tc_count = 2
+        self.settings.tc_names = 'Heater,Sample'
+        dlg._vars['tc_count'].set(2)
+        dlg._tc_type_combos, dlg._tc_pin_combos = [], []
+        dlg._tc_name_vars = [_Var(value='Heater'), _Var(value='Sample')]
+        dlg._tc_label_vars = [_Var(value='Heater:'), _Var(value='Sample:')]
+        dlg._built_tabs = [('sensors', (None, 'sensors', None, dlg._load_sensor_values, None))]
+        dlg._tab_builders = {}
+        dlg._notebook = MagicMock()
+        dlg.grab_release = dlg.withdraw = dlg._present = MagicMock()
+
+        dlg._tc_name_vars[0].set('Edited')
+        dlg._tc_label_vars[0].set('Edited:')
+        dlg._on_cancel()
+        dlg.show()
+
+        self.assertEqual([v.get() for v in dlg._tc_name_vars], ['Heater', 'Sample'])
+        self.assertEqual(dlg._tc_label_vars[0].get(), 'Heater:')
+
+    def _build_appearance(self, tab):
+        """Minimal _build_scales_tab: per-channel holders sized from the pending counts."""
+        dlg = self.dlg
+        n_tc, n_frg = dlg._pending_count('tc_count'), dlg._pending_count('frg_count')
+        dlg._tc_color_vars = ['#000000'] * n_tc
+        dlg._tc_color_btns = []
+        dlg._tc_style_combos = [_Var(value='solid') for _ in range(n_tc)]
+        dlg._tc_width_vars = [_Var(value='2') for _ in range(n_tc)]
+        dlg._press_name_vars = [_Var(value=f'G{i}') for i in range(n_frg)]
+        dlg._press_color_vars = ['#000000'] * n_frg
+        dlg._press_color_btns = []
+        dlg._press_style_combos = [_Var(value='solid') for _ in range(n_frg)]
+        dlg._press_width_vars = [_Var(value='2') for _ in range(n_frg)]
+        for attr in ('_ps_v_style_combo', '_ps_i_style_combo', '_ps_v_width_var',
+                     '_ps_i_width_var', '_pp_v_style_combo', '_pp_v_width_var'):
+            setattr(dlg, attr, _Var())
+        dlg._ps_v_color_var = dlg._ps_i_color_var = dlg._pp_v_color_var = '#000000'
+        for attr, _cls in dlg._FIELDS['scales']:
+            dlg._vars[attr] = _Var(value=getattr(self.settings, attr))
+
+    def test_count_change_keeps_unsaved_appearance_edits(self):
+        """Rebuilding the Appearance tab for a new TC count keeps earlier edits."""
+        dlg = self.dlg
+        dlg._tc_name_vars = []
+        self._build_appearance(None)
+        dlg._load_scales_values()
+        dlg._built_tabs = [('scales', (MagicMock(), 'scales', self._build_appearance,
+                                       dlg._load_scales_values, dlg._save_scales_values))]
+
+        dlg._tc_color_vars[0] = '#123456'
+        dlg._tc_style_combos[0].set('dashed')
+        dlg._press_name_vars[0].set('Chamber')
+        dlg._vars['temp_range_max'].set('1e')  # half-typed
+        dlg._vars['tc_count'].set(2)
+        dlg._rebuild_stale_appearance()
+
+        self.assertEqual(len(dlg._tc_style_combos), 2)
+        self.assertEqual(dlg._tc_color_vars[0], '#123456')
+        self.assertEqual([c.get() for c in dlg._tc_style_combos], ['dashed', 'solid'])
+        self.assertEqual(dlg._press_name_vars[0].get(), 'Chamber')
+        self.assertEqual(dlg._vars['temp_range_max'].get(), '1e')
+
+
+if __name__ == '__main__':
+    unittest.main()